@@ -6,87 +6,129 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/com
 import { Progress } from "@/components/ui/progress";
 import { Button } from "@/components/ui/button";
 import { Alert, AlertDescription } from "@/components/ui/alert";
+import { Badge } from "@/components/ui/badge";
 import { CheckCircle2, AlertCircle, Loader2, FileCheck } from "lucide-react";
 import { contractApi } from "@/lib/api";
-import { JobStatus } from "@/lib/types";
+import { ClauseAnalysis, JobStatus } from "@/lib/types";
 
 interface AnalysisProgressProps {
   jobId: string;
   contractName: string;
 }
 
+// Activity message shown for each pipeline stage event
+const STAGE_MESSAGES: Record<string, string> = {
+  queued: "Waiting for an analysis worker...",
+  started: "Parsing contract structure...",
+  parsed: "Retrieving relevant policies...",
+  policies_retrieved: "Analyzing clauses...",
+  analysis_complete: "Generating executive summary...",
+  summary: "Finalizing analysis...",
+  retrying: "Retrying analysis...",
+};
+
+const COMPLIANCE_BADGES: Record<string, "success" | "destructive" | "warning"> = {
+  Compliant: "success",
+  "Non-Compliant": "destructive",
+  "Needs Review": "warning",
+};
+
 export function AnalysisProgress({ jobId, contractName }: AnalysisProgressProps) {
   const router = useRouter();
   const [status, setStatus] = useState<JobStatus | null>(null);
   const [error, setError] = useState<string | null>(null);
   const [animatedProgress, setAnimatedProgress] = useState(0);
-  const [activityMessage, setActivityMessage] = useState("Initializing analysis...");
-
-  const activityMessages = [
-    "Parsing contract structure...",
-    "Extracting clauses...",
-    "Analyzing terms and conditions...",
-    "Checking policy compliance...",
-    "Reviewing liability clauses...",
-    "Assessing risk factors...",
-    "Generating recommendations...",
-    "Finalizing analysis...",
-  ];
-
-  // Smooth progress animation and activity messages while processing
-  useEffect(() => {
-    // Start animation if status is null (just loaded) or processing, and not completed/failed
-    const shouldAnimate =
-      (!status || status.status === "processing" || status.status === "pending") &&
-      animatedProgress < 95;
-
-    if (shouldAnimate) {
-      const progressInterval = setInterval(() => {
-        setAnimatedProgress((prev) => {
-          // Slow down as we approach 95%
-          const increment = prev < 50 ? 2 : prev < 80 ? 1 : 0.5;
-          const newProgress = Math.min(prev + increment, 95);
-
-          // Update activity message based on progress
-          const messageIndex = Math.floor((newProgress / 95) * (activityMessages.length - 1));
-          setActivityMessage(activityMessages[messageIndex]);
-
-          return newProgress;
-        });
-      }, 500);
-
-      return () => clearInterval(progressInterval);
-    } else if (status?.status === "completed") {
-      setAnimatedProgress(100);
-      setActivityMessage("Analysis complete!");
-    }
-  }, [status?.status, animatedProgress, activityMessages]);
+  const [activityMessage, setActivityMessage] = useState("Waiting for an analysis worker...");
+  // Clause findings streamed so far (from the status endpoint)
+  const [partialResults, setPartialResults] = useState<ClauseAnalysis[]>([]);
+  const [totalClauses, setTotalClauses] = useState<number | null>(null);
 
   useEffect(() => {
-    const pollInterval = setInterval(async () => {
-      try {
-        const jobStatus = await contractApi.getJobStatus(jobId);
-        setStatus(jobStatus);
-
-        if (jobStatus.status === "completed") {
-          clearInterval(pollInterval);
-          // Clear the saved analysis state since we're done
-          sessionStorage.removeItem("analysisState");
-          // Wait a moment then redirect to results
-          setTimeout(() => {
-            router.push(`/results/${jobId}`);
-          }, 2000);
-        } else if (jobStatus.status === "failed") {
-          clearInterval(pollInterval);
-          setError(jobStatus.message || "Analysis failed");
-        }
-      } catch (err) {
-        setError(err instanceof Error ? err.message : "Failed to check status");
-        clearInterval(pollInterval);
+    let pollInterval: ReturnType<typeof setInterval> | null = null;
+    let finished = false;
+
+    const showPartialResults = (jobStatus: JobStatus) => {
+      if (jobStatus.partial_results?.length) {
+        setPartialResults(jobStatus.partial_results);
+        setTotalClauses(jobStatus.total_clauses ?? null);
       }
-    }, 2000); // Poll every 2 seconds
+    };
 
-    return () => clearInterval(pollInterval);
+    const finish = (jobStatus: JobStatus) => {
+      setStatus(jobStatus);
+      if (jobStatus.status === "completed") {
+        finished = true;
+        setAnimatedProgress(100);
+        setActivityMessage("Analysis complete!");
+        // Clear the saved analysis state since we're done
+        sessionStorage.removeItem("analysisState");
+        // Wait a moment then redirect to results
+        setTimeout(() => {
+          router.push(`/results/${jobId}`);
+        }, 2000);
+      } else if (jobStatus.status === "failed") {
+        finished = true;
+        setError(jobStatus.message || "Analysis failed");
+      }
+    };
+
+    // Fallback when the event stream is unavailable
+    const startPolling = () => {
+      if (pollInterval || finished) return;
+      pollInterval = setInterval(async () => {
+        try {
+          const jobStatus = await contractApi.getJobStatus(jobId);
+          setAnimatedProgress((prev) => Math.max(prev, jobStatus.progress));
+          showPartialResults(jobStatus);
+          finish(jobStatus);
+          if (finished && pollInterval) clearInterval(pollInterval);
+        } catch (err) {
+          setError(err instanceof Error ? err.message : "Failed to check status");
+          if (pollInterval) clearInterval(pollInterval);
+        }
+      }, 2000); // Poll every 2 seconds
+    };
+
+    const unsubscribe = contractApi.subscribeToJobEvents(
+      jobId,
+      (event) => {
+        // A retry starts over from the beginning
+        setAnimatedProgress((prev) =>
+          event.event === "started" ? event.progress : Math.max(prev, event.progress)
+        );
+
+        if (event.event === "started") {
+          setPartialResults([]);
+        }
+
+        if (event.event === "chunk_analyzed") {
+          setActivityMessage(`Analyzing clauses (batch ${event.data.chunk} of ${event.data.chunks})...`);
+          // Events carry no findings; pick up the clauses analyzed so far
+          contractApi.getJobStatus(jobId).then(showPartialResults).catch(() => {});
+        } else if (STAGE_MESSAGES[event.event]) {
+          setActivityMessage(STAGE_MESSAGES[event.event]);
+        }
+
+        if (event.event === "completed") {
+          finish({ job_id: jobId, status: "completed", progress: 100 });
+        } else if (event.event === "failed") {
+          finish({
+            job_id: jobId,
+            status: "failed",
+            progress: 0,
+            message: (event.data.error as string) || "Analysis failed",
+          });
+        } else if (event.event !== "queued") {
+          setStatus({ job_id: jobId, status: "processing", progress: event.progress, stage: event.event });
+        }
+      },
+      startPolling
+    );
+
+    return () => {
+      unsubscribe();
+      if (pollInterval) clearInterval(pollInterval);
+    };
   }, [jobId, router]);
 
   const getStatusIcon = () => {
@@ -163,6 +205,33 @@ export function AnalysisProgress({ jobId, contractName }: AnalysisProgressProps)
           <Progress value={animatedProgress} className="h-2 transition-all duration-500" />
         </div>
 
+        {partialResults.length > 0 && status?.status !== "completed" && (
+          <div className="space-y-2">
+            <div className="flex justify-between text-sm">
+              <span className="text-gray-600">Findings so far</span>
+              <span className="font-medium text-gray-900">
+                {partialResults.length}
+                {totalClauses ? ` of ${totalClauses}` : ""} clauses
+              </span>
+            </div>
+            <ul className="max-h-64 overflow-y-auto divide-y rounded-md border">
+              {partialResults.map((clause) => (
+                <li
+                  key={clause.clause_number}
+                  className="flex items-center justify-between gap-3 px-3 py-2 text-sm"
+                >
+                  <span className="truncate text-gray-700">
+                    {clause.clause_number}. {clause.clause_type}
+                  </span>
+                  <Badge variant={COMPLIANCE_BADGES[clause.compliance_status] || "default"}>
+                    {clause.compliance_status}
+                  </Badge>
+                </li>
+              ))}
+            </ul>
+          </div>
+        )}
+
         {status?.status === "completed" && (
           <Alert className="bg-green-50 border-green-200">
             <CheckCircle2 className="h-4 w-4 text-green-600" />
@@ -3,6 +3,7 @@ import type {
   Policy,
   AnalysisResult,
   JobStatus,
+  JobProgressEvent,
   UploadResponse,
   ApiResponse,
   Negotiation,
@@ -253,6 +254,7 @@ export const policyApi = {
     ingestion_status: string;
     embeddings_count: number;
     message: string;
+    embedding_job_id?: string | null;
   }> {
     try {
       const response = await api.post(
@@ -321,6 +323,31 @@ export const contractApi = {
     }
   },
 
+  // Subscribe to pushed analysis progress events (Server-Sent Events)
+  subscribeToJobEvents(
+    jobId: string,
+    onEvent: (event: JobProgressEvent) => void,
+    onError?: () => void
+  ): () => void {
+    const source = new EventSource(`${API_URL}/api/contracts/${jobId}/events`, {
+      withCredentials: true,
+    });
+    source.onmessage = (message) => {
+      const event = JSON.parse(message.data) as JobProgressEvent;
+      onEvent(event);
+      if (event.event === "completed" || event.event === "failed") {
+        source.close();
+      }
+    };
+    source.onerror = () => {
+      // EventSource reconnects on its own while the stream is open
+      if (source.readyState === EventSource.CLOSED) {
+        onError?.();
+      }
+    };
+    return () => source.close();
+  },
+
   // Download analysis report
   async downloadReport(
     jobId: string,
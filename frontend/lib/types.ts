@@ -182,6 +182,33 @@ export interface JobStatus {
   progress: number;
   message?: string;
   result?: AnalysisResult;
+  // Present while processing: clause findings streamed so far
+  clauses_analyzed?: number;
+  total_clauses?: number;
+  partial_results?: ClauseAnalysis[];
+  // Latest pipeline stage event while processing
+  stage?: string;
+}
+
+// Pushed by /api/contracts/{job_id}/events
+export interface JobProgressEvent {
+  event:
+    | "queued"
+    | "started"
+    | "parsed"
+    | "policies_retrieved"
+    | "chunk_analyzed"
+    | "analysis_complete"
+    | "summary"
+    | "reports_queued"
+    | "report_rendered"
+    | "report_failed"
+    | "completed"
+    | "retrying"
+    | "failed";
+  progress: number;
+  data: Record<string, unknown>;
+  created_at?: string;
 }
 
 // Filter Types
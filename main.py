@@ -114,7 +114,8 @@ def analyze_contract(contract_path: str, output_path: str = None):
     # Analyze
     results = analyzer.analyze_contract(
         contract_path=str(contract_file),
-        output_path=str(output_path)
+        output_path=str(output_path),
+        wait_for_reports=True
     )
 
     # Print summary
@@ -8,8 +8,8 @@ allowing you to package the pre-built database in your Docker image.
 Usage:
     python scripts/build_regional_db.py
 
-    # Custom batch size and delay (for rate limiting)
-    python scripts/build_regional_db.py --batch-size 25 --delay 2.0
+    # Custom batch size and quota (for rate limiting)
+    python scripts/build_regional_db.py --batch-size 25 --rpm 100 --tpm 30000
 
 After running:
     - ChromaDB data is saved to ./chroma_db/
@@ -18,13 +18,13 @@ After running:
 
 Rate Limiting:
     - Gemini embedding API has rate limits (1500 RPM for free tier)
-    - This script uses batching and exponential backoff to handle limits
-    - Adjust --batch-size and --delay if you hit rate limits
+    - Batches run concurrently under RPM/TPM token buckets, so the build
+      runs at the quota ceiling and backs off automatically on 429s
+    - Set --rpm/--tpm to your tier's limits
 """
 
 import sys
 import logging
-import time
 import argparse
 from pathlib import Path
 
@@ -41,13 +41,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def build_regional_databases(batch_size: int = None, delay: float = None):
+def build_regional_databases(
+    batch_size: int = None,
+    requests_per_minute: int = None,
+    tokens_per_minute: int = None,
+    concurrency: int = None
+):
     """
     Pre-build all regional knowledge bases.
 
     Args:
         batch_size: Number of chunks to embed per batch (default: from settings)
-        delay: Delay in seconds between batches (default: from settings)
+        requests_per_minute: Embedding API RPM limit (default: from settings)
+        tokens_per_minute: Embedding API TPM limit (default: from settings)
+        concurrency: Embedding batches in flight at once (default: from settings)
     """
     logger.info("=" * 80)
     logger.info("🔨 Building Regional Knowledge Bases")
@@ -56,16 +63,20 @@ def build_regional_databases(batch_size: int = None, delay: float = None):
     # Override settings with command line arguments if provided
     if batch_size is not None:
         settings.embedding_batch_size = batch_size
-    if delay is not None:
-        settings.embedding_delay_seconds = delay
+    if requests_per_minute is not None:
+        settings.embedding_requests_per_minute = requests_per_minute
+    if tokens_per_minute is not None:
+        settings.embedding_tokens_per_minute = tokens_per_minute
+    if concurrency is not None:
+        settings.embedding_max_concurrency = concurrency
 
     # Display rate limiting configuration
     logger.info(f"⚙️  Rate Limiting Configuration:")
     logger.info(f"   - Batch size: {settings.embedding_batch_size} chunks per batch")
-    logger.info(f"   - Delay: {settings.embedding_delay_seconds}s between batches")
     logger.info(f"   - Max RPM: {settings.embedding_requests_per_minute}")
-    logger.info(f"   - Retry attempts: 5 (with exponential backoff)")
-    logger.info(f"   - Estimated time for 300 chunks: ~{(300 / settings.embedding_batch_size) * settings.embedding_delay_seconds:.1f}s")
+    logger.info(f"   - Max TPM: {settings.embedding_tokens_per_minute:,}")
+    logger.info(f"   - Concurrent batches: {settings.embedding_max_concurrency}")
+    logger.info(f"   - Retry attempts: 6 (adaptive backoff on ResourceExhausted)")
     print()
 
     if not settings.regional_kb_enabled:
@@ -163,10 +174,22 @@ if __name__ == "__main__":
         help=f"Number of chunks per batch (default: {settings.embedding_batch_size})"
     )
     parser.add_argument(
-        "--delay",
-        type=float,
+        "--rpm",
+        type=int,
+        default=None,
+        help=f"Embedding requests per minute (default: {settings.embedding_requests_per_minute})"
+    )
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        default=None,
+        help=f"Embedding tokens per minute (default: {settings.embedding_tokens_per_minute})"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
         default=None,
-        help=f"Delay in seconds between batches (default: {settings.embedding_delay_seconds})"
+        help=f"Embedding batches in flight (default: {settings.embedding_max_concurrency})"
     )
 
     args = parser.parse_args()
@@ -174,7 +197,9 @@ if __name__ == "__main__":
     try:
         build_regional_databases(
             batch_size=args.batch_size,
-            delay=args.delay
+            requests_per_minute=args.rpm,
+            tokens_per_minute=args.tpm,
+            concurrency=args.concurrency
         )
     except KeyboardInterrupt:
         logger.info("\n⚠️  Build interrupted by user")
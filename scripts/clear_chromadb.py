@@ -25,6 +25,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.vector_store.embeddings import PolicyEmbeddings
+from src.vector_store.registry import get_vector_registry
 from src.core.config import settings
 import chromadb
 from chromadb.config import Settings as ChromaSettings
@@ -59,6 +60,9 @@ def clear_all_collections():
     for collection in collections:
         logger.info(f"Deleting collection: {collection.name}")
         chroma_client.delete_collection(collection.name)
+        # Forget ingested files and invalidate cached retrievals
+        get_vector_registry().get_ingestion_manifest().forget_collection(collection.name)
+        get_vector_registry().bump_collection_generation(collection.name)
 
     logger.info("✅ All collections cleared successfully!")
 
@@ -109,6 +113,7 @@ def clear_company_policies(company_id: str):
 
     # Delete by IDs
     collection.delete(ids=results["ids"])
+    get_vector_registry().bump_collection_generation(collection.name)
 
     logger.info(f"✅ Cleared {len(results['ids'])} policy chunks for company {company_id}")
 
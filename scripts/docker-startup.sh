@@ -6,6 +6,7 @@ echo "=== AI Contract Assistant Startup ==="
 # Apply database schema migrations
 echo "📋 Checking database schema..."
 python scripts/apply_schema_migrations.py || echo "⚠ Migration check skipped"
+python -m src.database.migrations.move_results_to_store || echo "⚠ Result store migration skipped"
 echo ""
 
 # Check if ChromaDB directory exists and has collections
@@ -38,6 +39,10 @@ else
     fi
 fi
 
+echo ""
+echo "=== Starting Analysis Workers ==="
+python -m src.worker --processes ${ANALYSIS_WORKER_PROCESSES:-2} &
+
 echo ""
 echo "=== Starting FastAPI Server ==="
 exec python -m uvicorn src.api:app --host 0.0.0.0 --port ${API_PORT:-8000}
@@ -4,12 +4,16 @@ from .contract_analyzer import ContractAnalyzer
 from .policy_checker import PolicyChecker
 from .batch_contract_analyzer import BatchContractAnalyzer
 from .smart_policy_retriever import SmartPolicyRetriever
+from .policy_type_detector import PolicyTypeDetector
 from .rate_limit_handler import RateLimitHandler
+from .stage_graph import StageGraph
 
 __all__ = [
     "ContractAnalyzer",
     "PolicyChecker",
     "BatchContractAnalyzer",
     "SmartPolicyRetriever",
-    "RateLimitHandler"
+    "PolicyTypeDetector",
+    "RateLimitHandler",
+    "StageGraph"
 ]
@@ -2,15 +2,26 @@
 
 import logging
 import json
-from typing import List, Dict, Any, Optional
-from langchain_google_genai import ChatGoogleGenerativeAI, HarmBlockThreshold, HarmCategory
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Dict, Any, Optional, Set, Tuple
+from langchain_google_genai import HarmBlockThreshold, HarmCategory
 
 from ..core.config import settings
+from ..core.llm_quota import create_gemini_chat
 from .smart_policy_retriever import SmartPolicyRetriever
 from .rate_limit_handler import RateLimitHandler
+from .json_stream import JSONArrayStreamParser, salvage_array_items
+from .clause_cache import get_clause_cache
+from .token_stats import get_token_stats
 
 logger = logging.getLogger(__name__)
 
+# Called with (clause index within the analyzed list, merged clause result)
+ClauseCallback = Callable[[int, Dict[str, Any]], None]
+
+# Bump whenever the batch analysis prompt changes; it is part of the clause cache key
+PROMPT_VERSION = "batch-v1"
+
 # Safety settings to prevent over-blocking of legal content
 SAFETY_SETTINGS = {
     HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_ONLY_HIGH,
@@ -34,7 +45,7 @@ class BatchContractAnalyzer:
         # Use configured token limit for batch analysis (Gemini 2.0 Flash supports up to 65k)
         max_tokens = settings.max_output_tokens
 
-        self.llm = ChatGoogleGenerativeAI(
+        self.llm = create_gemini_chat(
             model=settings.gemini_model,
             google_api_key=settings.google_api_key,
             temperature=settings.temperature,
@@ -54,10 +65,43 @@ class BatchContractAnalyzer:
 
         logger.info(f"Initialized BatchContractAnalyzer{' for company: ' + company_id if company_id else ''}{' region: ' + region_code if region_code else ''}")
 
+    def prepare_policies(self, contract_text: str) -> Dict[str, Any]:
+        """
+        Detect policy types, retrieve the policies and format them for the prompt.
+
+        Only the contract preview is used, so this can run while the rest of
+        the document is still being parsed.
+
+        Args:
+            contract_text: Full contract text or preview
+
+        Returns:
+            Dictionary with policies_by_type and formatted_policies
+        """
+        logger.info("📥 Retrieving all relevant policies...")
+        policies_by_type = self.policy_retriever.get_all_relevant_policies_batch(
+            contract_text=contract_text
+        )
+
+        # Optimize policies for context window
+        policies_by_type = self.policy_retriever.optimize_policies_for_context_window(
+            policies_by_type,
+            max_tokens=500000  # Reserve 500k for policies
+        )
+
+        return {
+            "policies_by_type": policies_by_type,
+            "formatted_policies": self.policy_retriever.format_policies_for_batch_prompt(
+                policies_by_type
+            )
+        }
+
     def analyze_contract_batch(
         self,
         contract_text: str,
-        clauses: List[Dict[str, Any]]
+        clauses: List[Dict[str, Any]],
+        clause_callback: Optional[ClauseCallback] = None,
+        policies: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Analyze entire contract in a single batch operation.
@@ -70,6 +114,9 @@ class BatchContractAnalyzer:
         Args:
             contract_text: Full contract text
             clauses: List of extracted clause dictionaries
+            clause_callback: Optional callable(index, result) invoked as each
+                clause analysis arrives (streaming mode)
+            policies: Result of prepare_policies() if already retrieved
 
         Returns:
             Complete analysis results for all clauses
@@ -78,35 +125,33 @@ class BatchContractAnalyzer:
 
         try:
             # Step 1: Get all relevant policies in one operation
-            logger.info("📥 Retrieving all relevant policies...")
-            policies_by_type = self.policy_retriever.get_all_relevant_policies_batch(
-                contract_text=contract_text
-            )
-
-            # Optimize policies for context window
-            policies_by_type = self.policy_retriever.optimize_policies_for_context_window(
-                policies_by_type,
-                max_tokens=500000  # Reserve 500k for policies
-            )
-
-            # Format policies
-            formatted_policies = self.policy_retriever.format_policies_for_batch_prompt(
-                policies_by_type
-            )
-
-            # Step 2: Analyze all clauses in single API call
-            logger.info("🤖 Analyzing all clauses in batch...")
-            analysis_results = self._analyze_all_clauses_batch(
-                clauses=clauses,
-                formatted_policies=formatted_policies
-            )
+            if policies is None:
+                policies = self.prepare_policies(contract_text)
+            policies_by_type = policies["policies_by_type"]
+            formatted_policies = policies["formatted_policies"]
+
+            # Step 2: Serve cached clauses, analyze the rest in single API call
+            analysis_results, cache_keys = self._lookup_cached_clauses(clauses, clause_callback)
+            pending = [i for i, result in enumerate(analysis_results) if result is None]
+
+            if pending:
+                logger.info(f"🤖 Analyzing {len(pending)} clauses in batch...")
+                fresh_results = self._analyze_all_clauses_batch(
+                    clauses=[clauses[i] for i in pending],
+                    formatted_policies=formatted_policies,
+                    clause_callback=self._remap_callback(clause_callback, pending)
+                )
+                for i, result in zip(pending, fresh_results):
+                    analysis_results[i] = result
+                self._store_cached_clauses(clauses, analysis_results, cache_keys)
 
             logger.info(f"✅ Batch analysis complete: {len(analysis_results)} clauses analyzed")
 
             return {
                 "analysis_results": analysis_results,
                 "policies_retrieved": sum(len(p) for p in policies_by_type.values()),
-                "api_calls_used": 2  # 1 for policy detection, 1 for analysis
+                "api_calls_used": 2 if pending else 1,  # 1 for policy detection, 1 for analysis
+                "cached_clauses": len(clauses) - len(pending)
             }
 
         except Exception as e:
@@ -116,14 +161,26 @@ class BatchContractAnalyzer:
     def _analyze_all_clauses_batch(
         self,
         clauses: List[Dict[str, Any]],
-        formatted_policies: str
+        formatted_policies: str,
+        clause_callback: Optional[ClauseCallback] = None,
+        salvage_depth: int = 0
     ) -> List[Dict[str, Any]]:
         """
         Analyze all clauses in a single API call.
 
+        With settings.batch_streaming the response is streamed and each
+        clause is decoded and passed to clause_callback as soon as its JSON
+        object is complete.
+
+        A truncated response (MAX_TOKENS or unparseable JSON) is salvaged
+        when settings.batch_salvage_truncated is on: complete clause objects
+        are kept and only the missing clauses are re-requested.
+
         Args:
             clauses: List of clause dictionaries
             formatted_policies: Formatted policy text
+            clause_callback: Optional callable(index, result) for streamed clauses
+            salvage_depth: Follow-up level (0 for the original request)
 
         Returns:
             List of analysis results for each clause
@@ -134,20 +191,35 @@ class BatchContractAnalyzer:
             formatted_policies=formatted_policies
         )
 
+        # A retried request streams again from the first clause; report each
+        # clause only once
+        reported: Set[int] = set()
+
+        def report_once(index: int, result: Dict[str, Any]):
+            if index not in reported:
+                reported.add(index)
+                clause_callback(index, result)
+
         # Execute with rate limiting and retry
         def api_call():
             logger.info(f"📤 Prompt length: {len(batch_prompt)} characters")
             logger.info(f"📤 Analyzing {len(clauses)} clauses")
             logger.info(f"📤 Max output tokens: {settings.max_output_tokens}")
+            generation_config = {
+                "response_mime_type": "application/json",
+                "max_output_tokens": settings.max_output_tokens
+            }
             try:
-                result = self.llm.invoke(
-                    batch_prompt,
-                    generation_config={
-                        "response_mime_type": "application/json",
-                        "max_output_tokens": settings.max_output_tokens
-                    },
-                    timeout=180  # 3-minute timeout for large contracts
-                )
+                if settings.batch_streaming:
+                    result = self._stream_batch_response(
+                        batch_prompt, generation_config, clauses, report_once if clause_callback else None
+                    )
+                else:
+                    result = self.llm.invoke(
+                        batch_prompt,
+                        generation_config=generation_config,
+                        timeout=180  # 3-minute timeout for large contracts
+                    )
                 logger.info("✅ API call successful")
                 return result
             except TimeoutError as e:
@@ -207,6 +279,11 @@ class BatchContractAnalyzer:
                 error_msg += f"Token usage: {token_usage}\n"
             error_msg += f"SOLUTION: Increase MAX_OUTPUT_TOKENS or reduce batch size.\n"
             error_msg += f"Recommended: MAX_OUTPUT_TOKENS >= {len(clauses) * 400}"
+            if settings.batch_salvage_truncated:
+                logger.warning(error_msg)
+                return self._salvage_truncated_response(
+                    clauses, formatted_policies, str(response.content), clause_callback, salvage_depth
+                )
             logger.error(error_msg)
             raise ValueError(f"Response truncated - MAX_TOKENS limit reached. {error_msg}")
 
@@ -235,14 +312,14 @@ class BatchContractAnalyzer:
             result = json.loads(response.content)
             analyses = result.get("clauses", [])
 
+            if len(analyses) == len(clauses):
+                self._record_token_usage(clauses, analyses, response, batch_prompt)
+
             # Merge with original clause data
             enriched_results = []
             for i, clause in enumerate(clauses):
                 if i < len(analyses):
-                    enriched_result = {
-                        **clause,
-                        **analyses[i]
-                    }
+                    enriched_result = self._merge_clause_analysis(clause, analyses[i])
                 else:
                     # Fallback if analysis is missing
                     enriched_result = {
@@ -257,6 +334,12 @@ class BatchContractAnalyzer:
             return enriched_results
 
         except json.JSONDecodeError as e:
+            if settings.batch_salvage_truncated:
+                logger.warning(f"⚠️ JSON parsing failed ({e}) - salvaging complete clauses")
+                return self._salvage_truncated_response(
+                    clauses, formatted_policies, str(response.content), clause_callback, salvage_depth
+                )
+
             logger.error(f"❌ JSON PARSING FAILED: {e}")
             logger.error(f"Error details: {str(e)}")
             logger.error(f"Response content preview (first 1000 chars):\n{response.content[:1000]}")
@@ -272,6 +355,161 @@ class BatchContractAnalyzer:
 
             raise ValueError(error_msg) from e
 
+    def _record_token_usage(
+        self,
+        clauses: List[Dict[str, Any]],
+        analyses: List[Any],
+        response: Any,
+        batch_prompt: str
+    ):
+        """Feed a complete response's usage metadata into the token statistics."""
+        usage = getattr(response, "usage_metadata", None) or {}
+        raw_usage = (getattr(response, "response_metadata", None) or {}).get("usage_metadata") or {}
+
+        output_tokens = usage.get("output_tokens") or raw_usage.get("candidates_token_count") or 0
+        input_tokens = usage.get("input_tokens") or raw_usage.get("prompt_token_count") or 0
+        if not output_tokens:
+            return
+
+        get_token_stats().record_batch(
+            clauses,
+            analyses,
+            output_tokens=output_tokens,
+            prompt_chars=len(batch_prompt),
+            input_tokens=input_tokens
+        )
+
+    @staticmethod
+    def _merge_clause_analysis(clause: Dict[str, Any], analysis: Any) -> Dict[str, Any]:
+        """Merge one model analysis object into the original clause data."""
+        if not isinstance(analysis, dict):
+            analysis = {}
+        return {
+            **clause,
+            **analysis
+        }
+
+    def _salvage_truncated_response(
+        self,
+        clauses: List[Dict[str, Any]],
+        formatted_policies: str,
+        content: str,
+        clause_callback: Optional[ClauseCallback] = None,
+        salvage_depth: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Keep the complete clauses of a truncated response and re-request the rest.
+
+        Complete clause objects are matched to clauses by clause_id (falling
+        back to position). Missing clauses are reissued in smaller follow-up
+        calls sized to what the truncated response managed to fit, up to
+        settings.batch_salvage_max_depth levels deep.
+
+        Args:
+            clauses: Clauses in the truncated request
+            formatted_policies: Formatted policy text
+            content: Truncated response text
+            clause_callback: Optional callable(index, result) for recovered clauses
+            salvage_depth: Follow-up level of the truncated request
+
+        Returns:
+            Analysis results for every clause, in input order
+        """
+        analyses = [a for a in salvage_array_items(content, key="clauses") if isinstance(a, dict)]
+        by_id = {a["clause_id"]: a for a in analyses if a.get("clause_id")}
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(clauses)
+        for i, clause in enumerate(clauses):
+            analysis = by_id.get(clause.get("clause_id"))
+            if analysis is None and not by_id and i < len(analyses):
+                analysis = analyses[i]
+            if analysis is not None:
+                results[i] = self._merge_clause_analysis(clause, analysis)
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        logger.info(
+            f"🩹 Salvaged {len(clauses) - len(missing)}/{len(clauses)} clauses from truncated response; "
+            f"{len(missing)} to re-request"
+        )
+
+        if missing and salvage_depth < settings.batch_salvage_max_depth:
+            # Follow-ups carry as many clauses as fitted last time (half if none did)
+            fitted = len(clauses) - len(missing)
+            follow_up_size = max(1, min(fitted or len(missing) // 2, len(missing)))
+
+            for start in range(0, len(missing), follow_up_size):
+                indexes = missing[start:start + follow_up_size]
+                subset = [clauses[i] for i in indexes]
+                try:
+                    sub_results = self._analyze_all_clauses_batch(
+                        clauses=subset,
+                        formatted_policies=formatted_policies,
+                        clause_callback=self._remap_callback(clause_callback, indexes),
+                        salvage_depth=salvage_depth + 1
+                    )
+                except Exception as e:
+                    logger.warning(f"⚠️ Follow-up for {len(subset)} clauses failed: {e}")
+                    continue
+
+                for i, result in zip(indexes, sub_results):
+                    results[i] = result
+
+        return [
+            result if result is not None else {
+                **clause,
+                "compliant": None,
+                "error": "Analysis not returned for this clause (response truncated)",
+                "requires_human_review": True
+            }
+            for clause, result in zip(clauses, results)
+        ]
+
+    def _stream_batch_response(
+        self,
+        batch_prompt: str,
+        generation_config: Dict[str, Any],
+        clauses: List[Dict[str, Any]],
+        clause_callback: Optional[ClauseCallback] = None
+    ):
+        """
+        Stream the batch response, reporting clauses as they complete.
+
+        Args:
+            batch_prompt: Complete batch prompt
+            generation_config: Gemini generation config
+            clauses: Clauses in the prompt (to merge streamed analyses into)
+            clause_callback: Optional callable(index, result) per completed clause
+
+        Returns:
+            Aggregated message (content and response_metadata as with invoke())
+        """
+        parser = JSONArrayStreamParser(key="clauses")
+        response = None
+        emitted = 0
+
+        for chunk in self.llm.stream(
+            batch_prompt,
+            generation_config=generation_config,
+            timeout=180  # 3-minute timeout for large contracts
+        ):
+            response = chunk if response is None else response + chunk
+            if not isinstance(chunk.content, str):
+                continue
+
+            for analysis in parser.feed(chunk.content):
+                if clause_callback and emitted < len(clauses):
+                    try:
+                        clause_callback(emitted, self._merge_clause_analysis(clauses[emitted], analysis))
+                    except Exception as e:
+                        logger.warning(f"Clause progress callback failed: {e}")
+                emitted += 1
+
+        if response is None:
+            raise ValueError("Empty response from Gemini API")
+
+        logger.info(f"📡 Streamed {emitted}/{len(clauses)} clause analyses")
+        return response
+
     def _build_batch_analysis_prompt(
         self,
         clauses: List[Dict[str, Any]],
@@ -404,8 +642,8 @@ Begin analysis:
         clauses_text = self._format_clauses_for_prompt(clauses)
         total_text = formatted_policies + clauses_text
 
-        # Rough estimate: 4 chars per token
-        estimated_tokens = len(total_text) // 4
+        # Characters per token learned from previous responses (default 4)
+        estimated_tokens = get_token_stats().estimate_tokens(total_text)
 
         logger.info(f"Estimated prompt size: ~{estimated_tokens:,} tokens")
 
@@ -439,53 +677,255 @@ Begin analysis:
 
         return False
 
+    def _analyze_chunk(
+        self,
+        chunk: List[Dict[str, Any]],
+        formatted_policies: str,
+        chunk_num: int,
+        num_chunks: int,
+        clause_callback: Optional[ClauseCallback] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze one chunk, retrying only this chunk on failure.
+
+        Args:
+            chunk: Clauses in this chunk
+            formatted_policies: Formatted policy text
+            chunk_num: 1-based chunk number (for logging)
+            num_chunks: Total number of chunks
+            clause_callback: Optional callable(index within chunk, result)
+
+        Returns:
+            Analysis results for the chunk's clauses; if every attempt fails,
+            fallback entries flagged for human review
+        """
+        attempts = 1 + max(0, settings.batch_chunk_retry_attempts)
+        last_error: Optional[Exception] = None
+
+        for attempt in range(1, attempts + 1):
+            logger.info(
+                f"Processing chunk {chunk_num}/{num_chunks} ({len(chunk)} clauses)"
+                f"{f', attempt {attempt}/{attempts}' if attempt > 1 else ''}"
+            )
+            try:
+                return self._analyze_all_clauses_batch(
+                    clauses=chunk,
+                    formatted_policies=formatted_policies,
+                    clause_callback=clause_callback
+                )
+            except Exception as e:
+                last_error = e
+                logger.warning(f"⚠️ Chunk {chunk_num}/{num_chunks} failed (attempt {attempt}/{attempts}): {e}")
+
+        logger.error(f"❌ Chunk {chunk_num}/{num_chunks} failed after {attempts} attempts")
+        return [
+            {
+                **clause,
+                "compliant": None,
+                "error": f"Chunk analysis failed: {last_error}",
+                "requires_human_review": True,
+                "chunk_failed": True
+            }
+            for clause in chunk
+        ]
+
+    @staticmethod
+    def _remap_callback(
+        clause_callback: Optional[ClauseCallback],
+        indexes: List[int]
+    ) -> Optional[ClauseCallback]:
+        """Translate indexes within a subset of clauses back to the caller's indexes."""
+        if clause_callback is None:
+            return None
+        return lambda index, result: clause_callback(indexes[index], result)
+
+    def _lookup_cached_clauses(
+        self,
+        clauses: List[Dict[str, Any]],
+        clause_callback: Optional[ClauseCallback] = None
+    ) -> Tuple[List[Optional[Dict[str, Any]]], List[str]]:
+        """
+        Serve clause analyses from the persistent clause cache.
+
+        Entries are keyed on the clause text, the policy set identity (see
+        SmartPolicyRetriever.policy_set_fingerprint()), the model and the
+        prompt version, so the same clause hits across contracts.
+
+        Args:
+            clauses: Clauses to analyze
+            clause_callback: Optional callable(index, result), called for each hit
+
+        Returns:
+            Tuple of (results aligned with clauses, None for misses; cache keys)
+        """
+        cache = get_clause_cache()
+        if cache is None:
+            return [None] * len(clauses), []
+
+        policy_fingerprint = self.policy_retriever.policy_set_fingerprint()
+        keys = [
+            cache.make_key(clause.get("text", ""), policy_fingerprint, settings.gemini_model, PROMPT_VERSION)
+            for clause in clauses
+        ]
+        cached = cache.get_many(keys)
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for i, (clause, key) in enumerate(zip(clauses, keys)):
+            analysis = cached.get(key)
+            if analysis is None:
+                results.append(None)
+                continue
+            result = {**clause, **analysis, "from_cache": True}
+            results.append(result)
+            if clause_callback:
+                clause_callback(i, result)
+
+        if cached:
+            hits = sum(1 for result in results if result is not None)
+            logger.info(f"💾 Clause cache: {hits}/{len(clauses)} clauses served locally")
+        return results, keys
+
+    def _store_cached_clauses(
+        self,
+        clauses: List[Dict[str, Any]],
+        results: List[Dict[str, Any]],
+        keys: List[str]
+    ):
+        """
+        Save fresh, successful clause analyses to the clause cache.
+
+        Args:
+            clauses: Analyzed clauses
+            results: Merged results aligned with clauses
+            keys: Cache keys from _lookup_cached_clauses()
+        """
+        cache = get_clause_cache()
+        if cache is None or not keys:
+            return
+
+        entries = {}
+        for clause, result, key in zip(clauses, results, keys):
+            if result.get("from_cache") or result.get("error") or result.get("compliant") is None:
+                continue
+            # Keep only the model's fields; clause identity comes from the caller
+            entries[key] = {k: v for k, v in result.items() if k not in clause}
+        cache.put_many(entries, settings.gemini_model, PROMPT_VERSION)
+
+    def plan_chunks(self, clauses: List[Dict[str, Any]]) -> List[List[int]]:
+        """
+        Plan chunk boundaries from learned per-clause output token usage.
+
+        Args:
+            clauses: Clauses to analyze, in order
+
+        Returns:
+            Lists of clause indexes, one per request; a single list means
+            the clauses fit in one batch at the target truncation probability
+        """
+        return get_token_stats().plan_chunks(
+            clauses,
+            max_output_tokens=settings.max_output_tokens,
+            truncation_probability=settings.batch_truncation_probability
+        )
+
     def analyze_contract_chunked(
         self,
         contract_text: str,
         clauses: List[Dict[str, Any]],
-        chunk_size: int = 25
+        chunk_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        clause_callback: Optional[ClauseCallback] = None,
+        policies: Optional[Dict[str, Any]] = None,
+        chunk_callback: Optional[Callable[[int, int], None]] = None
     ) -> Dict[str, Any]:
         """
         Analyze contract in chunks if it's too large.
 
+        Chunks run concurrently (bounded by max_concurrency) and every call
+        is admitted through the shared LLM quota manager. Results are merged back in clause
+        order, and a failing chunk is retried on its own without affecting
+        the others.
+
         Args:
             contract_text: Full contract text
             clauses: List of clauses
-            chunk_size: Number of clauses per chunk
+            chunk_size: Fixed number of clauses per chunk (default: plan chunks
+                from learned token usage, see plan_chunks())
+            max_concurrency: Chunks in flight at once (default: settings.batch_chunk_concurrency)
+            clause_callback: Optional callable(index, result) with indexes
+                relative to the full clause list
+            policies: Result of prepare_policies() if already retrieved
+            chunk_callback: Optional callable(chunks done, total chunks)
+                invoked as each chunk finishes
 
         Returns:
             Combined analysis results
         """
-        logger.info(f"Chunking {len(clauses)} clauses into groups of {chunk_size}")
 
         # Get policies once
-        policies_by_type = self.policy_retriever.get_all_relevant_policies_batch(
-            contract_text=contract_text
-        )
-        formatted_policies = self.policy_retriever.format_policies_for_batch_prompt(
-            policies_by_type
-        )
-
-        # Process in chunks
-        all_results = []
-        num_chunks = (len(clauses) + chunk_size - 1) // chunk_size
-
-        for i in range(0, len(clauses), chunk_size):
-            chunk = clauses[i:i + chunk_size]
-            chunk_num = (i // chunk_size) + 1
-
-            logger.info(f"Processing chunk {chunk_num}/{num_chunks} ({len(chunk)} clauses)")
-
-            chunk_results = self._analyze_all_clauses_batch(
-                clauses=chunk,
-                formatted_policies=formatted_policies
+        if policies is None:
+            policies = self.prepare_policies(contract_text)
+        policies_by_type = policies["policies_by_type"]
+        formatted_policies = policies["formatted_policies"]
+
+        # Only clauses missing from the clause cache are chunked and sent
+        cached_results, cache_keys = self._lookup_cached_clauses(clauses, clause_callback)
+        pending = [i for i, result in enumerate(cached_results) if result is None]
+
+        if chunk_size:
+            logger.info(f"Chunking {len(pending)} clauses into groups of {chunk_size}")
+            chunk_indexes = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+        else:
+            planned = self.plan_chunks([clauses[i] for i in pending])
+            chunk_indexes = [[pending[i] for i in chunk] for chunk in planned]
+            logger.info(
+                f"Chunking {len(pending)} clauses into {len(chunk_indexes)} planned chunks "
+                f"(sizes: {[len(chunk) for chunk in chunk_indexes]})"
             )
+        chunks = [[clauses[i] for i in indexes] for indexes in chunk_indexes]
+        num_chunks = len(chunks)
+        concurrency = max_concurrency if max_concurrency is not None else settings.batch_chunk_concurrency
+        workers = max(1, min(concurrency, num_chunks))
+
+        logger.info(f"🚀 Analyzing {num_chunks} chunks with concurrency {workers}")
+
+        # Results are collected by chunk index so completion order does not matter
+        chunk_results: List[List[Dict[str, Any]]] = [[] for _ in chunks]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-chunk") as executor:
+            futures = {
+                executor.submit(
+                    self._analyze_chunk,
+                    chunk,
+                    formatted_policies,
+                    index + 1,
+                    num_chunks,
+                    self._remap_callback(clause_callback, chunk_indexes[index])
+                ): index
+                for index, chunk in enumerate(chunks)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                chunk_results[futures[future]] = future.result()
+                if chunk_callback:
+                    chunk_callback(done, num_chunks)
+
+        chunks_failed = sum(
+            1 for results in chunk_results
+            if results and all(result.get("chunk_failed") for result in results)
+        )
+        if num_chunks and chunks_failed == num_chunks:
+            raise ValueError(f"All {num_chunks} chunks failed: {chunk_results[0][0].get('error')}")
 
-            all_results.extend(chunk_results)
+        all_results = cached_results
+        for indexes, results in zip(chunk_indexes, chunk_results):
+            for i, result in zip(indexes, results):
+                all_results[i] = result
+        self._store_cached_clauses(clauses, all_results, cache_keys)
 
         return {
             "analysis_results": all_results,
             "policies_retrieved": sum(len(p) for p in policies_by_type.values()),
             "api_calls_used": num_chunks + 1,  # 1 for policies + chunks
-            "chunks_processed": num_chunks
+            "chunks_processed": num_chunks,
+            "chunks_failed": chunks_failed,
+            "cached_clauses": len(clauses) - len(pending)
         }
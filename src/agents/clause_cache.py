@@ -0,0 +1,219 @@
+"""Persistent cache of clause analyses keyed by clause text, policy set, model and prompt."""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_QUOTES = str.maketrans({"‘": "'", "’": "'", "“": '"', "”": '"'})
+_LEADING_NUMBERING = re.compile(r"^(?:(?:\d+(?:\.\d+)*\.?|\(?[a-z]{1,4}\)|[a-z]\.)\s+)+")
+
+
+def normalize_clause_text(text: str) -> str:
+    """
+    Normalise clause text so cosmetic differences share a cache entry.
+
+    Applies Unicode NFKC, straightens quotes, lowercases, drops leading
+    numbering such as "12.3", "(b)" or "iv)" and collapses whitespace.
+    """
+    text = unicodedata.normalize("NFKC", text).translate(_QUOTES).lower()
+    text = " ".join(text.split())
+    return _LEADING_NUMBERING.sub("", text).strip()
+
+
+def fingerprint_text(text: str) -> str:
+    """Return the SHA-256 hex digest of a string (e.g. a policy set identity)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ClauseAnalysisCache:
+    """
+    SQLite store of model analyses for individual clauses.
+
+    A key combines the normalised clause text hash, a fingerprint of the
+    policy set the clause was judged against, the model name and the
+    prompt version, so any change to policies, model or prompt misses
+    naturally. Only the model's analysis fields are stored; the caller
+    merges them back onto its own clause dict.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file for the cache
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.misses = 0
+
+        self._open_store(path)
+
+    def _open_store(self, path: str):
+        """Open (or create) the SQLite file."""
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS clause_analyses (
+                    cache_key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    prompt_version TEXT NOT NULL,
+                    analysis TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+            logger.info(f"Clause analysis cache at {path}")
+        except Exception as e:
+            logger.warning(f"Clause analysis cache disabled ({path}): {e}")
+            self._conn = None
+
+    @staticmethod
+    def make_key(clause_text: str, policy_fingerprint: str, model: str, prompt_version: str) -> str:
+        """
+        Build a cache key.
+
+        Args:
+            clause_text: Raw clause text (normalised here)
+            policy_fingerprint: Fingerprint of the policy set
+            model: Gemini model name
+            prompt_version: Version of the analysis prompt
+
+        Returns:
+            Hex digest identifying the analysis
+        """
+        clause_hash = fingerprint_text(normalize_clause_text(clause_text))
+        return fingerprint_text(f"{clause_hash}|{policy_fingerprint}|{model}|{prompt_version}")
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up several analyses at once.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Mapping of key to cached analysis for the keys that hit
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Dict[str, Any]] = {}
+        if self._conn is None or not keys:
+            return found
+
+        with self._lock:
+            try:
+                # Stay well below SQLite's bound-parameter limit
+                for start in range(0, len(keys), 500):
+                    batch = keys[start:start + 500]
+                    rows = self._conn.execute(
+                        f"SELECT cache_key, analysis FROM clause_analyses "
+                        f"WHERE cache_key IN ({','.join('?' * len(batch))})",
+                        batch
+                    ).fetchall()
+                    for cache_key, analysis in rows:
+                        found[cache_key] = json.loads(analysis)
+            except (sqlite3.Error, json.JSONDecodeError) as e:
+                logger.debug(f"Clause analysis cache read failed: {e}")
+
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, entries: Dict[str, Dict[str, Any]], model: str, prompt_version: str):
+        """
+        Store analyses.
+
+        Args:
+            entries: Mapping of cache key to analysis fields
+            model: Gemini model name
+            prompt_version: Version of the analysis prompt
+        """
+        if self._conn is None or not entries:
+            return
+
+        now = time.time()
+        rows = [
+            (cache_key, model, prompt_version, json.dumps(analysis), now)
+            for cache_key, analysis in entries.items()
+        ]
+        with self._lock:
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO clause_analyses "
+                    "(cache_key, model, prompt_version, analysis, created_at) VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"Clause analysis cache write failed: {e}")
+
+    def clear(self):
+        """Delete every cached analysis and reset counters."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM clause_analyses")
+                self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def close(self):
+        """Close the SQLite file."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hit-rate metrics.
+
+        Returns:
+            Dictionary with hits, misses and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "persistent": self._conn is not None
+        }
+
+
+# Global instance (lazy initialization)
+_clause_cache: Optional[ClauseAnalysisCache] = None
+_clause_cache_lock = threading.Lock()
+
+
+def get_clause_cache() -> Optional[ClauseAnalysisCache]:
+    """
+    Get the process-wide clause analysis cache.
+
+    Returns:
+        ClauseAnalysisCache, or None when caching is disabled
+    """
+    global _clause_cache
+    if not settings.clause_cache_enabled:
+        return None
+    if _clause_cache is None:
+        with _clause_cache_lock:
+            if _clause_cache is None:
+                _clause_cache = ClauseAnalysisCache(settings.clause_cache_path)
+    return _clause_cache
@@ -1,25 +1,30 @@
 """Contract analysis agent using Gemini and RAG."""
 
+import asyncio
+import concurrent.futures
 import logging
 import json
-from typing import List, Dict, Any, Optional
-from pathlib import Path
-from langchain_google_genai import ChatGoogleGenerativeAI
+from typing import Callable, List, Dict, Any, Optional
 
 from ..core.config import settings
+from ..core.llm_quota import create_gemini_chat
 from ..core.prompts import (
-    SYSTEM_PROMPT,
     CLAUSE_ANALYSIS_PROMPT,
     CONTRACT_SUMMARY_PROMPT
 )
 from ..document_processing import (
     DocxParser,
     ClauseExtractor,
-    DocxGenerator,
-    AnalysisReportGenerator
+    ClauseDeduplicator
+)
+from ..document_processing.report_renderer import (
+    artifact_paths,
+    get_report_renderer,
+    render_reviewed_document
 )
 from .policy_checker import PolicyChecker
 from .batch_contract_analyzer import BatchContractAnalyzer, SAFETY_SETTINGS
+from .stage_graph import StageGraph
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +41,7 @@ class ContractAnalyzer:
             company_id: Optional company ID for user-specific policy checking
             region_code: Optional region code for regional knowledge base (e.g., "dubai_uae")
         """
-        self.llm = ChatGoogleGenerativeAI(
+        self.llm = create_gemini_chat(
             model=settings.gemini_model,
             google_api_key=settings.google_api_key,
             temperature=settings.temperature,
@@ -45,6 +50,7 @@ class ContractAnalyzer:
         )
 
         self.clause_extractor = ClauseExtractor()
+        self.clause_deduplicator = ClauseDeduplicator(threshold=settings.clause_dedup_threshold)
         self.policy_checker = PolicyChecker(company_id=company_id, region_code=region_code)
         self.company_id = company_id
         self.region_code = region_code
@@ -61,7 +67,10 @@ class ContractAnalyzer:
     def analyze_contract(
         self,
         contract_path: str,
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        progress_callback: Optional[Callable[[int, Dict[str, Any], int], None]] = None,
+        wait_for_reports: bool = False,
+        event_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Analyze a complete contract document.
@@ -69,142 +78,120 @@ class ContractAnalyzer:
         Args:
             contract_path: Path to the contract document
             output_path: Path for the output reviewed document
+            progress_callback: Optional callable(clause index, clause result,
+                total clauses) invoked as each clause analysis becomes available
+            wait_for_reports: Render all report artifacts before returning
+                (otherwise they follow settings.report_rendering)
+            event_callback: Optional callable(event, data) receiving stage
+                progress events (parsed, policies_retrieved, chunk_analyzed,
+                analysis_complete, summary, reports_queued, report_rendered)
 
         Returns:
             Complete analysis results
         """
         logger.info(f"Starting contract analysis: {contract_path}")
 
-        try:
-            # 1. Parse the document
-            parser = DocxParser(contract_path)
-            doc_data = parser.extract_structured_content()
+        def emit(event: str, **data: Any):
+            if event_callback:
+                try:
+                    event_callback(event, data)
+                except Exception as e:
+                    logger.warning(f"Progress event {event} failed: {e}")
+
+        def on_stage_done(stage: str, result: Any):
+            if stage == "clauses":
+                emit("parsed", total_clauses=len(result["clauses"]), unique_clauses=len(result["analysis_clauses"]))
+            elif stage == "policies":
+                emit("policies_retrieved", policies=sum(len(p) for p in result["policies_by_type"].values()))
+            elif stage == "analysis":
+                emit("analysis_complete", clauses=len(result))
+            elif stage == "summary":
+                emit("summary", overall_risk=result.get("overall_risk_assessment"))
 
-            # 2. Extract clauses
-            clauses = self.clause_extractor.extract_clauses_from_paragraphs(
-                doc_data["paragraphs"]
-            )
-
-            logger.info(f"Extracted {len(clauses)} clauses for analysis")
-
-            # 3 & 4. Analyze clauses (batch or single-clause mode)
-            if self.batch_mode and len(clauses) > 0:
-                logger.info("🚀 Using BATCH MODE for analysis")
-
-                # Dynamic token estimation based on clause complexity
-                # Conservative estimate: 400-500 tokens per clause for complete analysis
-                avg_tokens_per_clause = 450
-                estimated_output_tokens = len(clauses) * avg_tokens_per_clause
-                max_safe_tokens = int(settings.max_output_tokens * 0.85)  # Use 85% of limit for safety
-
-                logger.info(f"Contract analysis estimation:")
-                logger.info(f"  - Clauses to analyze: {len(clauses)}")
-                logger.info(f"  - Estimated output tokens: ~{estimated_output_tokens:,}")
-                logger.info(f"  - Max safe tokens: {max_safe_tokens:,}")
-                logger.info(f"  - Configured limit: {settings.max_output_tokens:,}")
-
-                # Use chunked analysis if needed
-                if estimated_output_tokens > max_safe_tokens:
-                    # Calculate optimal chunk size to stay within token limits
-                    chunk_size = max(5, int(max_safe_tokens / avg_tokens_per_clause))
-                    num_chunks = (len(clauses) + chunk_size - 1) // chunk_size
-
-                    logger.warning(
-                        f"⚠️ Contract exceeds token limit for single batch analysis!"
-                    )
-                    logger.warning(
-                        f"  - Will split into {num_chunks} chunks of ~{chunk_size} clauses each"
-                    )
-                    logger.warning(
-                        f"  - Consider increasing MAX_OUTPUT_TOKENS to {estimated_output_tokens * 1.2:.0f} for single-pass analysis"
-                    )
-
-                    batch_result = self.batch_analyzer.analyze_contract_chunked(
-                        contract_text=doc_data["full_text"],
-                        clauses=clauses,
-                        chunk_size=chunk_size
-                    )
-                else:
-                    # Single batch analysis - fits within token limits
-                    logger.info(f"✅ Contract fits within token limits - using single batch")
-                    batch_result = self.batch_analyzer.analyze_contract_batch(
-                        contract_text=doc_data["full_text"],
-                        clauses=clauses
-                    )
-
-                analysis_results = batch_result["analysis_results"]
-                api_calls_used = batch_result.get("api_calls_used", 0)
-                chunks_processed = batch_result.get("chunks_processed", 1)
-
-                logger.info(
-                    f"✅ Batch analysis complete: {api_calls_used} API calls, "
-                    f"{chunks_processed} chunk(s) processed"
+        try:
+            # Independent stages overlap: policy retrieval only needs the text
+            # preview, and the HTML summary renders while the summary is generated
+            graph = StageGraph(name="analysis", on_stage_done=on_stage_done)
+            graph.add("document", lambda: DocxParser(contract_path))
+            graph.add("text", lambda document: document.extract_full_text(), after=["document"])
+            graph.add("parse", self._parse_stage, after=["document"])
+            graph.add("clauses", self._clause_stage, after=["parse"])
+            if self.batch_mode:
+                graph.add("policies", lambda text: self.batch_analyzer.prepare_policies(text), after=["text"])
+
+            async def analysis_stage(text: str, clauses: Dict[str, Any], policies: Optional[Dict[str, Any]] = None):
+                clause_callback = None
+                if progress_callback:
+                    # Fan each representative's result out to its whole group
+                    def clause_callback(index: int, result: Dict[str, Any]):
+                        groups = clauses["groups"]
+                        for member in (groups[index] if groups else [index]):
+                            progress_callback(
+                                member,
+                                ClauseDeduplicator.copy_result(result, clauses["clauses"][member]),
+                                len(clauses["clauses"])
+                            )
+                return await self._analysis_stage(
+                    text, clauses, policies, clause_callback,
+                    chunk_callback=lambda done, total: emit("chunk_analyzed", chunk=done, chunks=total)
                 )
 
-            else:
-                logger.info("⚙️ Using SINGLE-CLAUSE MODE for analysis")
-
-                # Traditional single-clause analysis
-                classified_clauses = self.clause_extractor.classify_all_clauses_sync(clauses)
-
-                analysis_results = []
-                for i, clause in enumerate(classified_clauses):
-                    logger.info(f"Analyzing clause {i+1}/{len(classified_clauses)}")
-                    result = self.analyze_single_clause(clause)
-                    analysis_results.append(result)
-
-            # 5. Generate contract summary
-            summary = self.generate_contract_summary(
-                contract_text=doc_data["full_text"],
-                analysis_results=analysis_results
+            graph.add(
+                "analysis",
+                analysis_stage,
+                after=["text", "clauses"] + (["policies"] if self.batch_mode else [])
+            )
+            graph.add(
+                "summary",
+                lambda text, analysis: self.generate_contract_summary(
+                    contract_text=text,
+                    analysis_results=analysis
+                ),
+                after=["text", "analysis"]
             )
 
-            # 6. Generate output documents if requested
-            if output_path:
-                # Generate tracked changes document
-                self.generate_review_document(
-                    original_doc_path=contract_path,
-                    analysis_results=analysis_results,
-                    summary=summary,
-                    output_path=output_path
-                )
-
-                # Generate detailed analysis report
-                report_path = output_path.replace('.docx', '_DETAILED_REPORT.docx')
-                html_report_path = output_path.replace('.docx', '_SUMMARY.html')
-
-                logger.info("📊 Generating detailed analysis report...")
-                report_generator = AnalysisReportGenerator()
-
-                report_generator.generate_detailed_report(
-                    analysis_results=analysis_results,
-                    summary=summary,
-                    contract_info=doc_data["properties"],
-                    output_path=report_path
-                )
-
-                report_generator.generate_changes_summary_html(
-                    analysis_results=analysis_results,
-                    output_path=html_report_path
-                )
+            def report_stage(report_types: List[str], parse: Dict[str, Any], analysis: List[Dict[str, Any]], summary=None):
+                if output_path:
+                    results = {
+                        "contract_info": parse["properties"],
+                        "summary": summary or {},
+                        "analysis_results": analysis
+                    }
+                    self._render_reports(report_types, contract_path, results, output_path, wait_for_reports, emit)
+
+            # The HTML summary needs only the clause results, not the executive summary
+            graph.add(
+                "html_report",
+                lambda parse, analysis: report_stage(["html"], parse, analysis),
+                after=["parse", "analysis"]
+            )
+            graph.add(
+                "reports",
+                lambda parse, analysis, summary: report_stage(["reviewed", "detailed"], parse, analysis, summary),
+                after=["parse", "analysis", "summary"]
+            )
 
-                logger.info(f"✅ Reports generated:\n   - Reviewed: {output_path}\n   - Detailed: {report_path}\n   - HTML: {html_report_path}")
+            stages = self._run_async(graph.run())
+            analysis_results = stages["analysis"]
 
+            paths = artifact_paths(output_path) if output_path else {}
             logger.info("Contract analysis complete")
 
             return {
-                "contract_info": doc_data["properties"],
-                "summary": summary,
+                "contract_info": stages["parse"]["properties"],
+                "summary": stages["summary"],
                 "analysis_results": analysis_results,
                 "statistics": {
                     "total_clauses": len(analysis_results),
                     "compliant": sum(1 for r in analysis_results if r.get("compliant")),
-                    "non_compliant": sum(1 for r in analysis_results if not r.get("compliant"))
+                    "non_compliant": sum(1 for r in analysis_results if r.get("compliant") is False),
+                    "needs_review": sum(1 for r in analysis_results if r.get("compliant") is None)
                 },
+                "stage_timings": graph.timings,
                 "output_files": {
                     "reviewed_contract": output_path if output_path else None,
-                    "detailed_report": report_path if output_path else None,
-                    "html_summary": html_report_path if output_path else None
+                    "detailed_report": paths.get("detailed"),
+                    "html_summary": paths.get("html")
                 }
             }
 
@@ -212,6 +199,178 @@ class ContractAnalyzer:
             logger.error(f"Error analyzing contract: {e}")
             raise
 
+    @staticmethod
+    def _parse_stage(document: DocxParser) -> Dict[str, Any]:
+        """Pipeline stage: extract the paragraphs and properties of the document."""
+        return {
+            "properties": document.get_document_properties(),
+            "paragraphs": document.extract_paragraphs()
+        }
+
+    def _clause_stage(self, parse: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Pipeline stage: extract clauses and collapse near-duplicates.
+
+        Returns:
+            Dictionary with clauses, analysis_clauses (one representative per
+            group) and groups (None when nothing was collapsed)
+        """
+        clauses = self.clause_extractor.extract_clauses_from_paragraphs(parse["paragraphs"])
+        logger.info(f"Extracted {len(clauses)} clauses for analysis")
+
+        # Collapse near-duplicate clauses; one representative per group is analyzed
+        groups = None
+        analysis_clauses = clauses
+        if settings.clause_dedup_enabled and len(clauses) > 1:
+            analysis_clauses, groups = self.clause_deduplicator.collapse(clauses)
+
+        return {"clauses": clauses, "analysis_clauses": analysis_clauses, "groups": groups}
+
+    async def _analysis_stage(
+        self,
+        text: str,
+        extracted: Dict[str, Any],
+        policies: Optional[Dict[str, Any]],
+        clause_callback: Optional[Callable[[int, Dict[str, Any]], None]],
+        chunk_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Pipeline stage: analyze the clauses (batch or single-clause mode).
+
+        Args:
+            text: Full contract text
+            extracted: Result of the clause stage
+            policies: Pre-retrieved policies (batch mode)
+            clause_callback: Optional callable(representative index, result)
+            chunk_callback: Optional callable(chunks done, total chunks)
+
+        Returns:
+            Analysis results aligned with all extracted clauses
+        """
+        analysis_clauses = extracted["analysis_clauses"]
+
+        if self.batch_mode and len(analysis_clauses) > 0:
+            logger.info("🚀 Using BATCH MODE for analysis")
+            analysis_results = await asyncio.to_thread(
+                self._analyze_batch, text, analysis_clauses, policies, clause_callback, chunk_callback
+            )
+        else:
+            logger.info("⚙️ Using SINGLE-CLAUSE MODE for analysis")
+
+            # Concurrent single-clause analysis (async Gemini calls)
+            analysis_results = await self.analyze_clauses_async(
+                analysis_clauses, clause_callback=clause_callback
+            )
+
+        if extracted["groups"]:
+            analysis_results = self.clause_deduplicator.expand(
+                analysis_results, extracted["clauses"], extracted["groups"]
+            )
+        return analysis_results
+
+    def _analyze_batch(
+        self,
+        contract_text: str,
+        clauses: List[Dict[str, Any]],
+        policies: Optional[Dict[str, Any]],
+        clause_callback: Optional[Callable[[int, Dict[str, Any]], None]],
+        chunk_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """Analyze clauses in one batch or in planned chunks."""
+        # Plan chunks from learned output token usage per clause
+        chunk_plan = self.batch_analyzer.plan_chunks(clauses)
+
+        logger.info(f"Contract analysis estimation:")
+        logger.info(f"  - Clauses to analyze: {len(clauses)}")
+        logger.info(f"  - Planned requests: {len(chunk_plan)}")
+        logger.info(f"  - Target truncation probability: {settings.batch_truncation_probability:.1%}")
+        logger.info(f"  - Configured limit: {settings.max_output_tokens:,}")
+
+        # Use chunked analysis if needed
+        if len(chunk_plan) > 1:
+            logger.warning(
+                f"⚠️ Contract exceeds token limit for single batch analysis!"
+            )
+            logger.warning(
+                f"  - Will split into {len(chunk_plan)} chunks of "
+                f"{min(len(c) for c in chunk_plan)}-{max(len(c) for c in chunk_plan)} clauses"
+            )
+
+            # Chunks are re-planned over the clauses not served from cache
+            batch_result = self.batch_analyzer.analyze_contract_chunked(
+                contract_text=contract_text,
+                clauses=clauses,
+                clause_callback=clause_callback,
+                policies=policies,
+                chunk_callback=chunk_callback
+            )
+        else:
+            # Single batch analysis - fits within token limits
+            logger.info(f"✅ Contract fits within token limits - using single batch")
+            batch_result = self.batch_analyzer.analyze_contract_batch(
+                contract_text=contract_text,
+                clauses=clauses,
+                clause_callback=clause_callback,
+                policies=policies
+            )
+            if chunk_callback:
+                chunk_callback(1, 1)
+
+        api_calls_used = batch_result.get("api_calls_used", 0)
+        chunks_processed = batch_result.get("chunks_processed", 1)
+
+        logger.info(
+            f"✅ Batch analysis complete: {api_calls_used} API calls, "
+            f"{chunks_processed} chunk(s) processed"
+        )
+        return batch_result["analysis_results"]
+
+    @staticmethod
+    def _render_reports(
+        report_types: List[str],
+        contract_path: str,
+        results: Dict[str, Any],
+        output_path: str,
+        wait_for_reports: bool,
+        emit: Optional[Callable[..., None]] = None
+    ):
+        """
+        Render report artifacts off the critical path (worker pool or on first download).
+
+        Args:
+            report_types: Report types to render
+            contract_path: Original contract
+            results: Analysis results (contract_info, summary, analysis_results)
+            output_path: Path of the reviewed contract
+            wait_for_reports: Wait for the renders instead of following
+                settings.report_rendering
+            emit: Optional callable(event, **data) for report progress events
+        """
+        if not wait_for_reports and settings.report_rendering != "background":
+            return
+
+        renderer = get_report_renderer()
+        if emit:
+            emit("reports_queued", report_types=report_types)
+
+        futures = []
+        for report_type in report_types:
+            future = renderer.submit(report_type, contract_path, results, output_path)
+            if emit:
+                def on_rendered(done, report_type=report_type):
+                    if done.exception() is None:
+                        emit("report_rendered", report_type=report_type)
+                    else:
+                        emit("report_failed", report_type=report_type, error=str(done.exception()))
+                future.add_done_callback(on_rendered)
+            futures.append(future)
+        if wait_for_reports:
+            for future in futures:
+                future.result()
+            logger.info(f"✅ Reports generated: {', '.join(report_types)}")
+        else:
+            logger.info(f"📊 Reports queued for background rendering: {', '.join(report_types)}")
+
     def analyze_single_clause(self, clause: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze a single contract clause.
@@ -233,38 +392,99 @@ class ContractAnalyzer:
                 use_multi_query=True
             )
 
-            # Format policies for the prompt
-            formatted = self.policy_checker.format_policies_for_analysis(retrieved_data)
-
             # Analyze with Gemini
-            prompt = CLAUSE_ANALYSIS_PROMPT.format(
-                clause_text=clause_text,
-                clause_type=clause_type,
-                relevant_policies=formatted["policies_text"],
-                relevant_laws=formatted["laws_text"]
-            )
-
             response = self.llm.invoke(
-                prompt,
+                self._build_clause_prompt(clause_text, clause_type, retrieved_data),
                 generation_config={"response_mime_type": "application/json"}
             )
 
-            analysis = json.loads(response.content)
+            return self._merge_clause_response(clause, response, retrieved_data)
 
-            # Merge with original clause data
-            result = {
+        except Exception as e:
+            logger.error(f"Error analyzing clause: {e}")
+            return {
                 **clause,
-                **analysis,
-                "retrieved_policies_count": len(retrieved_data["policies"]),
-                "retrieved_laws_count": len(retrieved_data["laws"])
+                "compliant": None,
+                "error": str(e),
+                "requires_human_review": True
             }
 
-            logger.debug(
-                f"Clause analysis complete: {analysis.get('clause_type')} - "
-                f"Compliant: {analysis.get('compliant')}"
+    def _build_clause_prompt(
+        self,
+        clause_text: str,
+        clause_type: str,
+        retrieved_data: Dict[str, Any]
+    ) -> str:
+        """Build the single-clause analysis prompt from retrieved policies."""
+        formatted = self.policy_checker.format_policies_for_analysis(retrieved_data)
+        return CLAUSE_ANALYSIS_PROMPT.format(
+            clause_text=clause_text,
+            clause_type=clause_type,
+            relevant_policies=formatted["policies_text"],
+            relevant_laws=formatted["laws_text"]
+        )
+
+    def _merge_clause_response(
+        self,
+        clause: Dict[str, Any],
+        response: Any,
+        retrieved_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Parse a single-clause response and merge it with the clause data."""
+        analysis = json.loads(response.content)
+
+        result = {
+            **clause,
+            **analysis,
+            "retrieved_policies_count": len(retrieved_data["policies"]),
+            "retrieved_laws_count": len(retrieved_data["laws"])
+        }
+
+        logger.debug(
+            f"Clause analysis complete: {analysis.get('clause_type')} - "
+            f"Compliant: {analysis.get('compliant')}"
+        )
+
+        return result
+
+    async def analyze_single_clause_async(self, clause: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Classify, retrieve and analyze one clause without blocking the event loop.
+
+        Classification (if the clause is not yet classified) and policy
+        retrieval run in parallel; retrieval only needs the clause text.
+
+        Args:
+            clause: Clause dictionary with text (classification optional)
+
+        Returns:
+            Analysis result (with classification added)
+        """
+        try:
+            clause_text = clause["text"]
+
+            retrieval = asyncio.to_thread(
+                self.policy_checker.retrieve_relevant_policies,
+                clause_text=clause_text,
+                clause_type=clause.get("classification", {}).get("clause_type", "general"),
+                use_multi_query=True
             )
+            if "classification" in clause:
+                retrieved_data = await retrieval
+            else:
+                classification, retrieved_data = await asyncio.gather(
+                    self.clause_extractor.classify_clause(clause_text),
+                    retrieval
+                )
+                clause = {**clause, "classification": classification}
 
-            return result
+            clause_type = clause["classification"].get("clause_type", "general")
+            response = await self.llm.ainvoke(
+                self._build_clause_prompt(clause_text, clause_type, retrieved_data),
+                generation_config={"response_mime_type": "application/json"}
+            )
+
+            return self._merge_clause_response(clause, response, retrieved_data)
 
         except Exception as e:
             logger.error(f"Error analyzing clause: {e}")
@@ -275,6 +495,53 @@ class ContractAnalyzer:
                 "requires_human_review": True
             }
 
+    async def analyze_clauses_async(
+        self,
+        clauses: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        clause_callback: Optional[Callable[[int, Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze clauses one per request, concurrently.
+
+        At most max_concurrency clauses are in flight; every Gemini call is
+        admitted through the shared LLM quota manager.
+
+        Args:
+            clauses: Extracted clauses
+            max_concurrency: Clauses in flight at once (default: settings.single_clause_concurrency)
+            clause_callback: Optional callable(index, result) as each clause completes
+
+        Returns:
+            Analysis results in clause order
+        """
+        concurrency = max_concurrency or settings.single_clause_concurrency
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        done = 0
+
+        async def run(index: int, clause: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal done
+            async with semaphore:
+                result = await self.analyze_single_clause_async(clause)
+            done += 1
+            logger.info(f"Analyzed clause {done}/{len(clauses)}")
+            if clause_callback:
+                clause_callback(index, result)
+            return result
+
+        return list(await asyncio.gather(*(run(i, clause) for i, clause in enumerate(clauses))))
+
+    @staticmethod
+    def _run_async(coro):
+        """Run a coroutine from synchronous code (on a helper thread if a loop is running)."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
     def generate_contract_summary(
         self,
         contract_text: str,
@@ -350,16 +617,7 @@ class ContractAnalyzer:
             output_path: Output path for reviewed document
         """
         try:
-            generator = DocxGenerator(original_doc_path)
-
-            # Add summary page
-            generator.add_summary_page(summary)
-
-            # Create review document with comments
-            generator.create_review_document(
-                analysis_results=analysis_results,
-                output_path=output_path
-            )
+            render_reviewed_document(original_doc_path, analysis_results, summary, output_path)
 
             logger.info(f"Generated review document: {output_path}")
 
@@ -396,3 +654,25 @@ class ContractAnalyzer:
         }
 
         return self.analyze_single_clause(clause)
+
+    async def analyze_clause_text_async(
+        self,
+        clause_text: str,
+        clause_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze a single clause text from async code (classification and
+        retrieval run in parallel when no type is given).
+
+        Args:
+            clause_text: The clause text
+            clause_type: Optional clause type (will be classified if not provided)
+
+        Returns:
+            Analysis result
+        """
+        clause = {"clause_id": "single_clause", "text": clause_text}
+        if clause_type:
+            clause["classification"] = {"clause_type": clause_type}
+
+        return await self.analyze_single_clause_async(clause)
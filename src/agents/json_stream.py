@@ -0,0 +1,137 @@
+"""Incremental decoding of JSON array elements from streamed model output."""
+
+import json
+import logging
+import re
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JSONArrayStreamParser:
+    """
+    Emit the elements of one JSON array as soon as each is complete.
+
+    Text is fed in arbitrary pieces (e.g. streamed LLM chunks). The parser
+    locates the array under `key` (or a bare top-level array), tracks string
+    and nesting state across feeds, and decodes every element the moment its
+    closing bracket arrives. Because only complete elements are decoded, it
+    also recovers the finished elements of a truncated response.
+    """
+
+    def __init__(self, key: str = "clauses"):
+        """
+        Initialize parser.
+
+        Args:
+            key: Object key holding the array to stream
+        """
+        self.key = key
+        self.text = ""
+        self.items: List[Any] = []
+        self.finished = False
+
+        self._key_pattern = re.compile(r'"' + re.escape(key) + r'"\s*:\s*\[')
+        self._pos: Optional[int] = None  # Scan position once inside the array
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._element_start: Optional[int] = None
+
+    def _find_array_start(self) -> Optional[int]:
+        """Return the index just past the opening bracket, if seen yet."""
+        match = self._key_pattern.search(self.text)
+        if match:
+            return match.end()
+
+        stripped = self.text.lstrip()
+        if stripped.startswith("```"):
+            # Tolerate a markdown code fence around the JSON
+            newline = stripped.find("\n")
+            if newline == -1:
+                return None
+            stripped = stripped[newline + 1:].lstrip()
+        if stripped.startswith("["):
+            return len(self.text) - len(stripped) + 1
+        return None
+
+    def feed(self, piece: str) -> List[Any]:
+        """
+        Consume more text.
+
+        Args:
+            piece: Next piece of the response
+
+        Returns:
+            Elements completed by this piece, in array order
+        """
+        self.text += piece
+        if self.finished:
+            return []
+
+        if self._pos is None:
+            self._pos = self._find_array_start()
+            if self._pos is None:
+                return []
+
+        completed = []
+        text = self.text
+        i = self._pos
+        while i < len(text):
+            char = text[i]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if self._depth == 0:
+                    self._element_start = i
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 0:
+                    # Closing bracket of the array itself
+                    self.finished = True
+                    i += 1
+                    break
+                self._depth -= 1
+                if self._depth == 0:
+                    element = self._decode(text[self._element_start:i + 1])
+                    if element is not None:
+                        completed.append(element)
+                    self._element_start = None
+
+            i += 1
+
+        self._pos = i
+        self.items.extend(completed)
+        return completed
+
+    def _decode(self, fragment: str) -> Any:
+        """Decode one element, skipping it if it is malformed."""
+        try:
+            return json.loads(fragment)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Skipping malformed array element in stream: {e}")
+            return None
+
+
+def salvage_array_items(text: str, key: str = "clauses") -> List[Any]:
+    """
+    Decode every complete element of a (possibly truncated) JSON array.
+
+    Args:
+        text: Full or truncated response text
+        key: Object key holding the array
+
+    Returns:
+        Complete elements, in array order
+    """
+    parser = JSONArrayStreamParser(key=key)
+    parser.feed(text)
+    return parser.items
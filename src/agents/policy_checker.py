@@ -3,9 +3,10 @@
 import logging
 import json
 from typing import List, Dict, Any
-from langchain_google_genai import ChatGoogleGenerativeAI, HarmBlockThreshold, HarmCategory
+from langchain_google_genai import HarmBlockThreshold, HarmCategory
 
 from ..core.config import settings
+from ..core.llm_quota import create_gemini_chat
 from ..core.prompts import POLICY_RETRIEVAL_QUERY_PROMPT
 from ..vector_store.retriever import PolicyRetriever
 
@@ -32,7 +33,7 @@ class PolicyChecker:
             region_code: Optional region code for regional knowledge base (e.g., "dubai_uae")
         """
         self.retriever = PolicyRetriever(company_id=company_id)
-        self.llm = ChatGoogleGenerativeAI(
+        self.llm = create_gemini_chat(
             model=settings.gemini_model,
             google_api_key=settings.google_api_key,
             temperature=settings.temperature,
@@ -0,0 +1,193 @@
+"""Local policy type detection using precomputed embedding centroids."""
+
+import logging
+import threading
+from typing import Any, Dict, List, Set, Tuple
+
+import numpy as np
+
+from ..core.config import settings
+from ..core.constants import CONTRACT_POLICY_TYPES
+from ..vector_store.retriever import PolicyRetriever
+
+logger = logging.getLogger(__name__)
+
+# (collection_name, embedding_model) -> (fingerprint, type ids, centroid matrix)
+_CENTROID_CACHE: Dict[Tuple[str, str], Tuple[Any, List[str], np.ndarray]] = {}
+_CENTROID_LOCK = threading.Lock()
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalise each row so dot products are cosine similarities."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class PolicyTypeDetector:
+    """
+    Pick relevant policy types for a contract without an LLM call.
+
+    Each policy type gets a centroid embedding: its seed description blended
+    with the tenant's nearest policy chunks. The contract preview is embedded
+    in overlapping windows and types are scored by cosine similarity against
+    the centroids in a single matrix product.
+    """
+
+    def __init__(
+        self,
+        retriever: PolicyRetriever,
+        window_chars: int = 1500,
+        window_overlap: int = 250,
+        max_windows: int = 12,
+        neighbours_per_type: int = 8
+    ):
+        """
+        Initialize detector.
+
+        Args:
+            retriever: PolicyRetriever bound to the tenant's collection
+            window_chars: Characters per contract window
+            window_overlap: Overlap between consecutive windows
+            max_windows: Maximum windows embedded per contract
+            neighbours_per_type: Policy chunks blended into each centroid
+        """
+        self.retriever = retriever
+        self.registry = retriever.registry
+        self.window_chars = window_chars
+        self.window_overlap = window_overlap
+        self.max_windows = max_windows
+        self.neighbours_per_type = neighbours_per_type
+
+    def _collection_fingerprint(self) -> Any:
+        """Return a value that changes whenever the collection contents change."""
+        return (
+            self.registry.collection_generation(self.retriever.collection_name),
+            self.retriever.collection.count()
+        )
+
+    def _compute_centroids(self) -> Tuple[List[str], np.ndarray]:
+        """Build the centroid matrix for the retriever's collection."""
+        type_ids = list(CONTRACT_POLICY_TYPES.keys())
+        seed_texts = [
+            f"{type_id.replace('_', ' ')}: {description}"
+            for type_id, description in CONTRACT_POLICY_TYPES.items()
+        ]
+        seeds = _normalize_rows(np.asarray(self.registry.embed_queries(seed_texts), dtype=np.float32))
+
+        if self.retriever.collection.count() == 0:
+            logger.info("Policy collection empty - using seed centroids only")
+            return type_ids, seeds
+
+        query_params = {
+            "query_embeddings": seeds.tolist(),
+            "n_results": self.neighbours_per_type,
+            "include": ["embeddings"]
+        }
+        where_clause = self.retriever._build_where_clause()
+        if where_clause:
+            query_params["where"] = where_clause
+
+        results = self.retriever.collection.query(**query_params)
+
+        centroids = seeds.copy()
+        for i, neighbour_embeddings in enumerate(results.get("embeddings") or []):
+            if neighbour_embeddings is None or len(neighbour_embeddings) == 0:
+                continue
+            neighbours = _normalize_rows(np.asarray(neighbour_embeddings, dtype=np.float32))
+            centroids[i] = 0.5 * seeds[i] + 0.5 * neighbours.mean(axis=0)
+
+        return type_ids, _normalize_rows(centroids)
+
+    def get_centroids(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Get the (cached) centroid matrix for the tenant's collection.
+
+        Returns:
+            Tuple of (type ids, normalised centroid matrix of shape [types, dim])
+        """
+        key = (self.retriever.collection_name, self.registry.embedding_model_name())
+        fingerprint = self._collection_fingerprint()
+
+        cached = _CENTROID_CACHE.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1], cached[2]
+
+        with _CENTROID_LOCK:
+            cached = _CENTROID_CACHE.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1], cached[2]
+
+            type_ids, centroids = self._compute_centroids()
+            _CENTROID_CACHE[key] = (fingerprint, type_ids, centroids)
+            logger.info(f"Computed {len(type_ids)} policy type centroids for {key[0]}")
+            return type_ids, centroids
+
+    def _windows(self, text: str) -> List[str]:
+        """Split text into overlapping windows, capped at max_windows."""
+        text = text.strip()
+        if not text:
+            return []
+
+        step = max(1, self.window_chars - self.window_overlap)
+        windows = [
+            text[start:start + self.window_chars]
+            for start in range(0, len(text), step)
+        ]
+        return windows[:self.max_windows]
+
+    def score_types(self, contract_text: str) -> Dict[str, float]:
+        """
+        Score every policy type against the contract text.
+
+        Args:
+            contract_text: Contract preview text
+
+        Returns:
+            Mapping of policy type to best window cosine similarity
+        """
+        windows = self._windows(contract_text)
+        if not windows:
+            return {}
+
+        type_ids, centroids = self.get_centroids()
+        window_embeddings = self.registry.get_embeddings().embed_documents(windows)
+        window_matrix = _normalize_rows(np.asarray(window_embeddings, dtype=np.float32))
+
+        # [windows, dim] @ [dim, types] -> [windows, types]; best window per type
+        similarities = window_matrix @ centroids.T
+        best = similarities.max(axis=0)
+
+        return {type_id: float(score) for type_id, score in zip(type_ids, best)}
+
+    def detect(self, contract_text: str) -> Set[str]:
+        """
+        Detect relevant policy types for a contract.
+
+        A type is selected when its score clears both the absolute floor and
+        a fraction of the best score; at least policy_type_min_types types
+        are always returned.
+
+        Args:
+            contract_text: Contract preview text
+
+        Returns:
+            Set of policy types needed
+        """
+        scores = self.score_types(contract_text)
+        if not scores:
+            return set()
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        best_score = ranked[0][1]
+        cutoff = max(
+            settings.policy_type_min_similarity,
+            best_score * settings.policy_type_relative_similarity
+        )
+
+        selected = {type_id for type_id, score in ranked if score >= cutoff}
+        for type_id, _ in ranked[:settings.policy_type_min_types]:
+            selected.add(type_id)
+
+        logger.debug(f"Policy type scores: {dict(ranked)}")
+        return selected
@@ -3,6 +3,7 @@
 import time
 import logging
 import re
+import threading
 from typing import Callable, Any, Optional
 from functools import wraps
 from google.api_core import exceptions as google_exceptions
@@ -157,8 +158,15 @@ class BatchRateLimiter:
         self.request_times = []
         self.daily_count = 0
         self.daily_reset_time = time.time() + 86400  # 24 hours
+        # Serialises callers so concurrent threads queue for request slots
+        self._lock = threading.Lock()
 
     def check_and_wait(self):
+        """Check rate limits and wait if necessary (thread-safe)."""
+        with self._lock:
+            self._check_and_wait()
+
+    def _check_and_wait(self):
         """Check rate limits and wait if necessary."""
         current_time = time.time()
 
@@ -191,6 +199,7 @@ class BatchRateLimiter:
             if wait_time > 0:
                 logger.info(f"⏳ RPM limit reached. Waiting {wait_time:.1f}s")
                 time.sleep(wait_time)
+                current_time = time.time()
 
         # Record this request
         self.request_times.append(current_time)
@@ -3,10 +3,15 @@
 import logging
 import json
 from typing import List, Dict, Any, Set
-from langchain_google_genai import ChatGoogleGenerativeAI, HarmBlockThreshold, HarmCategory
+from langchain_google_genai import HarmBlockThreshold, HarmCategory
 
 from ..core.config import settings
+from ..core.llm_quota import create_gemini_chat
+from ..core.constants import CONTRACT_POLICY_TYPES
 from ..vector_store.retriever import PolicyRetriever
+from .clause_cache import fingerprint_text
+from .policy_type_detector import PolicyTypeDetector
+from .token_stats import get_token_stats
 
 logger = logging.getLogger(__name__)
 
@@ -31,9 +36,10 @@ class SmartPolicyRetriever:
             region_code: Optional region code for regional policies
         """
         self.retriever = PolicyRetriever(company_id=company_id)
+        self.type_detector = PolicyTypeDetector(self.retriever)
         self.company_id = company_id
         self.region_code = region_code
-        self.llm = ChatGoogleGenerativeAI(
+        self.llm = create_gemini_chat(
             model=settings.gemini_model,
             google_api_key=settings.google_api_key,
             temperature=0.1,
@@ -48,6 +54,36 @@ class SmartPolicyRetriever:
         """
         Detect what types of policies are needed based on contract preview.
 
+        Args:
+            contract_preview: First ~5000 chars of contract
+
+        Uses embedding centroids by default; set policy_type_detection="llm"
+        to ask Gemini instead.
+
+        Returns:
+            Set of policy types needed
+        """
+        if settings.policy_type_detection == "llm":
+            return self._detect_policy_types_llm(contract_preview)
+
+        try:
+            policy_types = self.type_detector.detect(contract_preview[:5000])
+            if policy_types:
+                logger.info(f"Detected {len(policy_types)} policy types (local): {policy_types}")
+                return policy_types
+        except Exception as e:
+            logger.error(f"Error detecting policy types locally: {e}")
+
+        # Fallback: return all types
+        return set(CONTRACT_POLICY_TYPES)
+
+    def _detect_policy_types_llm(
+        self,
+        contract_preview: str
+    ) -> Set[str]:
+        """
+        Detect needed policy types with a Gemini call.
+
         Args:
             contract_preview: First ~5000 chars of contract
 
@@ -92,11 +128,7 @@ Return JSON with list of relevant policy types:
         except Exception as e:
             logger.error(f"Error detecting policy types: {e}")
             # Fallback: return all types
-            return {
-                "liability", "intellectual_property", "payment_terms",
-                "termination", "confidentiality", "warranty",
-                "dispute_resolution", "delivery", "data_protection", "compliance"
-            }
+            return set(CONTRACT_POLICY_TYPES)
 
     def get_all_relevant_policies_batch(
         self,
@@ -120,7 +152,7 @@ Return JSON with list of relevant policy types:
 
             logger.info(f"Retrieving policies for {len(policy_types)} types")
 
-            # Step 2: Retrieve policies for each type
+            # Map policy types to section metadata
             all_policies = {}
             policy_type_mapping = {
                 "liability": "Liability",
@@ -135,39 +167,37 @@ Return JSON with list of relevant policy types:
                 "compliance": "Compliance"
             }
 
-            for policy_type in policy_types:
-                section = policy_type_mapping.get(policy_type, "general")
-
-                try:
-                    # Create a general query for this type
-                    query = f"{policy_type.replace('_', ' ')} policy requirements standards"
-
-                    policies = self.retriever.retrieve_relevant_policies(
-                        query=query,
-                        n_results=n_results_per_type,
-                        filter_metadata={"section": section}
-                    )
-
-                    # If no results with filter, try without filter
-                    if not policies:
-                        policies = self.retriever.retrieve_relevant_policies(
-                            query=query,
-                            n_results=n_results_per_type
-                        )
-
-                    all_policies[policy_type] = policies
-                    logger.debug(f"Retrieved {len(policies)} policies for {policy_type}")
-
-                except Exception as e:
-                    logger.warning(f"Error retrieving policies for {policy_type}: {e}")
-                    all_policies[policy_type] = []
-
-            # Step 3: Also get general/catch-all policies
-            general_policies = self.retriever.retrieve_relevant_policies(
-                query=contract_preview[:2000],
-                n_results=5
+            # Steps 2 & 3: Per-type queries plus a general catch-all query, all
+            # embedded together and answered by a single vector search. Section
+            # filters are applied after retrieval, falling back to the unfiltered
+            # hits when a type has no section-tagged policies.
+            ordered_types = sorted(policy_types)
+            queries = [
+                f"{policy_type.replace('_', ' ')} policy requirements standards"
+                for policy_type in ordered_types
+            ]
+            filters = [
+                {"section": policy_type_mapping.get(policy_type, "general")}
+                for policy_type in ordered_types
+            ]
+            n_results = [n_results_per_type] * len(ordered_types)
+
+            queries.append(contract_preview[:2000])
+            filters.append(None)
+            n_results.append(5)
+
+            batch_results = self.retriever.retrieve_batch(
+                queries=queries,
+                n_results=n_results,
+                filters=filters,
+                fallback_unfiltered=True
             )
-            all_policies["general"] = general_policies
+
+            for policy_type, policies in zip(ordered_types, batch_results):
+                all_policies[policy_type] = policies
+                logger.debug(f"Retrieved {len(policies)} policies for {policy_type}")
+
+            all_policies["general"] = batch_results[-1]
 
             total_policies = sum(len(p) for p in all_policies.values())
             logger.info(f"Retrieved {total_policies} total policy documents")
@@ -178,6 +208,21 @@ Return JSON with list of relevant policy types:
             logger.error(f"Error in batch policy retrieval: {e}")
             return {}
 
+    def policy_set_fingerprint(self) -> str:
+        """
+        Identify the policy set contracts are judged against.
+
+        Stable across contracts (unlike the formatted policies, which carry
+        per-contract relevance scores and retrieval results) and changes
+        whenever the policy collection is written to.
+
+        Returns:
+            Fingerprint of collection name, write generation and region
+        """
+        collection_name = self.retriever.collection_name
+        generation = self.retriever.registry.collection_generation(collection_name)
+        return fingerprint_text(f"{collection_name}|{generation}|{self.region_code or ''}")
+
     def format_policies_for_batch_prompt(
         self,
         policies_by_type: Dict[str, List[Dict[str, Any]]]
@@ -256,8 +301,8 @@ Return JSON with list of relevant policy types:
         Returns:
             Approximate token count
         """
-        # Rough estimate: ~4 chars per token
-        return len(text) // 4
+        # Characters per token learned from previous responses (default 4)
+        return get_token_stats().estimate_tokens(text)
 
     def optimize_policies_for_context_window(
         self,
@@ -0,0 +1,105 @@
+"""Async stage-graph executor for the contract analysis pipeline."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StageGraph:
+    """
+    Run pipeline stages as a DAG, each as soon as its dependencies finish.
+
+    A stage receives the results of its dependencies as keyword arguments
+    named after them. Coroutine functions are awaited on the event loop;
+    plain functions run on worker threads (asyncio.to_thread), so blocking
+    parsing, retrieval and model calls of independent stages overlap. The
+    wall time of every stage is recorded in timings.
+    """
+
+    def __init__(self, name: str = "pipeline", on_stage_done: Optional[Callable[[str, Any], None]] = None):
+        """
+        Initialize an empty graph.
+
+        Args:
+            name: Name used in log messages
+            on_stage_done: Optional callable(stage name, result) invoked as
+                each stage finishes (errors in it are logged, not raised)
+        """
+        self.name = name
+        self.on_stage_done = on_stage_done
+        self._stages: Dict[str, Tuple[Callable[..., Any], Tuple[str, ...]]] = {}
+        self.timings: Dict[str, float] = {}
+
+    def add(self, name: str, func: Callable[..., Any], after: Iterable[str] = ()) -> "StageGraph":
+        """
+        Add a stage.
+
+        Dependencies must be added first, which keeps the graph acyclic.
+
+        Args:
+            name: Stage name (also the keyword its result is passed as)
+            func: Function or coroutine function computing the stage
+            after: Names of the stages whose results it needs
+
+        Returns:
+            The graph, for chaining
+        """
+        after = tuple(after)
+        if name in self._stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        missing = [dep for dep in after if dep not in self._stages]
+        if missing:
+            raise ValueError(f"Stage {name} depends on unknown stages: {missing}")
+
+        self._stages[name] = (func, after)
+        return self
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Execute all stages.
+
+        If a stage fails, the stages still pending are cancelled and the
+        exception is raised.
+
+        Returns:
+            Dictionary of stage name to result
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+        started = time.perf_counter()
+
+        async def run_stage(name: str, func: Callable[..., Any], after: Tuple[str, ...]) -> Any:
+            inputs = {dep: await tasks[dep] for dep in after}
+            stage_started = time.perf_counter()
+            if asyncio.iscoroutinefunction(func):
+                result = await func(**inputs)
+            else:
+                result = await asyncio.to_thread(func, **inputs)
+            self.timings[name] = round(time.perf_counter() - stage_started, 3)
+            logger.debug(f"⏱️ Stage {name} finished in {self.timings[name]:.2f}s")
+            if self.on_stage_done:
+                try:
+                    self.on_stage_done(name, result)
+                except Exception as e:
+                    logger.warning(f"Stage listener failed for {name}: {e}")
+            return result
+
+        for name, (func, after) in self._stages.items():
+            tasks[name] = asyncio.create_task(run_stage(name, func, after), name=f"{self.name}:{name}")
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        self.timings["total"] = round(time.perf_counter() - started, 3)
+        logger.info(
+            f"⏱️ {self.name} stage timings: "
+            + ", ".join(f"{name}={seconds:.2f}s" for name, seconds in self.timings.items())
+        )
+        return {name: task.result() for name, task in tasks.items()}
@@ -0,0 +1,283 @@
+"""Learned token usage statistics for planning batch analysis chunks."""
+
+import json
+import logging
+import math
+import sqlite3
+import threading
+from pathlib import Path
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper word-count bounds of the clause length buckets
+LENGTH_BUCKETS = (25, 50, 100, 200, 400)
+
+# Weight (in pseudo-samples) of the configured prior in every estimate
+PRIOR_WEIGHT = 5
+# Relative standard deviation assumed before any samples exist
+PRIOR_RELATIVE_SD = 0.35
+# Output tokens for the JSON wrapper around the clause list
+RESPONSE_OVERHEAD_TOKENS = 50
+DEFAULT_CHARS_PER_TOKEN = 4.0
+
+
+def length_bucket(text: str) -> int:
+    """Return the length bucket (index into LENGTH_BUCKETS, or past it) of a clause."""
+    words = len(text.split())
+    for index, bound in enumerate(LENGTH_BUCKETS):
+        if words <= bound:
+            return index
+    return len(LENGTH_BUCKETS)
+
+
+class TokenUsageStats:
+    """
+    Persist observed token usage and turn it into planning estimates.
+
+    Output tokens of every successful batch response are attributed to its
+    clauses in proportion to the size of each clause's JSON analysis and
+    accumulated per length bucket as count / sum / sum of squares (clauses
+    are only typed by the analysis itself, so planning cannot key on type). Prompt usage is accumulated as characters per token. The
+    SQLite file is updated with UPSERT increments, so several workers can
+    share it.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the store.
+
+        Args:
+            path: SQLite file for the statistics
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS clause_length_tokens (
+                    length_bucket INTEGER PRIMARY KEY,
+                    n INTEGER NOT NULL,
+                    total REAL NOT NULL,
+                    total_sq REAL NOT NULL
+                )
+                """
+            )
+            self._merge_typed_stats()
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS prompt_tokens (
+                    name TEXT PRIMARY KEY,
+                    chars INTEGER NOT NULL,
+                    tokens INTEGER NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+        except Exception as e:
+            logger.warning(f"Token usage statistics disabled ({path}): {e}")
+            self._conn = None
+
+    def _merge_typed_stats(self):
+        """Fold statistics from the old per-(bucket, clause type) table into per-bucket rows."""
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'clause_output_tokens'"
+        ).fetchone()
+        if not exists:
+            return
+        self._conn.execute(
+            """
+            INSERT INTO clause_length_tokens (length_bucket, n, total, total_sq)
+            SELECT length_bucket, SUM(n), SUM(total), SUM(total_sq)
+            FROM clause_output_tokens
+            WHERE true  -- lets SQLite parse the ON CONFLICT clause after a SELECT
+            GROUP BY length_bucket
+            ON CONFLICT (length_bucket) DO UPDATE SET
+                n = n + excluded.n, total = total + excluded.total, total_sq = total_sq + excluded.total_sq
+            """
+        )
+        self._conn.execute("DROP TABLE clause_output_tokens")
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record_batch(
+        self,
+        clauses: List[Dict[str, Any]],
+        analyses: List[Any],
+        output_tokens: int,
+        prompt_chars: int = 0,
+        input_tokens: int = 0
+    ):
+        """
+        Record the usage of one complete batch response.
+
+        Args:
+            clauses: Clauses sent in the batch
+            analyses: Analysis objects returned for them (same order)
+            output_tokens: Output tokens reported by the API
+            prompt_chars: Length of the prompt in characters
+            input_tokens: Input tokens reported by the API
+        """
+        if self._conn is None:
+            return
+
+        sizes = [len(json.dumps(analysis)) for analysis in analyses[:len(clauses)]]
+        total_size = sum(sizes)
+        rows = []
+        if output_tokens > 0 and total_size > 0:
+            clause_tokens = max(0, output_tokens - RESPONSE_OVERHEAD_TOKENS)
+            for clause, size in zip(clauses, sizes):
+                tokens = clause_tokens * size / total_size
+                rows.append((length_bucket(clause.get("text", "")), tokens, tokens * tokens))
+
+        with self._lock:
+            try:
+                self._conn.executemany(
+                    """
+                    INSERT INTO clause_length_tokens (length_bucket, n, total, total_sq)
+                    VALUES (?, 1, ?, ?)
+                    ON CONFLICT (length_bucket) DO UPDATE SET
+                        n = n + 1, total = total + excluded.total, total_sq = total_sq + excluded.total_sq
+                    """,
+                    rows
+                )
+                if prompt_chars > 0 and input_tokens > 0:
+                    self._conn.execute(
+                        """
+                        INSERT INTO prompt_tokens (name, chars, tokens) VALUES ('batch', ?, ?)
+                        ON CONFLICT (name) DO UPDATE SET
+                            chars = chars + excluded.chars, tokens = tokens + excluded.tokens
+                        """,
+                        (prompt_chars, input_tokens)
+                    )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"Token usage statistics write failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Estimates
+    # ------------------------------------------------------------------
+
+    def chars_per_token(self) -> float:
+        """Observed prompt characters per input token (default 4)."""
+        if self._conn is None:
+            return DEFAULT_CHARS_PER_TOKEN
+        with self._lock:
+            row = self._conn.execute("SELECT chars, tokens FROM prompt_tokens WHERE name = 'batch'").fetchone()
+        if not row or not row[1]:
+            return DEFAULT_CHARS_PER_TOKEN
+        return row[0] / row[1]
+
+    def estimate_tokens(self, text: str) -> int:
+        """Estimate the input tokens of a text from the observed ratio."""
+        return int(len(text) / self.chars_per_token())
+
+    def _bucket_totals(self) -> Dict[int, Tuple[int, float, float]]:
+        """Load (n, sum, sum of squares) per length bucket."""
+        if self._conn is None:
+            return {}
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT length_bucket, n, total, total_sq FROM clause_length_tokens"
+            ).fetchall()
+        return {bucket: (n, total, total_sq) for bucket, n, total, total_sq in rows}
+
+    @staticmethod
+    def _blend(n: int, total: float, total_sq: float, prior_mean: float) -> Tuple[float, float]:
+        """Combine observed moments with the prior; return (mean, variance)."""
+        prior_var = (prior_mean * PRIOR_RELATIVE_SD) ** 2
+        weight = n + PRIOR_WEIGHT
+        mean = (total + PRIOR_WEIGHT * prior_mean) / weight
+        second_moment = (total_sq + PRIOR_WEIGHT * (prior_var + prior_mean ** 2)) / weight
+        return mean, max(second_moment - mean ** 2, 1.0)
+
+    def clause_estimates(self, clauses: List[Dict[str, Any]]) -> List[Tuple[float, float]]:
+        """
+        Predict the output tokens of each clause.
+
+        Uses the statistics of the clause's length bucket, blended with
+        settings.default_output_tokens_per_clause.
+
+        Args:
+            clauses: Clauses to analyze
+
+        Returns:
+            (mean, variance) of the output tokens per clause
+        """
+        totals = self._bucket_totals()
+        prior = float(settings.default_output_tokens_per_clause)
+
+        estimates = []
+        for clause in clauses:
+            stats = totals.get(length_bucket(clause.get("text", "")), (0, 0.0, 0.0))
+            estimates.append(self._blend(*stats, prior_mean=prior))
+        return estimates
+
+    def plan_chunks(
+        self,
+        clauses: List[Dict[str, Any]],
+        max_output_tokens: int,
+        truncation_probability: float
+    ) -> List[List[int]]:
+        """
+        Split clauses into contiguous chunks that fit the output budget.
+
+        A chunk's output is modelled as the sum of independent per-clause
+        estimates (normal approximation); clauses are added while the
+        chunk's (1 - truncation_probability) quantile stays within budget.
+
+        Args:
+            clauses: Clauses to analyze, in order
+            max_output_tokens: Output token limit per request
+            truncation_probability: Acceptable chance that a chunk truncates
+
+        Returns:
+            Lists of clause indexes, one per chunk
+        """
+        z = NormalDist().inv_cdf(1.0 - min(max(truncation_probability, 1e-6), 0.5))
+        budget = max_output_tokens - RESPONSE_OVERHEAD_TOKENS
+
+        chunks: List[List[int]] = []
+        current: List[int] = []
+        mean_sum = var_sum = 0.0
+        for index, (mean, variance) in enumerate(self.clause_estimates(clauses)):
+            projected = mean_sum + mean + z * math.sqrt(var_sum + variance)
+            if current and projected > budget:
+                chunks.append(current)
+                current, mean_sum, var_sum = [], 0.0, 0.0
+            current.append(index)
+            mean_sum += mean
+            var_sum += variance
+        if current:
+            chunks.append(current)
+        return chunks
+
+
+# Global instance (lazy initialization)
+_token_stats: Optional[TokenUsageStats] = None
+_token_stats_lock = threading.Lock()
+
+
+def get_token_stats() -> TokenUsageStats:
+    """
+    Get the process-wide token usage statistics store.
+
+    Returns:
+        TokenUsageStats singleton instance
+    """
+    global _token_stats
+    if _token_stats is None:
+        with _token_stats_lock:
+            if _token_stats is None:
+                _token_stats = TokenUsageStats(settings.token_stats_path)
+    return _token_stats
@@ -4,6 +4,8 @@ import logging
 import os
 import uuid
 import io
+import gzip
+import base64
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -34,15 +36,21 @@ else:
 
 from .core.config import settings
 from .agents.contract_analyzer import ContractAnalyzer
+from .document_processing.report_renderer import artifact_paths, get_report_renderer
 from .vector_store.embeddings import PolicyEmbeddings
 from .vector_store.retriever import PolicyRetriever
 from .services.groq_service import groq_service
 from .services.auth_service import AuthService
 from .services.email_service import EmailService
 from .core.prompts import CHATBOT_PROMPT, CHATBOT_POLICY_SEARCH_PROMPT
-from langchain_google_genai import ChatGoogleGenerativeAI
-from .database import init_db, get_db, User as DBUser, Session as DBSession, AnalysisJob as DBAnalysisJob, Negotiation, NegotiationMessage, Document
-from sqlalchemy.orm import Session as DBSessionType
+from .core.llm_quota import QuotaExceededError, create_gemini_chat
+from .database import (
+    init_db, get_db, SessionLocal, User as DBUser, Session as DBSession, AnalysisJob as DBAnalysisJob,
+    AnalysisJobEvent, AnalysisStatusPayload, JobQueueItem, Negotiation, NegotiationMessage, Document
+)
+from .database.models import PolicyEmbeddingJob
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session as DBSessionType, defer
 from fastapi import Depends, WebSocket, WebSocketDisconnect
 from .services.negotiation_service import NegotiationService
 from .services.message_service import MessageService
@@ -51,6 +59,10 @@ from .services.document_service import DocumentService
 from .services.docx_parser_service import DocxParserService
 from .services.document_sync_service import document_sync_service
 from .services.collab_websocket_adapter import collab_ws_manager
+from .services.job_events import JobEventService, analysis_progress, event_progress, job_event_broker
+from .services.job_queue import JobQueue
+from .services.result_store import get_result_store, job_summary, load_job_results, save_job_results
+from .services.status_payload import StatusPayloadStore, etag_matches, format_clause_result
 
 # Configure logging
 logging.basicConfig(
@@ -206,6 +218,14 @@ async def startup_event():
     except Exception as e:
         logger.error(f"❌ Failed to start collaboration service: {e}", exc_info=True)
 
+    # Warm up shared embedding model and ChromaDB client
+    if settings.vector_registry_warmup:
+        try:
+            from .vector_store.registry import get_vector_registry
+            await asyncio.to_thread(get_vector_registry().warm_up)
+        except Exception as e:
+            logger.error(f"❌ Failed to warm up vector store registry: {e}", exc_info=True)
+
     # Ingest regional knowledge bases
     try:
         from .core.config import REGION_CONFIG, get_enabled_regions, settings as config_settings
@@ -269,6 +289,17 @@ async def shutdown_event():
     except Exception as e:
         logger.error(f"❌ Error stopping collaboration service: {e}")
 
+    try:
+        from .vector_store.registry import close_vector_registry
+        close_vector_registry()
+    except Exception as e:
+        logger.error(f"❌ Error closing vector store registry: {e}")
+
+    try:
+        get_report_renderer().shutdown()
+    except Exception as e:
+        logger.error(f"❌ Error stopping report renderer: {e}")
+
 
 # Helper function to get AuthService with database session
 def get_auth_service(db: DBSessionType = Depends(get_db)) -> AuthService:
@@ -325,10 +356,6 @@ def require_auth(
     return user
 
 
-# In-memory storage for backwards compatibility (will be fully migrated to database)
-analysis_jobs: Dict[str, Dict[str, Any]] = {}
-
-
 class ClauseAnalysisRequest(BaseModel):
     """Request model for single clause analysis."""
     clause_text: str
@@ -967,8 +994,155 @@ async def get_user_location(request: Request):
 
 # Policy Management Endpoints
 
+def _policy_section_payloads(policy, company_id: str) -> List[Dict[str, Any]]:
+    """
+    Snapshot a policy's sections as plain dicts for background embedding.
+
+    Taken while the DB session is still open so the worker never touches
+    detached ORM objects.
+    """
+    return [
+        {
+            "id": section.id,
+            "content": section.section_content,
+            "metadata": {
+                'policy_id': policy.id,
+                'policy_number': policy.policy_number or '',
+                'policy_title': policy.title,
+                'section_id': section.id,
+                'section_number': section.section_number or '',
+                'section_title': section.section_title or '',
+                'company_id': company_id,
+                'version': policy.version
+            }
+        }
+        for section in policy.sections
+    ]
+
+
+def queue_policy_embedding(
+    background_tasks: BackgroundTasks,
+    policy_id: str,
+    company_id: str,
+    sections: List[Dict[str, Any]],
+    replace_existing: bool = False
+) -> str:
+    """
+    Queue bulk embedding of a policy's sections off the request path.
+
+    Args:
+        background_tasks: FastAPI background task queue of the request
+        policy_id: Policy the sections belong to
+        company_id: Company whose collection receives the embeddings
+        sections: Dicts with "id", "content" and "metadata" keys
+        replace_existing: Delete the policy's existing embeddings first
+
+    Returns:
+        Embedding job ID (poll /api/policies/embedding-jobs/{job_id})
+    """
+    job_id = str(uuid.uuid4())
+    db = SessionLocal()
+    try:
+        db.add(PolicyEmbeddingJob(
+            job_id=job_id,
+            policy_id=policy_id,
+            company_id=company_id,
+            status="queued",
+            total_sections=len(sections)
+        ))
+        db.commit()
+    finally:
+        db.close()
+    background_tasks.add_task(
+        run_policy_embedding,
+        job_id,
+        policy_id,
+        company_id,
+        sections,
+        replace_existing
+    )
+    return job_id
+
+
+def _update_policy_embedding_job(job_id: str, **fields):
+    """Update a persisted policy embedding job (opens its own session)."""
+    db = SessionLocal()
+    try:
+        db.query(PolicyEmbeddingJob).filter(PolicyEmbeddingJob.job_id == job_id).update(fields)
+        db.commit()
+    except Exception as e:
+        logger.warning(f"Failed to update embedding job {job_id}: {e}")
+    finally:
+        db.close()
+
+
+def run_policy_embedding(
+    job_id: str,
+    policy_id: str,
+    company_id: str,
+    sections: List[Dict[str, Any]],
+    replace_existing: bool = False
+):
+    """
+    Background worker: embed a policy's sections in batches with one upsert.
+
+    Runs in the threadpool, so the blocking embedding calls never hold up
+    the event loop. Job state is persisted so any API process can report it.
+    """
+    _update_policy_embedding_job(job_id, status="processing")
+
+    def on_progress(done: int, total: int):
+        _update_policy_embedding_job(job_id, progress=int(done * 100 / total) if total else 100)
+
+    try:
+        embedded_count = PolicyEmbeddings().embed_policy_sections(
+            sections=sections,
+            company_id=company_id,
+            replace_policy_id=policy_id if replace_existing else None,
+            progress_callback=on_progress
+        )
+        _update_policy_embedding_job(
+            job_id,
+            status="completed",
+            embedded_sections=embedded_count,
+            progress=100,
+            completed_at=datetime.now()
+        )
+        logger.info(f"✅ Embedded {embedded_count} sections for policy {policy_id} (job {job_id})")
+    except Exception as e:
+        logger.error(f"❌ Embedding job {job_id} for policy {policy_id} failed: {e}", exc_info=True)
+        _update_policy_embedding_job(
+            job_id,
+            status="failed",
+            error=str(e),
+            completed_at=datetime.now()
+        )
+
+
+@app.get("/api/policies/embedding-jobs/{job_id}")
+async def get_policy_embedding_job(
+    job_id: str,
+    user: DBUser = Depends(require_auth),
+    db: DBSessionType = Depends(get_db)
+):
+    """
+    Get progress of a background policy embedding job.
+
+    Args:
+        job_id: Embedding job ID returned by upload/update/save-generated
+
+    Returns:
+        Job status with section counts and progress percentage
+    """
+    job = db.query(PolicyEmbeddingJob).filter(PolicyEmbeddingJob.job_id == job_id).first()
+    if not job or job.company_id != user.company_id:
+        raise HTTPException(status_code=404, detail="Embedding job not found")
+    return job.to_dict()
+
+
 @app.post("/api/policies/upload")
 async def upload_policy(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     user: DBUser = Depends(require_auth)
 ):
@@ -1021,47 +1195,23 @@ async def upload_policy(
                 user_id=user.id
             )
 
-            # Update vector store with sections
-            from .vector_store.embeddings import PolicyEmbeddings
-            embeddings = PolicyEmbeddings()
-
-            # Embed each section separately with metadata (skip empty sections)
-            embedded_count = 0
-            for section in policy.sections:
-                # Skip sections with empty or whitespace-only content
-                if not section.section_content or not section.section_content.strip():
-                    logger.warning(f"Skipping empty section {section.id} in policy {policy.id}")
-                    continue
-
-                try:
-                    embeddings.embed_policy_section(
-                        section_id=section.id,
-                        section_content=section.section_content,
-                        metadata={
-                            'policy_id': policy.id,
-                            'policy_number': policy.policy_number or '',
-                            'policy_title': policy.title,
-                            'section_id': section.id,
-                            'section_number': section.section_number or '',
-                            'section_title': section.section_title or '',
-                            'company_id': user.company_id,
-                            'version': policy.version
-                        },
-                        company_id=user.company_id
-                    )
-                    embedded_count += 1
-                except Exception as e:
-                    logger.error(f"Error embedding section {section.id}: {e}")
-                    # Continue with other sections instead of failing completely
-                    continue
+            # Embed sections in the background (batched, single upsert)
+            sections = _policy_section_payloads(policy, user.company_id)
+            embedding_job_id = queue_policy_embedding(
+                background_tasks,
+                policy.id,
+                user.company_id,
+                sections
+            )
 
-            logger.info(f"Policy uploaded by {user.email}: {policy.title} ({len(policy.sections)} sections, {embedded_count} embedded)")
+            logger.info(f"Policy uploaded by {user.email}: {policy.title} ({len(policy.sections)} sections, embedding job {embedding_job_id})")
 
             return {
                 "success": True,
                 "policy": policy.to_dict(include_sections=True),
                 "parsing_status": policy.status,
-                "message": f"Policy uploaded and parsed successfully ({embedded_count} sections embedded)"
+                "embedding_job_id": embedding_job_id,
+                "message": f"Policy uploaded and parsed successfully ({len(sections)} sections queued for embedding)"
             }
 
         finally:
@@ -1186,8 +1336,9 @@ class SaveGeneratedPolicyResponse(BaseModel):
     title: str
     status: str
     ingestion_status: str
-    embeddings_count: int
+    embeddings_count: int  # Sections embedded so far (0 while the embedding job is queued)
     message: str
+    embedding_job_id: Optional[str] = None
 
 
 @app.get("/api/policies/types")
@@ -1323,6 +1474,8 @@ async def generate_policy_document(
 
     except HTTPException:
         raise
+    except QuotaExceededError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         logger.error(f"Error generating policy: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to generate policy: {str(e)}")
@@ -1331,6 +1484,7 @@ async def generate_policy_document(
 @app.post("/api/policies/save-generated", response_model=SaveGeneratedPolicyResponse)
 async def save_generated_policy(
     request: SaveGeneratedPolicyRequest,
+    background_tasks: BackgroundTasks,
     user: DBUser = Depends(require_auth),
     db: DBSessionType = Depends(get_db)
 ):
@@ -1347,7 +1501,6 @@ async def save_generated_policy(
     """
     from src.services.policy_service import PolicyService
     from src.services.policy_parser import PolicyParserService
-    from src.vector_store.embeddings import PolicyEmbeddings
     import uuid
     from datetime import datetime
     import json
@@ -1405,14 +1558,12 @@ async def save_generated_policy(
         raise HTTPException(status_code=500, detail=f"Failed to save policy: {str(e)}")
 
     # Policy is saved successfully at this point
-    # Now try to ingest into ChromaDB (non-critical)
-    try:
-        embeddings = PolicyEmbeddings()
-
-        # Embed each section
-        for i, section in enumerate(request.sections):
-            section_id = f"{policy_id}_section_{i}"
-            section_metadata = {
+    # Queue ChromaDB ingestion in the background (non-critical)
+    sections = [
+        {
+            "id": f"{policy_id}_section_{i}",
+            "content": section.get("section_content", ""),
+            "metadata": {
                 "policy_id": policy_id,
                 "policy_title": request.title,
                 "section_number": section.get("section_number", ""),
@@ -1420,21 +1571,13 @@ async def save_generated_policy(
                 "ai_generated": True,
                 "policy_type": request.policy_type,
             }
-
-            embeddings.embed_policy_section(
-                section_id=section_id,
-                section_content=section.get("section_content", ""),
-                metadata=section_metadata,
-                company_id=user.company_id
-            )
-            embeddings_count += 1
-
-        ingestion_status = "completed"
-        logger.info(f"✅ Ingested {embeddings_count} sections for policy {policy_id}")
-
-    except Exception as e:
-        logger.warning(f"⚠️  ChromaDB ingestion failed (policy still saved): {e}")
-        ingestion_status = "failed"
+        }
+        for i, section in enumerate(request.sections)
+    ]
+    embedding_job_id = queue_policy_embedding(background_tasks, policy_id, user.company_id, sections)
+    ingestion_status = "queued"
+    # Nothing is embedded yet; poll the embedding job for embedded_sections
+    logger.info(f"Queued {len(sections)} sections of policy {policy_id} for embedding (job {embedding_job_id})")
 
     # Return success regardless of ingestion status
     return SaveGeneratedPolicyResponse(
@@ -1443,7 +1586,8 @@ async def save_generated_policy(
         status="active",
         ingestion_status=ingestion_status,
         embeddings_count=embeddings_count,
-        message=f"Policy saved {'and added to knowledge base' if ingestion_status == 'completed' else 'successfully (embeddings will be added later)'}"
+        message=f"Policy saved {'and added to knowledge base' if ingestion_status == 'completed' else 'successfully (embeddings will be added later)'}",
+        embedding_job_id=embedding_job_id
     )
 
 
@@ -1487,6 +1631,7 @@ async def get_policy(
 async def update_policy(
     policy_id: str,
     update_data: dict,
+    background_tasks: BackgroundTasks,
     user: DBUser = Depends(require_auth),
     db: DBSessionType = Depends(get_db)
 ):
@@ -1514,44 +1659,23 @@ async def update_policy(
             change_description=update_data.get('change_description')
         )
 
-        # Update vector store if sections or content changed
+        # Re-embed in the background if sections or content changed
+        embedding_job_id = None
         if 'sections' in update_data or 'full_text' in update_data:
-            from .vector_store.embeddings import PolicyEmbeddings
-            embeddings = PolicyEmbeddings()
-
-            # Delete old embeddings
-            embeddings.delete_policy_embeddings(policy_id, user.company_id)
-
-            # Re-embed sections (skip empty ones)
-            for section in policy.sections:
-                if not section.section_content or not section.section_content.strip():
-                    continue
-
-                try:
-                    embeddings.embed_policy_section(
-                        section_id=section.id,
-                        section_content=section.section_content,
-                        metadata={
-                            'policy_id': policy.id,
-                            'policy_number': policy.policy_number or '',
-                            'policy_title': policy.title,
-                            'section_id': section.id,
-                            'section_number': section.section_number or '',
-                            'section_title': section.section_title or '',
-                            'company_id': user.company_id,
-                            'version': policy.version
-                        },
-                        company_id=user.company_id
-                    )
-                except Exception as e:
-                    logger.error(f"Error embedding section {section.id} during update: {e}")
-                    continue
+            embedding_job_id = queue_policy_embedding(
+                background_tasks,
+                policy.id,
+                user.company_id,
+                _policy_section_payloads(policy, user.company_id),
+                replace_existing=True
+            )
 
         logger.info(f"Policy {policy_id} updated by {user.email}")
 
         return {
             "success": True,
             "policy": policy.to_dict(include_sections=True),
+            "embedding_job_id": embedding_job_id,
             "message": "Policy updated successfully"
         }
 
@@ -1727,7 +1851,7 @@ HOW TO HELP:
 Remember: You are Cirilla AI, here to make company policies easy to understand and navigate."""
 
         # Initialize Gemini
-        llm = ChatGoogleGenerativeAI(
+        llm = create_gemini_chat(
             model=settings.gemini_model,
             google_api_key=settings.google_api_key,
             temperature=0.7,
@@ -1892,7 +2016,7 @@ HOW TO HELP:
 Remember: You are Cirilla AI, here to make navigating company policies simple, helping users find the information they need quickly and understand it clearly."""
 
         # Initialize Gemini
-        llm = ChatGoogleGenerativeAI(
+        llm = create_gemini_chat(
             model=settings.gemini_model,
             google_api_key=settings.google_api_key,
             temperature=0.7,
@@ -1972,9 +2096,6 @@ async def upload_contract(
         with open(upload_path, "wb") as f:
             f.write(content)
 
-        # Get region from request state (injected by middleware)
-        region_code = getattr(request.state, "region_code", None) if request else None
-
         # Create database record
         db_job = DBAnalysisJob(
             job_id=job_id,
@@ -1987,20 +2108,6 @@ async def upload_contract(
         db.add(db_job)
         db.commit()
 
-        # Also add to in-memory dict for backwards compatibility
-        job_data = {
-            "job_id": job_id,
-            "status": "uploaded",
-            "filename": file.filename,
-            "upload_path": str(upload_path),
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "user_id": user.id,
-            "company_name": user.company_name,
-            "region_code": region_code  # Store region for background task
-        }
-        analysis_jobs[job_id] = job_data
-
         logger.info(f"Contract uploaded and persisted: {job_id} - {file.filename}")
 
         return AnalysisResponse(
@@ -2016,51 +2123,88 @@ async def upload_contract(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _encode_contracts_cursor(created_at: datetime, job_id: str) -> str:
+    """Encode the position after a listed job as an opaque cursor."""
+    raw = json.dumps({"created_at": created_at.isoformat(), "job_id": job_id})
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_contracts_cursor(cursor: str) -> tuple:
+    """Decode a cursor from _encode_contracts_cursor() into (created_at, job_id)."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(data["created_at"]), str(data["job_id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @app.get("/api/contracts")
 async def list_contracts(
-    request: Request,
-    auth_service: AuthService = Depends(get_auth_service)
+    user: DBUser = Depends(require_auth),
+    db: DBSessionType = Depends(get_db),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None)
 ):
     """
-    List contracts for the current user or all if anonymous.
+    List the current user's contracts, newest first.
+
+    Uses keyset pagination on (created_at, job_id) over the
+    (user_id, created_at) index, so each page costs the same however many
+    jobs exist.
+
+    Args:
+        limit: Number of contracts per page (max 100)
+        cursor: next_cursor of the previous page
+
+    Returns:
+        Contracts and the cursor of the next page (None on the last page)
     """
     try:
-        # Get current user from session
-        session_id = request.cookies.get("session_id")
-        current_user = auth_service.get_user_by_session(session_id) if session_id else None
-
-        # Filter contracts based on user
-        contracts = []
-        for job_id, job in analysis_jobs.items():
-            # If user is logged in, only show their contracts
-            if current_user:
-                if job.get("user_id") == current_user.id:
-                    contracts.append({
-                        "job_id": job["job_id"],
-                        "filename": job["filename"],
-                        "status": job.get("status", "unknown"),
-                        "created_at": job.get("created_at"),
-                        "company_name": job.get("company_name", current_user.company_name)
-                    })
-            else:
-                # For anonymous users, show all or recent contracts (demo mode)
-                contracts.append({
-                    "job_id": job["job_id"],
-                    "filename": job["filename"],
-                    "status": job.get("status", "unknown"),
-                    "created_at": job.get("created_at"),
-                    "company_name": job.get("company_name", "Anonymous")
-                })
+        query = db.query(
+            DBAnalysisJob.job_id,
+            DBAnalysisJob.filename,
+            DBAnalysisJob.status,
+            DBAnalysisJob.created_at
+        ).filter(DBAnalysisJob.user_id == user.id)
+
+        if cursor:
+            after_created_at, after_job_id = _decode_contracts_cursor(cursor)
+            query = query.filter(
+                or_(
+                    DBAnalysisJob.created_at < after_created_at,
+                    and_(DBAnalysisJob.created_at == after_created_at, DBAnalysisJob.job_id < after_job_id)
+                )
+            )
 
-        # Sort by created_at descending (newest first)
-        contracts.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+        # Fetch one extra row to know whether another page exists
+        rows = (
+            query.order_by(DBAnalysisJob.created_at.desc(), DBAnalysisJob.job_id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        contracts = [
+            {
+                "job_id": row.job_id,
+                "filename": row.filename,
+                "status": row.status,
+                "created_at": row.created_at.isoformat(),
+                "company_name": user.company_name
+            }
+            for row in rows
+        ]
 
         return {
             "success": True,
             "contracts": contracts,
-            "user": current_user.to_dict() if current_user else None
+            "next_cursor": _encode_contracts_cursor(rows[-1].created_at, rows[-1].job_id) if has_more else None,
+            "user": user.to_dict()
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing contracts: {e}")
         raise HTTPException(status_code=500, detail="Failed to list contracts")
@@ -2097,7 +2241,13 @@ async def get_analysis_history(
         total_count = query.count()
 
         # Get paginated results
-        analyses = query.order_by(DBAnalysisJob.created_at.desc()).offset(page * limit).limit(limit).all()
+        analyses = (
+            query.options(defer(DBAnalysisJob.result_json))
+            .order_by(DBAnalysisJob.created_at.desc())
+            .offset(page * limit)
+            .limit(limit)
+            .all()
+        )
 
         # Transform results for frontend
         results = []
@@ -2111,60 +2261,10 @@ async def get_analysis_history(
                 "updated_at": analysis.updated_at.isoformat()
             }
 
-            # Include summary if analysis is completed and has results
-            if analysis.status == "completed" and analysis.result_json:
-                try:
-                    full_results = json.loads(analysis.result_json)
-
-                    # Calculate summary from actual analysis_results (same logic as status endpoint)
-                    if "analysis_results" in full_results:
-                        analysis_results = full_results["analysis_results"]
-                        total_clauses = len(analysis_results)
-
-                        # Count compliant/non-compliant based on the 'compliant' field
-                        compliant = sum(1 for r in analysis_results if r.get("compliant", False))
-                        non_compliant = sum(1 for r in analysis_results if not r.get("compliant", True))
-
-                        compliance_rate = (compliant / total_clauses * 100) if total_clauses > 0 else 0
-
-                        # Determine overall risk from analysis results
-                        risk_levels = [r.get("risk_level", "").lower() for r in analysis_results if r.get("risk_level")]
-                        if "critical" in risk_levels:
-                            overall_risk = "Critical"
-                        elif "high" in risk_levels:
-                            overall_risk = "High"
-                        elif "medium" in risk_levels:
-                            overall_risk = "Medium"
-                        elif "low" in risk_levels:
-                            overall_risk = "Low"
-                        else:
-                            overall_risk = "Unknown"
-
-                        result_dict["summary"] = {
-                            "total_clauses": total_clauses,
-                            "compliant_clauses": compliant,
-                            "non_compliant_clauses": non_compliant,
-                            "compliance_rate": compliance_rate,
-                            "overall_risk": overall_risk
-                        }
-                    # Fallback to summary field if analysis_results not available
-                    elif "summary" in full_results:
-                        summary = full_results["summary"]
-                        # Normalize old format to new format
-                        if "total_clauses_reviewed" in summary:
-                            total = summary.get("total_clauses_reviewed", 0)
-                            compliant = summary.get("compliant_clauses", 0)
-                            result_dict["summary"] = {
-                                "total_clauses": total,
-                                "compliant_clauses": compliant,
-                                "non_compliant_clauses": summary.get("non_compliant_clauses", total - compliant),
-                                "compliance_rate": (compliant / total * 100) if total > 0 else 0,
-                                "overall_risk": summary.get("overall_risk_assessment", "Unknown").title()
-                            }
-                        else:
-                            result_dict["summary"] = summary
-                except json.JSONDecodeError:
-                    logger.warning(f"Failed to parse result_json for job {analysis.job_id}")
+            # Include summary if analysis is completed (from summary columns, never full results)
+            summary = job_summary(analysis) if analysis.status == "completed" else None
+            if summary:
+                result_dict["summary"] = summary
 
             results.append(result_dict)
 
@@ -2187,132 +2287,95 @@ async def get_analysis_history(
 @app.post("/api/contracts/{job_id}/analyze")
 async def analyze_contract(
     job_id: str,
-    background_tasks: BackgroundTasks
+    request: Request,
+    priority: int = Query(0, ge=-10, le=10),
+    db: DBSessionType = Depends(get_db)
 ):
     """
-    Start contract analysis for an uploaded document.
+    Queue contract analysis for an uploaded document.
+
+    The analysis is run by a worker process (python -m src.worker).
 
     Args:
         job_id: Job ID from upload
+        priority: Queue priority (higher runs first)
 
     Returns:
         Analysis status
     """
-    if job_id not in analysis_jobs:
+    db_job = db.query(DBAnalysisJob).filter(DBAnalysisJob.job_id == job_id).first()
+    if not db_job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = analysis_jobs[job_id]
-
-    # Allow retry for failed jobs, but not for jobs that are currently analyzing or already completed
-    if job["status"] not in ["uploaded", "failed"]:
+    # Allow retry for failed jobs, but not for jobs that are queued, analyzing or already completed
+    if db_job.status not in ["uploaded", "failed"]:
         raise HTTPException(
             status_code=400,
-            detail=f"Job is already {job['status']}"
+            detail=f"Job is already {db_job.status}"
         )
 
-    # Update status
-    job["status"] = "analyzing"
-    job["updated_at"] = datetime.now().isoformat()
-
-    # Start analysis in background
-    background_tasks.add_task(
-        run_contract_analysis,
-        job_id=job_id,
-        contract_path=job["upload_path"]
+    # Get region from request state (injected by middleware)
+    region_code = getattr(request.state, "region_code", None)
+
+    # Record the event first so it precedes the worker's "started" event
+    JobEventService(db).record(job_id, "queued", {"priority": priority})
+
+    # Update status and add the queue entry in one transaction, so a worker
+    # can't claim the entry (and set "analyzing") before the status is written
+    db_job.status = "queued"
+    db_job.error = None
+    db_job.updated_at = datetime.now()
+    JobQueue(db).enqueue(
+        job_id,
+        payload={"contract_path": db_job.upload_path, "region_code": region_code},
+        priority=priority,
+        commit=False
     )
+    db.commit()
 
-    logger.info(f"Started analysis for job: {job_id}")
+    logger.info(f"Queued analysis for job: {job_id}")
 
     return {
         "job_id": job_id,
-        "status": "analyzing",
-        "message": "Contract analysis started. Check status for progress."
+        "status": "queued",
+        "message": "Contract analysis queued. Check status for progress."
     }
 
 
-def run_contract_analysis(job_id: str, contract_path: str):
+def _completed_status_response(request: Request, db: DBSessionType, db_job: DBAnalysisJob) -> Response:
     """
-    Background task to run contract analysis.
+    Serve the precomputed status payload of a completed job.
 
-    Args:
-        job_id: Job ID
-        contract_path: Path to the contract file
+    Answers 304 when the client's ETag is current, and sends the stored
+    gzip bytes as-is when the client accepts gzip. Jobs completed before
+    payloads were precomputed are backfilled from their results once.
     """
-    db = next(get_db())
-    try:
-        logger.info(f"Running analysis for job: {job_id}")
-
-        # Get job from database
-        db_job = db.query(DBAnalysisJob).filter(DBAnalysisJob.job_id == job_id).first()
-        if not db_job:
-            logger.error(f"Job {job_id} not found in database")
-            return
-
-        # Get user for company_id
-        user = db.query(DBUser).filter(DBUser.id == db_job.user_id).first()
-        company_id = user.company_id if user else None
-
-        # Get region_code from job data
-        region_code = analysis_jobs.get(job_id, {}).get("region_code")
-
-        logger.info(f"Using company-specific policies for company: {company_id}{' region: ' + region_code if region_code else ''}")
-
-        # Initialize analyzer with company_id and region_code
-        analyzer = ContractAnalyzer(company_id=company_id, region_code=region_code)
-
-        # Define output path
-        output_path = Path(settings.output_dir) / f"{job_id}_reviewed.docx"
-
-        # Run analysis
-        results = analyzer.analyze_contract(
-            contract_path=contract_path,
-            output_path=str(output_path)
-        )
-
-        # Log the results structure for debugging
-        logger.info(f"Analysis results structure: {list(results.keys()) if isinstance(results, dict) else type(results)}")
-        if isinstance(results, dict) and "analysis_results" in results:
-            logger.info(f"Number of analysis results: {len(results.get('analysis_results', []))}")
-            if results.get('analysis_results'):
-                logger.info(f"First result keys: {list(results['analysis_results'][0].keys())}")
-
-        # Update database with results
-        db_job.status = "completed"
-        db_job.updated_at = datetime.now()
-        db_job.output_path = str(output_path)
-        db_job.result_json = json.dumps(results)  # Store full results as JSON
-        db.commit()
-
-        # Also update in-memory for backwards compatibility
-        if job_id in analysis_jobs:
-            analysis_jobs[job_id].update({
-                "status": "completed",
-                "updated_at": datetime.now().isoformat(),
-                "output_path": str(output_path),
-                "results": results
-            })
-
-        logger.info(f"Analysis completed and persisted for job: {job_id}")
-
-    except Exception as e:
-        logger.error(f"Error in analysis job {job_id}: {e}")
-        # Update database with error
-        db_job = db.query(DBAnalysisJob).filter(DBAnalysisJob.job_id == job_id).first()
-        if db_job:
-            db_job.status = "failed"
-            db_job.updated_at = datetime.now()
-            db_job.error = str(e)
-            db.commit()
+    store = StatusPayloadStore(db)
+    headers = {
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding"
+    }
 
-        # Also update in-memory for backwards compatibility
-        if job_id in analysis_jobs:
-            analysis_jobs[job_id].update({
-                "status": "failed",
-                "updated_at": datetime.now().isoformat(),
-                "error": str(e)
-            })
-    finally:
-        db.close()
+    etag = store.get_etag(db_job.job_id)
+    if etag and etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={**headers, "ETag": etag})
+
+    stored = store.get(db_job.job_id) if etag else None
+    if stored is None:
+        results = load_job_results(db_job)
+        if results is None:
+            # Missing or unreadable results: don't cache an empty payload for good
+            logger.error(f"Results unavailable for completed job {db_job.job_id}")
+            raise HTTPException(status_code=500, detail="Analysis results are unavailable")
+        stored = store.save_for_job(db_job, results)
+
+    etag, body = stored
+    headers["ETag"] = etag
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+    else:
+        body = gzip.decompress(body)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.get("/api/contracts/{job_id}/status")
@@ -2331,47 +2394,55 @@ async def get_analysis_status(
     Returns:
         Job status and results (if completed)
     """
-    # First, try to get job from database (persistent storage)
-    db_job = db.query(DBAnalysisJob).filter(DBAnalysisJob.job_id == job_id).first()
-
+    # Results are served precomputed, so skip loading the legacy result column
+    db_job = (
+        db.query(DBAnalysisJob)
+        .options(defer(DBAnalysisJob.result_json))
+        .filter(DBAnalysisJob.job_id == job_id)
+        .first()
+    )
     if not db_job:
-        # Fallback to in-memory (for backward compatibility with active jobs)
-        if job_id not in analysis_jobs:
-            raise HTTPException(status_code=404, detail="Job not found")
-        job = analysis_jobs[job_id]
-        use_db = False
-    else:
-        use_db = True
+        raise HTTPException(status_code=404, detail="Job not found")
 
     # Check ownership if user is authenticated
     session_id = request.cookies.get("session_id")
     current_user = auth_service.get_user_by_session(session_id) if session_id else None
 
     if current_user:
-        # Check ownership from database or in-memory
-        owner_user_id = db_job.user_id if use_db else job.get("user_id")
-        if owner_user_id and owner_user_id != current_user.id:
+        if db_job.user_id and db_job.user_id != current_user.id:
             raise HTTPException(status_code=403, detail="Access denied - not your contract")
 
     # Map backend status to frontend status
     status_map = {
         "uploaded": "pending",
+        "queued": "pending",
         "analyzing": "processing",
         "completed": "completed",
         "failed": "failed"
     }
 
-    # Get status from database or in-memory
-    job_status = db_job.status if use_db else job["status"]
+    job_status = db_job.status
+    if job_status == "completed":
+        return _completed_status_response(request, db, db_job)
 
     # Calculate progress
     progress = 0
-    if job_status == "uploaded":
+    stage = None
+    partial_results: Dict[int, Dict[str, Any]] = {}
+    total_clauses = None
+    if job_status in ("uploaded", "queued"):
         progress = 0
     elif job_status == "analyzing":
-        progress = 50  # Default to 50% during analysis
-    elif job_status == "completed":
-        progress = 100
+        # Stage progress from the events emitted by the analysis pipeline
+        current = JobEventService(db).current_stage(job_id)
+        progress = current["progress"]
+        stage = current["stage"]
+        # Live progress reported by the worker through the job queue
+        live_progress = JobQueue(db).get_progress(job_id) or {}
+        partial_results = {
+            int(idx): result for idx, result in (live_progress.get("partial_results") or {}).items()
+        }
+        total_clauses = live_progress.get("total_clauses")
     elif job_status == "failed":
         progress = 0
 
@@ -2379,115 +2450,135 @@ async def get_analysis_status(
         "job_id": job_id,
         "status": status_map.get(job_status, job_status),
         "progress": progress,
-        "message": db_job.error if (use_db and db_job.error) else job.get("message", "") if not use_db else "",
+        "message": db_job.error or "",
     }
+    if stage:
+        response["stage"] = stage
+
+    # Stream clause findings to the UI while the analysis is still running
+    if job_status == "analyzing" and total_clauses:
+        response["progress"] = max(progress, analysis_progress(len(partial_results), total_clauses))
+        response["clauses_analyzed"] = len(partial_results)
+        response["total_clauses"] = total_clauses
+        response["partial_results"] = [
+            format_clause_result(idx, partial_results[idx])
+            for idx in sorted(partial_results)
+        ]
 
-    # Include full result with analysis details if completed
-    if job_status == "completed":
-        # Get results from database or in-memory
-        if use_db and db_job.result_json:
-            try:
-                results = json.loads(db_job.result_json)
-            except json.JSONDecodeError:
-                logger.error(f"Failed to parse result_json for job {job_id}")
-                results = {}
-        elif not use_db and "results" in job:
-            results = job["results"]
-        else:
-            results = {}
+    # Return with anti-buffering headers to prevent Traefik/nginx from buffering responses
+    return JSONResponse(
+        content=response,
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Disable buffering for nginx/Traefik
+        }
+    )
 
-        # Get and transform analysis results to match frontend expectations
-        analysis_results_raw = results.get("analysis_results", [])
-        analysis_results = []
 
-        for idx, result in enumerate(analysis_results_raw):
-            # Transform backend format to frontend format
-            transformed = {
-                "clause_number": idx + 1,
-                "clause_text": result.get("text", result.get("clause_text", "")),
-                "clause_type": result.get("type", result.get("clause_type", "Unknown")),
-                "compliance_status": "Compliant" if result.get("compliant") else "Non-Compliant",
-                "issues": result.get("issues", []),
-                "recommendations": result.get("recommendations", []),
-                "policy_references": result.get("policy_references", result.get("relevant_policies", [])),
-                "risk_level": result.get("risk_level", "Medium"),
-                "suggested_text": result.get("suggested_alternative", result.get("suggested_text"))
-            }
-            analysis_results.append(transformed)
-
-        summary = results.get("summary", {})
-
-        # If summary is missing fields, calculate them
-        if not summary or "total_clauses" not in summary:
-            total_clauses = len(analysis_results)
-            compliant = sum(1 for r in analysis_results if r.get("compliance_status") == "Compliant")
-            non_compliant = sum(1 for r in analysis_results if r.get("compliance_status") == "Non-Compliant")
-            needs_review = sum(1 for r in analysis_results if r.get("compliance_status") == "Needs Review")
-
-            critical = sum(1 for r in analysis_results if r.get("risk_level") == "Critical")
-            high = sum(1 for r in analysis_results if r.get("risk_level") == "High")
-            medium = sum(1 for r in analysis_results if r.get("risk_level") == "Medium")
-            low = sum(1 for r in analysis_results if r.get("risk_level") == "Low")
-
-            compliance_rate = (compliant / total_clauses * 100) if total_clauses > 0 else 0
-
-            # Determine overall risk
-            if critical > 0:
-                overall_risk = "Critical"
-            elif high > 0:
-                overall_risk = "High"
-            elif medium > 0:
-                overall_risk = "Medium"
-            else:
-                overall_risk = "Low"
+@app.get("/api/contracts/{job_id}/events")
+async def stream_analysis_events(
+    request: Request,
+    job_id: str,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    auth_service: AuthService = Depends(get_auth_service),
+    db: DBSessionType = Depends(get_db)
+):
+    """
+    Push the progress events of an analysis job (Server-Sent Events).
 
-            summary = {
-                "total_clauses": total_clauses,
-                "compliant_clauses": compliant,
-                "non_compliant_clauses": non_compliant,
-                "needs_review_clauses": needs_review,
-                "critical_issues": critical,
-                "high_risk_issues": high,
-                "medium_risk_issues": medium,
-                "low_risk_issues": low,
-                "compliance_rate": compliance_rate,
-                "overall_risk": overall_risk
-            }
+    Events: queued, started, parsed, policies_retrieved, chunk_analyzed,
+    analysis_complete, summary, reports_queued, report_rendered, completed,
+    retrying, failed. The stream replays events the client has not seen
+    (Last-Event-ID) and closes once the job has failed, or has completed and
+    its queued reports are rendered.
 
-        # Get file info from database or in-memory
-        contract_name = db_job.filename if use_db else job["filename"]
-        created_at = db_job.created_at.isoformat() if use_db else job["created_at"]
-        completed_at = db_job.updated_at.isoformat() if use_db else job["updated_at"]
-        output_path = db_job.output_path if use_db else job.get("output_path", "")
+    Args:
+        job_id: Job ID
 
-        response["result"] = {
-            "job_id": job_id,
-            "contract_name": contract_name,
-            "status": "completed",
-            "created_at": created_at,
-            "completed_at": completed_at,
-            "analysis_results": analysis_results,
-            "summary": summary,
-            "output_files": {
-                "reviewed_contract": output_path,
-                "detailed_report": output_path.replace(".docx", "_DETAILED_REPORT.docx") if output_path else "",
-                "html_summary": output_path.replace(".docx", "_SUMMARY.html") if output_path else ""
-            }
-        }
+    Returns:
+        SSE stream of events with their progress percentage
+    """
+    db_job = db.query(DBAnalysisJob).filter(DBAnalysisJob.job_id == job_id).first()
+    if not db_job:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-    # Include error if failed
-    if job_status == "failed":
-        if use_db and db_job.error:
-            response["message"] = db_job.error
-        elif not use_db and "error" in job:
-            response["message"] = job["error"]
+    # Check ownership once per connection instead of on every poll
+    session_id = request.cookies.get("session_id")
+    current_user = auth_service.get_user_by_session(session_id) if session_id else None
+    if current_user and db_job.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Access denied - not your contract")
 
-    # Return with anti-buffering headers to prevent Traefik/nginx from buffering responses
-    return JSONResponse(
-        content=response,
+    try:
+        after_id = int(last_event_id) if last_event_id else 0
+    except ValueError:
+        after_id = 0
+    job_status = db_job.status
+
+    async def generate_events() -> AsyncGenerator[str, None]:
+        """Replay missed events, then forward live ones until the job is done."""
+        queue = job_event_broker.subscribe(job_id, after_id)
+        last_id = after_id
+        progress = 0
+        completed = False
+        pending_reports = set()
+        deadline = asyncio.get_running_loop().time() + settings.job_events_stream_timeout
+
+        def format_event(event: Dict[str, Any]) -> str:
+            nonlocal progress, completed
+            name, data = event["event"], event["data"]
+            if name == "started":
+                progress = 0
+            progress = max(progress, event_progress(name, data) or 0)
+            if name == "reports_queued":
+                pending_reports.update(data.get("report_types", []))
+            elif name in ("report_rendered", "report_failed"):
+                pending_reports.discard(data.get("report_type"))
+            elif name == "completed":
+                completed = True
+            payload = {"event": name, "progress": progress, "data": data, "created_at": event["created_at"]}
+            return f"id: {event['id']}\ndata: {json.dumps(payload)}\n\n"
+
+        def finished(event: Dict[str, Any]) -> bool:
+            return event["event"] == "failed" or (completed and not pending_reports)
+
+        try:
+            backlog = await job_event_broker.backlog(job_id, after_id)
+            if not backlog and not after_id and job_status in ("completed", "failed"):
+                # Job finished before progress events were recorded
+                yield f"data: {json.dumps({'event': job_status, 'progress': 100 if job_status == 'completed' else 0, 'data': {}})}\n\n"
+                return
+
+            for event in backlog:
+                last_id = event["id"]
+                yield format_event(event)
+                if finished(event):
+                    return
+
+            while asyncio.get_running_loop().time() < deadline:
+                if await request.is_disconnected():
+                    return
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if event["id"] <= last_id:
+                    continue  # Already replayed from the backlog
+                last_id = event["id"]
+                yield format_event(event)
+                if finished(event):
+                    return
+        finally:
+            job_event_broker.unsubscribe(job_id, queue)
+
+    return StreamingResponse(
+        generate_events(),
+        media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no"  # Disable buffering for nginx/Traefik
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"  # Disable buffering for nginx
         }
     )
 
@@ -2508,29 +2599,19 @@ async def download_report(
     Returns:
         Report file
     """
-    # First, try to get job from database (persistent storage)
     db_job = db.query(DBAnalysisJob).filter(DBAnalysisJob.job_id == job_id).first()
-
     if not db_job:
-        # Fallback to in-memory (for backward compatibility with active jobs)
-        if job_id not in analysis_jobs:
-            raise HTTPException(status_code=404, detail="Job not found")
-        job = analysis_jobs[job_id]
-        use_db = False
-    else:
-        use_db = True
+        raise HTTPException(status_code=404, detail="Job not found")
 
     # Check if completed
-    job_status = db_job.status if use_db else job["status"]
-    if job_status != "completed":
+    if db_job.status != "completed":
         raise HTTPException(
             status_code=400,
-            detail=f"Analysis not completed. Current status: {job_status}"
+            detail=f"Analysis not completed. Current status: {db_job.status}"
         )
 
-    # Get output path and filename
-    output_path = db_job.output_path if use_db else job.get("output_path")
-    filename = db_job.filename if use_db else job.get("filename", "contract.docx")
+    output_path = db_job.output_path
+    filename = db_job.filename
 
     if not output_path:
         raise HTTPException(status_code=404, detail="Output file not found")
@@ -2552,7 +2633,20 @@ async def download_report(
         raise HTTPException(status_code=400, detail="Invalid report type")
 
     if not Path(file_path).exists():
-        raise HTTPException(status_code=404, detail=f"{report_type} report not found")
+        # Reports are rendered after the job completes; render this one now if needed
+        upload_path = db_job.upload_path
+        results = load_job_results(db_job)
+
+        if not results or not upload_path or not Path(upload_path).exists():
+            raise HTTPException(status_code=404, detail=f"{report_type} report not found")
+
+        try:
+            await asyncio.to_thread(
+                get_report_renderer().ensure, report_type, upload_path, results, output_path
+            )
+        except Exception as e:
+            logger.error(f"Error rendering {report_type} report for job {job_id}: {e}")
+            raise HTTPException(status_code=500, detail=f"Failed to render {report_type} report")
 
     return FileResponse(
         file_path,
@@ -2575,7 +2669,7 @@ async def analyze_single_clause(request: ClauseAnalysisRequest):
     try:
         analyzer = ContractAnalyzer()
 
-        result = analyzer.analyze_clause_text(
+        result = await analyzer.analyze_clause_text_async(
             clause_text=request.clause_text,
             clause_type=request.clause_type
         )
@@ -2731,16 +2825,13 @@ async def clear_policy_embeddings(
         Status of the clear operation
     """
     try:
-        import chromadb
-        from chromadb.config import Settings as ChromaSettings
+        from .vector_store.registry import get_vector_registry
 
         logger.info(f"Clearing policy embeddings for company {user.company_id} by user {user.email}")
 
-        # Initialize ChromaDB client
-        chroma_client = chromadb.PersistentClient(
-            path=str(settings.chroma_db_path),
-            settings=ChromaSettings(anonymized_telemetry=False)
-        )
+        # Use the shared ChromaDB client
+        registry = get_vector_registry()
+        chroma_client = registry.get_chroma_client()
 
         # Get company-specific collection name
         company_collection_name = f"policies_{user.company_id}"
@@ -2769,7 +2860,7 @@ async def clear_policy_embeddings(
         logger.info(f"Found {count} policy chunks in company collection {company_collection_name}")
 
         # Delete the entire collection (cleanest way to clear all data)
-        chroma_client.delete_collection(company_collection_name)
+        registry.drop_collection(company_collection_name)
 
         logger.info(f"Deleted collection {company_collection_name} with {count} embeddings for company {user.company_id}")
 
@@ -2798,7 +2889,8 @@ async def get_policy_stats():
 
         return {
             "status": "success",
-            "stats": stats
+            "stats": stats,
+            "registry": embeddings.registry.memory_report()
         }
 
     except Exception as e:
@@ -2807,7 +2899,11 @@ async def get_policy_stats():
 
 
 @app.delete("/api/contracts/{job_id}")
-async def delete_analysis_job(job_id: str):
+async def delete_analysis_job(
+    job_id: str,
+    user: DBUser = Depends(require_auth),
+    db: DBSessionType = Depends(get_db)
+):
     """
     Delete an analysis job and its associated files.
 
@@ -2817,21 +2913,38 @@ async def delete_analysis_job(job_id: str):
     Returns:
         Deletion status
     """
-    if job_id not in analysis_jobs:
+    db_job = db.query(DBAnalysisJob).filter(DBAnalysisJob.job_id == job_id).first()
+    if not db_job:
         raise HTTPException(status_code=404, detail="Job not found")
-
-    job = analysis_jobs[job_id]
+    if db_job.user_id != user.id:
+        raise HTTPException(status_code=403, detail="Access denied - not your contract")
+    if db_job.status in ("queued", "analyzing"):
+        raise HTTPException(status_code=409, detail=f"Job is {db_job.status}; wait for the analysis to finish")
 
     # Delete uploaded file
-    if "upload_path" in job and Path(job["upload_path"]).exists():
-        Path(job["upload_path"]).unlink()
-
-    # Delete output file
-    if "output_path" in job and Path(job["output_path"]).exists():
-        Path(job["output_path"]).unlink()
+    if db_job.upload_path and Path(db_job.upload_path).exists():
+        Path(db_job.upload_path).unlink()
+
+    # Delete output files
+    if db_job.output_path:
+        for path in artifact_paths(db_job.output_path).values():
+            Path(path).unlink(missing_ok=True)
+
+    # Delete stored results unless another job has identical results
+    if db_job.result_key:
+        shared = (
+            db.query(DBAnalysisJob.job_id)
+            .filter(DBAnalysisJob.result_key == db_job.result_key, DBAnalysisJob.job_id != job_id)
+            .first()
+        )
+        if not shared:
+            get_result_store().delete(db_job.result_key)
 
-    # Remove from jobs
-    del analysis_jobs[job_id]
+    # Remove from jobs (SQLite doesn't enforce ON DELETE CASCADE here)
+    for model in (JobQueueItem, AnalysisJobEvent, AnalysisStatusPayload):
+        db.query(model).filter(model.job_id == job_id).delete(synchronize_session=False)
+    db.delete(db_job)
+    db.commit()
 
     logger.info(f"Deleted job: {job_id}")
 
@@ -2866,66 +2979,39 @@ async def chat_with_assistant(
     session_id = request.cookies.get("session_id")
     current_user = auth_service.get_user_by_session(session_id) if session_id else None
 
-    # Try to get job from in-memory dictionary first (fast path)
-    job = None
-    result = None
-
-    if job_id in analysis_jobs:
-        # Job found in memory
-        job = analysis_jobs[job_id]
-
-        # Check ownership
-        if current_user and job.get("user_id"):
-            if job["user_id"] != current_user.id:
-                raise HTTPException(status_code=403, detail="Access denied - not your contract")
-
-        # Check if analysis is complete
-        if job.get("status") != "completed":
-            raise HTTPException(
-                status_code=400,
-                detail="Analysis not yet completed. Please wait for analysis to finish."
-            )
-
-        # Get the result object
-        result = job.get("result") or job.get("results", {})
-    else:
-        # Job not in memory, try database (for jobs from previous server sessions)
-        logger.info(f"Job {job_id} not in memory, querying database...")
-        db_job = db.query(DBAnalysisJob).filter(DBAnalysisJob.job_id == job_id).first()
-
-        if not db_job:
-            raise HTTPException(status_code=404, detail="Job not found")
+    db_job = db.query(DBAnalysisJob).filter(DBAnalysisJob.job_id == job_id).first()
 
-        # Check ownership
-        if current_user and db_job.user_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Access denied - not your contract")
+    if not db_job:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-        # Check if analysis is complete
-        if db_job.status != "completed":
-            raise HTTPException(
-                status_code=400,
-                detail="Analysis not yet completed. Please wait for analysis to finish."
-            )
+    # Check ownership
+    if current_user and db_job.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Access denied - not your contract")
 
-        # Parse result_json from database
-        if not db_job.result_json:
-            raise HTTPException(status_code=400, detail="Analysis results not available")
+    # Check if analysis is complete
+    if db_job.status != "completed":
+        raise HTTPException(
+            status_code=400,
+            detail="Analysis not yet completed. Please wait for analysis to finish."
+        )
 
-        try:
-            result = json.loads(db_job.result_json)
-            logger.info(f"Loaded job {job_id} from database")
-        except json.JSONDecodeError:
-            logger.error(f"Failed to parse result_json for job {job_id}")
-            raise HTTPException(status_code=500, detail="Failed to load analysis results")
-
-        # Create a job-like dict for consistency with the rest of the code
-        job = {
-            "job_id": db_job.job_id,
-            "user_id": db_job.user_id,
-            "status": db_job.status,
-            "filename": db_job.filename,
-            "result": result
-        }
+    # Load results from the result store
+    if not db_job.result_key and not db_job.result_json:
+        raise HTTPException(status_code=400, detail="Analysis results not available")
+
+    result = load_job_results(db_job)
+    if result is None:
+        raise HTTPException(status_code=500, detail="Failed to load analysis results")
+    logger.info(f"Loaded job {job_id} from database")
+
+    # Create a job-like dict for consistency with the rest of the code
+    job = {
+        "job_id": db_job.job_id,
+        "user_id": db_job.user_id,
+        "status": db_job.status,
+        "filename": db_job.filename,
+        "result": result
+    }
 
     # DEBUG: Log what we actually have
     logger.info(f"DEBUG - Job keys: {list(job.keys())}")
@@ -2949,7 +3035,7 @@ async def chat_with_assistant(
             logger.info(f"Using job data directly - found {len(job.get('analysis_results', []))} results")
 
     # Initialize LLM with slightly higher temperature for more natural conversation
-    llm = ChatGoogleGenerativeAI(
+    llm = create_gemini_chat(
         model=settings.gemini_model,
         google_api_key=settings.google_api_key,
         temperature=0.5,  # Slightly higher for more conversational responses
@@ -3028,10 +3114,8 @@ Remember: You're having a conversation, not reading a report. Be helpful, clear,
     async def generate_response() -> AsyncGenerator[str, None]:
         """Generate streaming response."""
         try:
-            # Get streaming response from LLM
-            response = llm.stream(messages)
-
-            for chunk in response:
+            # Stream from the LLM; the shared quota wait must not block the event loop
+            async for chunk in llm.astream(messages):
                 if chunk.content:
                     # Format as SSE
                     yield f"data: {json.dumps({'content': chunk.content})}\n\n"
@@ -3040,6 +3124,11 @@ Remember: You're having a conversation, not reading a report. Be helpful, clear,
             # Send completion signal
             yield f"data: {json.dumps({'done': True})}\n\n"
 
+        except QuotaExceededError as e:
+            # Chat shares the daily request budget with contract analysis
+            logger.warning(f"Chat blocked by LLM quota: {e}")
+            yield f"data: {json.dumps({'error': 'The daily AI request limit has been reached. Please try again later.'})}\n\n"
+
         except Exception as e:
             logger.error(f"Error in chat streaming: {e}")
             yield f"data: {json.dumps({'error': str(e)})}\n\n"
@@ -3142,28 +3231,22 @@ async def speech_to_text(
 
 
 @app.get("/api/debug/{job_id}")
-async def debug_job(job_id: str):
+async def debug_job(job_id: str, db: DBSessionType = Depends(get_db)):
     """
     Debug endpoint to see complete job structure.
     """
-    if job_id not in analysis_jobs:
-        return {
-            "error": "Job not found",
-            "available_jobs": list(analysis_jobs.keys())
-        }
+    db_job = db.query(DBAnalysisJob).filter(DBAnalysisJob.job_id == job_id).first()
+    if not db_job:
+        return {"error": "Job not found"}
 
-    job = analysis_jobs[job_id]
-    # Check both "result" and "results" keys
-    result = job.get("result") or job.get("results", {})
+    result = load_job_results(db_job) or {}
 
     # Create a summary of what's in the job
     debug_info = {
         "job_id": job_id,
-        "job_status": job.get("status"),
-        "job_keys": list(job.keys()),
-        "has_result": bool(job.get("result")),
-        "has_results": bool(job.get("results")),
-        "using_key": "results" if job.get("results") else "result" if job.get("result") else "none",
+        "job_status": db_job.status,
+        "result_key": db_job.result_key,
+        "has_result": bool(result),
         "result_keys": list(result.keys()) if result else [],
         "analysis_results_count": len(result.get("analysis_results", [])) if result else 0
     }
@@ -3254,29 +3337,26 @@ Be conversational and helpful. Offer guidance on contract analysis best practice
                 context_parts.append(f"{'='*60}\n")
 
                 # Add summary if available
-                if analysis.result_json:
-                    try:
-                        result = json.loads(analysis.result_json)
-                        summary = result.get("summary", {})
-
-                        if summary:
-                            context_parts.append(f"\nSUMMARY:")
-                            context_parts.append(f"Overall Status: {summary.get('overall_compliance_status', 'N/A')}")
-                            context_parts.append(f"Risk Level: {summary.get('risk_level', 'N/A')}")
-
-                            if summary.get('total_clauses'):
-                                context_parts.append(f"Total Clauses: {summary['total_clauses']}")
-                            if summary.get('compliant_clauses') is not None:
-                                context_parts.append(f"Compliant Clauses: {summary['compliant_clauses']}")
-                            if summary.get('non_compliant_clauses') is not None:
-                                context_parts.append(f"Non-Compliant Clauses: {summary['non_compliant_clauses']}")
-
-                            if summary.get('key_findings'):
-                                context_parts.append(f"\nKey Findings:")
-                                for finding in summary['key_findings'][:3]:  # Limit to 3
-                                    context_parts.append(f"- {finding}")
-                    except json.JSONDecodeError:
-                        logger.warning(f"Failed to parse result_json for analysis {analysis.job_id}")
+                result = load_job_results(analysis)
+                if result:
+                    summary = result.get("summary", {})
+
+                    if summary:
+                        context_parts.append(f"\nSUMMARY:")
+                        context_parts.append(f"Overall Status: {summary.get('overall_compliance_status', 'N/A')}")
+                        context_parts.append(f"Risk Level: {summary.get('risk_level', 'N/A')}")
+
+                        if summary.get('total_clauses'):
+                            context_parts.append(f"Total Clauses: {summary['total_clauses']}")
+                        if summary.get('compliant_clauses') is not None:
+                            context_parts.append(f"Compliant Clauses: {summary['compliant_clauses']}")
+                        if summary.get('non_compliant_clauses') is not None:
+                            context_parts.append(f"Non-Compliant Clauses: {summary['non_compliant_clauses']}")
+
+                        if summary.get('key_findings'):
+                            context_parts.append(f"\nKey Findings:")
+                            for finding in summary['key_findings'][:3]:  # Limit to 3
+                                context_parts.append(f"- {finding}")
 
             context = "\n".join(context_parts)
 
@@ -3303,7 +3383,7 @@ You can also answer general questions about:
 - Risk assessment in contracts"""
 
         # Initialize Gemini
-        llm = ChatGoogleGenerativeAI(
+        llm = create_gemini_chat(
             model=settings.gemini_model,
             google_api_key=settings.google_api_key,
             temperature=0.7,
@@ -3341,7 +3421,7 @@ You can also answer general questions about:
 
 
 @app.get("/api/chat/{job_id}/context")
-async def get_chat_context(job_id: str):
+async def get_chat_context(job_id: str, db: DBSessionType = Depends(get_db)):
     """
     Debug endpoint to view the chat context for a job.
 
@@ -3351,21 +3431,19 @@ async def get_chat_context(job_id: str):
     Returns:
         The context that would be provided to the chatbot
     """
-    # Check if job exists
-    if job_id not in analysis_jobs:
+    # Check if job exists (results are persisted by the analysis worker)
+    db_job = db.query(DBAnalysisJob).filter(DBAnalysisJob.job_id == job_id).first()
+    if not db_job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = analysis_jobs[job_id]
-
     # Check if analysis is complete
-    if job.get("status") != "completed":
+    if db_job.status != "completed":
         return {
             "status": "incomplete",
             "message": "Analysis not yet completed"
         }
 
-    # Get analysis results - check both "result" and "results" keys
-    result = job.get("result") or job.get("results", {})
+    result = load_job_results(db_job) or {}
     analysis_results = result.get("analysis_results", [])
     summary = result.get("summary", {})
 
@@ -4534,12 +4612,8 @@ async def analyze_text_from_addin(
             )
             analysis_results = batch_result["analysis_results"]
         else:
-            # Single clause analysis fallback
-            classified_clauses = analyzer.clause_extractor.classify_all_clauses_sync(clauses)
-            analysis_results = []
-            for clause in classified_clauses:
-                result = analyzer.analyze_single_clause(clause)
-                analysis_results.append(result)
+            # Single clause analysis fallback (concurrent async calls)
+            analysis_results = await analyzer.analyze_clauses_async(clauses)
 
         # Map results to paragraph indices
         def find_paragraph_index(clause_text: str, paragraphs: List[str], word_indices: Optional[List[int]]) -> int:
@@ -4646,9 +4720,9 @@ async def analyze_text_from_addin(
             filename=f"Word_Document_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx",
             upload_path="",  # Word add-in doesn't upload files
             status="completed",
-            source="word_addin",
-            result_json=json.dumps(result_data)
+            source="word_addin"
         )
+        save_job_results(db_job, result_data)
         db.add(db_job)
         db.commit()
 
@@ -32,6 +32,7 @@ class Settings(BaseSettings):
     # Application Settings
     upload_dir: str = "./data/uploads"
     output_dir: str = "./data/outputs"
+    result_store_dir: str = "./data/results"  # Compressed analysis results (content-addressed)
     policies_dir: str = "./data/policies"
     max_file_size_mb: int = 50
 
@@ -50,6 +51,17 @@ class Settings(BaseSettings):
     chunk_size: int = 1000
     chunk_overlap: int = 200
     retrieval_k: int = 3  # Number of relevant policies to retrieve
+    vector_registry_warmup: bool = True  # Load shared embedding model + Chroma client at startup
+    query_embedding_cache_size: int = 2048  # In-memory LRU entries for query embeddings
+    query_embedding_cache_path: Optional[str] = "./data/cache/query_embeddings.sqlite"  # None/"" = memory only
+    ingestion_manifest_path: str = "./data/cache/ingestion_manifest.sqlite"  # File hashes + chunk embedding store
+    retrieval_cache_size: int = 1024  # Cached search result lists, invalidated per collection write (0 = off)
+    exact_search_max_chunks: int = 5000  # Collections up to this size use in-process exact search (0 = always Chroma)
+    exact_index_dir: str = "./data/cache/exact_index"  # Memory-mapped matrices for exact search
+    policy_type_detection: str = "local"  # "local" (embedding centroids, no LLM call) or "llm"
+    policy_type_min_similarity: float = 0.35  # Absolute cosine floor for a policy type to be selected
+    policy_type_relative_similarity: float = 0.85  # Also require score >= best score * this ratio
+    policy_type_min_types: int = 3  # Always keep at least this many top-scoring types
 
     # Regional Knowledge Base Configuration
     regional_kb_enabled: bool = True  # Enable/disable regional KB system
@@ -62,14 +74,46 @@ class Settings(BaseSettings):
     batch_chunk_threshold: int = 900000  # Token threshold for chunking
     rate_limit_retry_attempts: int = 3  # Retry attempts for rate limits
     requests_per_minute: int = 15  # RPM limit for free tier
-    requests_per_day: int = 250  # Daily quota for free tier
+    requests_per_day: int = 250  # Daily quota for free tier (shared by analysis and chat)
+    tokens_per_minute: int = 1000000  # Input + output TPM limit across all workers
+    llm_quota_path: str = "./data/cache/llm_quota.sqlite"  # Shared Gemini quota ledger (all processes)
+    batch_chunk_concurrency: int = 4  # Chunks of a large contract analyzed in parallel
+    batch_chunk_retry_attempts: int = 1  # Extra attempts for a failed chunk (other chunks are unaffected)
+    batch_streaming: bool = True  # Stream batch responses and report each clause as soon as it is decoded
+    batch_salvage_truncated: bool = True  # Keep complete clauses from truncated responses, re-request the rest
+    batch_salvage_max_depth: int = 3  # Follow-up levels when re-requesting missing clauses
+    clause_cache_enabled: bool = True  # Reuse analyses of identical clauses judged against the same policies
+    clause_cache_path: str = "./data/cache/clause_analyses.sqlite"  # Persistent clause analysis cache
+    clause_dedup_enabled: bool = True  # Analyze one representative per group of near-duplicate clauses
+    clause_dedup_threshold: float = 0.8  # Minimum shingle Jaccard similarity to join a group
+    default_output_tokens_per_clause: int = 450  # Prior for output tokens per clause before usage is learned
+    batch_truncation_probability: float = 0.02  # Target chance that a planned batch hits MAX_TOKENS
+    token_stats_path: str = "./data/cache/token_stats.sqlite"  # Learned token usage by clause length/type
+    single_clause_concurrency: int = 8  # Clauses analyzed in parallel when batch mode is off
+
+    # Report Rendering
+    report_rendering: str = "background"  # "background" (worker pool after analysis) or "lazy" (on first download)
+    report_workers: int = 2  # Report artifacts rendered in parallel
+
+    # Analysis Job Queue (run workers with: python -m src.worker)
+    analysis_worker_processes: int = 2  # Worker processes started by src.worker
+    job_queue_poll_interval: float = 2.0  # Seconds an idle worker waits before polling again
+    job_queue_visibility_timeout: int = 300  # Seconds a lease lasts without a heartbeat before another worker may take over
+    job_queue_max_attempts: int = 3  # Attempts per job before it is marked failed
+    job_queue_retry_backoff: int = 30  # Seconds before the first retry (doubles per attempt)
+    job_events_poll_interval: float = 1.0  # Seconds between event reads per watched job (SSE push)
+    job_events_stream_timeout: int = 1800  # Maximum seconds an event stream stays open
 
     # Embedding API Rate Limiting (Gemini Embedding API limits)
     # FREE TIER: 100 RPM, 1,000 RPD, 30,000 TPM
     # PAID TIER 1: 3,000 RPM, unlimited RPD, 1M TPM
     embedding_batch_size: int = 50  # Process embeddings in batches of N chunks
-    embedding_delay_seconds: float = 1.0  # Delay between embedding batches
     embedding_requests_per_minute: int = 100  # Gemini FREE tier: 100 RPM (paid: 3,000)
+    embedding_tokens_per_minute: int = 30000  # Gemini FREE tier: 30,000 TPM (paid: 1M)
+    embedding_max_concurrency: int = 4  # Embedding batches in flight at once
+    ingestion_workers: int = 0  # Extraction/chunking processes for directory ingestion (0 = CPU count)
+    ingestion_queue_size: int = 8  # Files buffered between ingestion stages (backpressure)
+    ingestion_write_batch_size: int = 500  # Chunks per ChromaDB upsert during directory ingestion
 
     model_config = SettingsConfigDict(
         env_file=".env",
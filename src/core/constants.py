@@ -188,3 +188,19 @@ def get_policy_types_dict() -> Dict[str, List[Dict[str, str]]]:
             for pt in POLICY_TYPES if pt.category == category
         ]
     return result
+
+
+# Contract policy types used to organise policy retrieval for contract analysis.
+# Descriptions seed the embedding centroids for local (zero-LLM) type detection.
+CONTRACT_POLICY_TYPES: Dict[str, str] = {
+    "liability": "limitation of liability, indemnification, damages caps, consequential loss exclusions",
+    "intellectual_property": "intellectual property ownership, licenses, patents, copyright, trademarks, work product",
+    "payment_terms": "payment terms, invoicing, fees, pricing, late payment interest, net days",
+    "termination": "termination for cause or convenience, notice periods, expiry, renewal, effects of termination",
+    "confidentiality": "confidential information, non-disclosure obligations, permitted disclosures",
+    "warranty": "warranties, representations, disclaimers, fitness for purpose, defects remedies",
+    "dispute_resolution": "governing law, jurisdiction, arbitration, mediation, dispute resolution procedures",
+    "delivery": "delivery, shipment, acceptance, title and risk of loss, logistics, lead times",
+    "data_protection": "personal data protection, privacy, GDPR, data processing, security breaches",
+    "compliance": "regulatory compliance, anti-bribery, export controls, sanctions, applicable laws",
+}
@@ -0,0 +1,325 @@
+"""Process-shared Gemini quota accounting (RPM / RPD / TPM) backed by SQLite."""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, List, Optional, Tuple
+
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QuotaExceededError(Exception):
+    """Raised when the daily request quota is used up."""
+
+
+class LLMQuotaManager:
+    """
+    Admit Gemini requests against quotas shared by every worker process.
+
+    Each admitted request is a row in a SQLite table (WAL mode) holding its
+    timestamp and token counts. Admission runs inside a BEGIN IMMEDIATE
+    transaction, so concurrent jobs, threads and uvicorn workers see one
+    rolling per-minute request/token window and one rolling 24h request
+    count. Token counts start as estimates and are corrected with the
+    response's usage metadata.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        requests_per_minute: int,
+        requests_per_day: int,
+        tokens_per_minute: int
+    ):
+        """
+        Initialize quota manager.
+
+        Args:
+            path: SQLite file shared by all workers
+            requests_per_minute: Requests allowed per rolling minute
+            requests_per_day: Requests allowed per rolling 24 hours
+            tokens_per_minute: Input + output tokens allowed per rolling minute
+        """
+        self.path = path
+        self.requests_per_minute = requests_per_minute
+        self.requests_per_day = requests_per_day
+        self.tokens_per_minute = tokens_per_minute
+
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_requests (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts REAL NOT NULL,
+                model TEXT NOT NULL,
+                input_tokens INTEGER NOT NULL DEFAULT 0,
+                output_tokens INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_requests_ts ON llm_requests (ts)")
+        logger.info(
+            f"LLM quota manager at {path} "
+            f"({requests_per_minute} RPM, {requests_per_day} RPD, {tokens_per_minute} TPM)"
+        )
+
+    def _try_reserve(self, model: str, estimated_tokens: int) -> Tuple[float, Optional[int]]:
+        """
+        Reserve one request if the quotas allow it.
+
+        Returns:
+            (0, reservation id) when admitted, else (seconds to wait, None)
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                self._conn.execute("DELETE FROM llm_requests WHERE ts < ?", (now - 86400,))
+
+                day_count, day_oldest = self._conn.execute(
+                    "SELECT COUNT(*), MIN(ts) FROM llm_requests"
+                ).fetchone()
+                if day_count >= self.requests_per_day:
+                    reset_hours = (day_oldest + 86400 - now) / 3600
+                    raise QuotaExceededError(
+                        f"Daily quota exceeded ({day_count}/{self.requests_per_day}). "
+                        f"Resets in {reset_hours:.1f} hours"
+                    )
+
+                minute_rows = self._conn.execute(
+                    "SELECT ts, input_tokens + output_tokens FROM llm_requests WHERE ts > ? ORDER BY ts",
+                    (now - 60,)
+                ).fetchall()
+                wait = self._window_wait(minute_rows, now, estimated_tokens)
+                if wait > 0:
+                    self._conn.execute("COMMIT")
+                    return wait, None
+
+                cursor = self._conn.execute(
+                    "INSERT INTO llm_requests (ts, model, input_tokens) VALUES (?, ?, ?)",
+                    (now, model, estimated_tokens)
+                )
+                self._conn.execute("COMMIT")
+                return 0.0, cursor.lastrowid
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _window_wait(self, rows: List[Tuple[float, int]], now: float, estimated_tokens: int) -> float:
+        """Seconds until the rolling minute has room for one more request."""
+        wait = 0.0
+        if len(rows) >= self.requests_per_minute:
+            # The request that must expire to free a slot
+            wait = rows[len(rows) - self.requests_per_minute][0] + 60 - now
+
+        used = sum(tokens for _, tokens in rows)
+        if rows and used + estimated_tokens > self.tokens_per_minute:
+            # Wait until enough of the oldest requests have expired
+            for ts, tokens in rows:
+                used -= tokens
+                if used + estimated_tokens <= self.tokens_per_minute:
+                    wait = max(wait, ts + 60 - now)
+                    break
+            else:
+                wait = max(wait, rows[-1][0] + 60 - now)
+
+        return max(wait, 0.0)
+
+    def acquire(self, model: str, estimated_tokens: int = 0) -> int:
+        """
+        Block until a request may be sent.
+
+        Args:
+            model: Model name (recorded for reporting)
+            estimated_tokens: Estimated input tokens for the TPM window
+
+        Returns:
+            Reservation id to pass to record_usage()
+
+        Raises:
+            QuotaExceededError: If the daily quota is used up
+        """
+        while True:
+            wait, reservation = self._try_reserve(model, estimated_tokens)
+            if reservation is not None:
+                return reservation
+            logger.info(f"⏳ LLM quota reached. Waiting {wait:.1f}s")
+            time.sleep(wait)
+
+    async def acquire_async(self, model: str, estimated_tokens: int = 0) -> int:
+        """
+        Wait (without blocking the event loop) until a request may be sent.
+
+        Args:
+            model: Model name (recorded for reporting)
+            estimated_tokens: Estimated input tokens for the TPM window
+
+        Returns:
+            Reservation id to pass to record_usage()
+
+        Raises:
+            QuotaExceededError: If the daily quota is used up
+        """
+        while True:
+            wait, reservation = await asyncio.to_thread(self._try_reserve, model, estimated_tokens)
+            if reservation is not None:
+                return reservation
+            logger.info(f"⏳ LLM quota reached. Waiting {wait:.1f}s")
+            await asyncio.sleep(wait)
+
+    def record_usage(self, reservation: int, input_tokens: int, output_tokens: int):
+        """
+        Replace a reservation's estimate with the actual token usage.
+
+        Args:
+            reservation: Id returned by acquire()
+            input_tokens: Prompt tokens reported by the API
+            output_tokens: Candidate tokens reported by the API
+        """
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "UPDATE llm_requests SET input_tokens = ?, output_tokens = ? WHERE id = ?",
+                    (input_tokens, output_tokens, reservation)
+                )
+            except sqlite3.Error as e:
+                logger.debug(f"LLM usage update failed: {e}")
+
+    def usage(self) -> dict:
+        """
+        Get current usage across all workers.
+
+        Returns:
+            Dictionary with per-minute requests/tokens and per-day requests
+        """
+        now = time.time()
+        with self._lock:
+            minute_requests, minute_tokens = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(input_tokens + output_tokens), 0) FROM llm_requests WHERE ts > ?",
+                (now - 60,)
+            ).fetchone()
+            day_requests = self._conn.execute(
+                "SELECT COUNT(*) FROM llm_requests WHERE ts > ?", (now - 86400,)
+            ).fetchone()[0]
+        return {
+            "requests_last_minute": minute_requests,
+            "tokens_last_minute": minute_tokens,
+            "requests_last_day": day_requests,
+            "requests_per_minute": self.requests_per_minute,
+            "requests_per_day": self.requests_per_day,
+            "tokens_per_minute": self.tokens_per_minute
+        }
+
+
+# Global instance (lazy initialization)
+_quota_manager: Optional[LLMQuotaManager] = None
+_quota_manager_lock = threading.Lock()
+
+
+def get_llm_quota_manager() -> LLMQuotaManager:
+    """
+    Get the LLM quota manager for this process (state is shared via SQLite).
+
+    Returns:
+        LLMQuotaManager singleton instance
+    """
+    global _quota_manager
+    if _quota_manager is None:
+        with _quota_manager_lock:
+            if _quota_manager is None:
+                _quota_manager = LLMQuotaManager(
+                    path=settings.llm_quota_path,
+                    requests_per_minute=settings.requests_per_minute,
+                    requests_per_day=settings.requests_per_day,
+                    tokens_per_minute=settings.tokens_per_minute
+                )
+    return _quota_manager
+
+
+def _estimate_input_tokens(messages: List[Any]) -> int:
+    """Rough prompt size (1 token ≈ 4 characters)."""
+    return sum(len(str(getattr(message, "content", message))) for message in messages) // 4
+
+
+def _usage_counts(usage: Optional[dict]) -> Tuple[int, int]:
+    """Extract (input, output) token counts from LangChain usage metadata."""
+    if not usage:
+        return 0, 0
+    return usage.get("input_tokens", 0) or 0, usage.get("output_tokens", 0) or 0
+
+
+class QuotaChatGoogleGenerativeAI(ChatGoogleGenerativeAI):
+    """
+    ChatGoogleGenerativeAI that admits every call through the shared quota.
+
+    invoke/ainvoke/stream/astream all funnel into the methods below, so a
+    call site only has to construct this class (see create_gemini_chat).
+    """
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        quota = get_llm_quota_manager()
+        reservation = quota.acquire(self.model, _estimate_input_tokens(messages))
+        result = super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        message = result.generations[0].message if result.generations else None
+        quota.record_usage(reservation, *_usage_counts(getattr(message, "usage_metadata", None)))
+        return result
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        quota = get_llm_quota_manager()
+        reservation = await quota.acquire_async(self.model, _estimate_input_tokens(messages))
+        result = await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        message = result.generations[0].message if result.generations else None
+        quota.record_usage(reservation, *_usage_counts(getattr(message, "usage_metadata", None)))
+        return result
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs) -> Iterator[Any]:
+        quota = get_llm_quota_manager()
+        reservation = quota.acquire(self.model, _estimate_input_tokens(messages))
+        input_tokens = output_tokens = 0
+        try:
+            for chunk in super()._stream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                chunk_input, chunk_output = _usage_counts(getattr(chunk.message, "usage_metadata", None))
+                input_tokens += chunk_input
+                output_tokens += chunk_output
+                yield chunk
+        finally:
+            quota.record_usage(reservation, input_tokens, output_tokens)
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs) -> AsyncIterator[Any]:
+        quota = get_llm_quota_manager()
+        reservation = await quota.acquire_async(self.model, _estimate_input_tokens(messages))
+        input_tokens = output_tokens = 0
+        try:
+            async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                chunk_input, chunk_output = _usage_counts(getattr(chunk.message, "usage_metadata", None))
+                input_tokens += chunk_input
+                output_tokens += chunk_output
+                yield chunk
+        finally:
+            quota.record_usage(reservation, input_tokens, output_tokens)
+
+
+def create_gemini_chat(**kwargs: Any) -> ChatGoogleGenerativeAI:
+    """
+    Create a Gemini chat model whose calls count against the shared quota.
+
+    Args:
+        **kwargs: ChatGoogleGenerativeAI arguments (model and API key default
+            to the configured ones)
+
+    Returns:
+        Quota-managed chat model
+    """
+    kwargs.setdefault("model", settings.gemini_model)
+    kwargs.setdefault("google_api_key", settings.google_api_key)
+    return QuotaChatGoogleGenerativeAI(**kwargs)
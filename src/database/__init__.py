@@ -2,7 +2,8 @@
 
 from .database import Base, engine, SessionLocal, get_db, init_db
 from .models import (
-    User, Session, AnalysisJob, Negotiation, NegotiationMessage,
+    User, Session, AnalysisJob, AnalysisJobEvent, AnalysisStatusPayload, JobQueueItem,
+    Negotiation, NegotiationMessage,
     Document, DocumentVersion, DocumentComment, DocumentChange, DocumentCollaborator
 )
 
@@ -15,6 +16,9 @@ __all__ = [
     "User",
     "Session",
     "AnalysisJob",
+    "AnalysisJobEvent",
+    "AnalysisStatusPayload",
+    "JobQueueItem",
     "Negotiation",
     "NegotiationMessage",
     "Document",
@@ -0,0 +1,136 @@
+"""
+Migration: Move analysis results out of analysis_jobs.result_json
+
+This migration adds the result_key and summary columns to analysis_jobs,
+writes every job's result_json to the compressed result store, fills in
+the summary columns and clears result_json. Safe to run multiple times.
+
+Usage:
+    python -m src.database.migrations.move_results_to_store
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+import logging
+
+from ..database import DATABASE_PATH
+from ...services.result_store import get_result_store, summarize_results
+
+logger = logging.getLogger(__name__)
+
+NEW_COLUMNS = {
+    "result_key": "VARCHAR",
+    "total_clauses": "INTEGER",
+    "compliant_clauses": "INTEGER",
+    "non_compliant_clauses": "INTEGER",
+    "compliance_rate": "FLOAT",
+    "overall_risk": "VARCHAR",
+}
+
+BATCH_SIZE = 100
+
+
+def migrate_results_to_store(db_path: str = DATABASE_PATH):
+    """
+    Move result_json of analysis_jobs to the result store.
+
+    Args:
+        db_path: Path to SQLite database file
+    """
+    if not Path(db_path).exists():
+        logger.info(f"Database file not found: {db_path}. Nothing to migrate.")
+        return
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='analysis_jobs'")
+        if not cursor.fetchone():
+            logger.info("Table analysis_jobs doesn't exist yet. Skipping migration.")
+            return
+
+        # Add result key and summary columns
+        cursor.execute("PRAGMA table_info(analysis_jobs)")
+        columns = [row[1] for row in cursor.fetchall()]
+        for name, column_type in NEW_COLUMNS.items():
+            if name not in columns:
+                logger.info(f"Adding '{name}' column to analysis_jobs table...")
+                cursor.execute(f"ALTER TABLE analysis_jobs ADD COLUMN {name} {column_type}")
+
+        # Same index names as the SQLAlchemy models create
+        logger.info("Creating indexes on result key and summary columns...")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS ix_analysis_jobs_result_key
+            ON analysis_jobs(result_key)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS ix_analysis_jobs_compliance_rate
+            ON analysis_jobs(compliance_rate)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS ix_analysis_jobs_overall_risk
+            ON analysis_jobs(overall_risk)
+        """)
+        conn.commit()
+
+        # Move results in batches so large databases don't hold everything in memory
+        store = get_result_store()
+        moved = 0
+        while True:
+            cursor.execute(
+                "SELECT job_id, result_json FROM analysis_jobs WHERE result_json IS NOT NULL LIMIT ?",
+                (BATCH_SIZE,)
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                break
+
+            for job_id, result_json in rows:
+                try:
+                    results = json.loads(result_json)
+                except json.JSONDecodeError:
+                    logger.warning(f"Unparseable result_json for job {job_id}; leaving it empty")
+                    cursor.execute("UPDATE analysis_jobs SET result_json = NULL WHERE job_id = ?", (job_id,))
+                    continue
+
+                summary = summarize_results(results) or {}
+                cursor.execute(
+                    """
+                    UPDATE analysis_jobs
+                    SET result_key = ?, result_json = NULL,
+                        total_clauses = ?, compliant_clauses = ?, non_compliant_clauses = ?,
+                        compliance_rate = ?, overall_risk = ?
+                    WHERE job_id = ?
+                    """,
+                    (
+                        store.put(results),
+                        summary.get("total_clauses"),
+                        summary.get("compliant_clauses"),
+                        summary.get("non_compliant_clauses"),
+                        summary.get("compliance_rate"),
+                        summary.get("overall_risk"),
+                        job_id
+                    )
+                )
+                moved += 1
+
+            conn.commit()
+
+        if moved:
+            logger.info(f"Moved results of {moved} jobs to {store.root}; reclaiming space...")
+            cursor.execute("VACUUM")
+        logger.info("Migration completed successfully!")
+
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"Migration failed: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    migrate_results_to_store()
@@ -1,7 +1,8 @@
 """SQLAlchemy database models for persistent storage."""
 
+import json
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index, Boolean, Integer, LargeBinary
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index, Boolean, Integer, Float, LargeBinary
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -76,9 +77,17 @@ class AnalysisJob(Base):
     source = Column(String, nullable=False, default='web_upload', index=True)  # 'web_upload' or 'word_addin'
     created_at = Column(DateTime, default=datetime.now, nullable=False, index=True)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
-    result_json = Column(Text)  # Store full analysis results as JSON
+    result_key = Column(String, index=True)  # Key of the full results in the compressed result store
+    result_json = Column(Text)  # Legacy: full results as JSON (moved to the result store by migration)
     error = Column(Text)
 
+    # Result summary for listings (full results are never loaded for these)
+    total_clauses = Column(Integer)
+    compliant_clauses = Column(Integer)
+    non_compliant_clauses = Column(Integer)
+    compliance_rate = Column(Float, index=True)
+    overall_risk = Column(String, index=True)
+
     # Relationship
     user = relationship("User", back_populates="jobs")
 
@@ -98,6 +107,84 @@ class AnalysisJob(Base):
         }
 
 
+class JobQueueItem(Base):
+    """Durable work queue entry for background analysis (claimed by worker processes)."""
+
+    __tablename__ = "job_queue"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(String, ForeignKey("analysis_jobs.job_id", ondelete="CASCADE"), nullable=False, index=True)
+    task = Column(String, nullable=False, default="contract_analysis")
+    payload = Column(Text)  # JSON arguments for the task (e.g. region_code)
+    priority = Column(Integer, nullable=False, default=0)  # Higher runs first
+
+    # Status: queued, leased, done, dead
+    status = Column(String, nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    available_at = Column(DateTime, default=datetime.now, nullable=False)  # Not claimable before (retry backoff)
+
+    # Lease held by the worker running the task; expired leases are reclaimed
+    lease_token = Column(String, nullable=True, index=True)
+    lease_owner = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+
+    last_error = Column(Text)
+    progress_json = Column(Text)  # Live progress reported by the worker (JSON)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
+
+    def to_dict(self):
+        """Convert queue entry to dictionary."""
+        return {
+            "id": self.id,
+            "job_id": self.job_id,
+            "task": self.task,
+            "priority": self.priority,
+            "status": self.status,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "available_at": self.available_at.isoformat() if self.available_at else None,
+            "lease_owner": self.lease_owner,
+            "lease_expires_at": self.lease_expires_at.isoformat() if self.lease_expires_at else None,
+            "last_error": self.last_error,
+            "created_at": self.created_at.isoformat()
+        }
+
+
+class AnalysisJobEvent(Base):
+    """Progress event emitted while an analysis job runs (streamed to clients)."""
+
+    __tablename__ = "analysis_job_events"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(String, ForeignKey("analysis_jobs.job_id", ondelete="CASCADE"), nullable=False)
+    event = Column(String, nullable=False)  # e.g. queued, started, parsed, chunk_analyzed, summary, completed
+    data = Column(Text)  # JSON event details
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+
+    def to_dict(self):
+        """Convert event to dictionary."""
+        return {
+            "id": self.id,
+            "job_id": self.job_id,
+            "event": self.event,
+            "data": json.loads(self.data) if self.data else {},
+            "created_at": self.created_at.isoformat()
+        }
+
+
+class AnalysisStatusPayload(Base):
+    """Precomputed status response of a completed analysis job (gzip-compressed JSON)."""
+
+    __tablename__ = "analysis_status_payloads"
+
+    job_id = Column(String, ForeignKey("analysis_jobs.job_id", ondelete="CASCADE"), primary_key=True)
+    etag = Column(String, nullable=False)  # Content hash of the uncompressed JSON
+    payload = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+
+
 class Negotiation(Base):
     """Contract negotiation between two parties."""
 
@@ -571,6 +658,40 @@ class PolicyVersion(Base):
         }
 
 
+class PolicyEmbeddingJob(Base):
+    """Background embedding of a policy's sections (upload, update, save-generated)."""
+
+    __tablename__ = "policy_embedding_jobs"
+
+    job_id = Column(String, primary_key=True)
+    policy_id = Column(String, ForeignKey("policies.id", ondelete="CASCADE"), nullable=False, index=True)
+    company_id = Column(String, nullable=False, index=True)
+
+    # Status: queued, processing, completed, failed
+    status = Column(String, nullable=False, default="queued")
+    total_sections = Column(Integer, nullable=False, default=0)
+    embedded_sections = Column(Integer, nullable=False, default=0)
+    progress = Column(Integer, nullable=False, default=0)  # 0-100
+    error = Column(Text)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+    completed_at = Column(DateTime, nullable=True)
+
+    def to_dict(self):
+        """Convert embedding job to dictionary."""
+        return {
+            "job_id": self.job_id,
+            "policy_id": self.policy_id,
+            "company_id": self.company_id,
+            "status": self.status,
+            "total_sections": self.total_sections,
+            "embedded_sections": self.embedded_sections,
+            "progress": self.progress,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None
+        }
+
+
 # ===== Password Reset Models =====
 
 class PasswordResetToken(Base):
@@ -642,3 +763,7 @@ Index('idx_policy_versions_policy_version', PolicyVersion.policy_id, PolicyVersi
 Index('idx_password_reset_tokens_hash', PasswordResetToken.token_hash)
 Index('idx_password_reset_tokens_user_expires', PasswordResetToken.user_id, PasswordResetToken.expires_at)
 Index('idx_password_reset_tokens_expires', PasswordResetToken.expires_at)
+
+# Job queue indexes
+Index('idx_job_events_job_id', AnalysisJobEvent.job_id, AnalysisJobEvent.id)
+Index('idx_job_queue_claim', JobQueueItem.status, JobQueueItem.priority.desc(), JobQueueItem.available_at)
@@ -2,7 +2,9 @@
 
 from .docx_parser import DocxParser
 from .clause_extractor import ClauseExtractor
+from .clause_deduplicator import ClauseDeduplicator
 from .docx_generator import DocxGenerator
 from .analysis_report_generator import AnalysisReportGenerator
+from .report_renderer import ReportRenderer, get_report_renderer
 
-__all__ = ["DocxParser", "ClauseExtractor", "DocxGenerator", "AnalysisReportGenerator"]
+__all__ = ["DocxParser", "ClauseExtractor", "ClauseDeduplicator", "DocxGenerator", "AnalysisReportGenerator", "ReportRenderer", "get_report_renderer"]
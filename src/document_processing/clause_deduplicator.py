@@ -0,0 +1,205 @@
+"""Near-duplicate clause detection with MinHash signatures and LSH banding."""
+
+import logging
+import random
+import re
+from collections import defaultdict
+from typing import Any, Dict, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"\w+")
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Clause fields that belong to the member itself and must survive result copying
+MEMBER_FIELDS = ("clause_id", "text", "paragraph_index", "style", "section_heading")
+
+
+class ClauseDeduplicator:
+    """
+    Group near-identical clauses so only one per group is sent to the model.
+
+    Clauses are turned into word shingles and MinHash signatures; LSH bands
+    propose candidate pairs and a candidate joins a group only if its exact
+    shingle Jaccard similarity with the group's representative clears the
+    threshold and both mention the same numbers (so "30 days" and "60 days"
+    are never merged).
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        shingle_size: int = 3,
+        num_perm: int = 64,
+        bands: int = 16,
+        seed: int = 1
+    ):
+        """
+        Initialize deduplicator.
+
+        Args:
+            threshold: Minimum Jaccard similarity to the representative
+            shingle_size: Words per shingle
+            num_perm: MinHash signature length (must be divisible by bands)
+            bands: LSH bands (more bands find less similar candidates)
+            seed: Seed for the hash permutations
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def _shingles(self, text: str) -> Set[str]:
+        """Return the set of word shingles of a clause."""
+        words = _WORD.findall(text.lower())
+        if len(words) <= self.shingle_size:
+            return {" ".join(words)}
+        return {
+            " ".join(words[i:i + self.shingle_size])
+            for i in range(len(words) - self.shingle_size + 1)
+        }
+
+    def _signature(self, shingles: Set[str]) -> Tuple[int, ...]:
+        """Compute the MinHash signature of a shingle set."""
+        hashes = [hash(shingle) & _MAX_HASH for shingle in shingles]
+        return tuple(
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+            for a, b in self._permutations
+        )
+
+    @staticmethod
+    def _jaccard(a: Set[str], b: Set[str]) -> float:
+        """Exact Jaccard similarity of two sets."""
+        if not a and not b:
+            return 1.0
+        return len(a & b) / len(a | b)
+
+    def group(self, clauses: List[Dict[str, Any]]) -> List[List[int]]:
+        """
+        Group near-duplicate clauses.
+
+        Args:
+            clauses: Extracted clauses (with "text")
+
+        Returns:
+            Groups of clause indexes in document order; the first index of
+            each group is its representative
+        """
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+        groups: List[List[int]] = []
+        group_of_rep: Dict[int, int] = {}
+        shingle_sets: List[Set[str]] = []
+        numbers: List[Tuple[str, ...]] = []
+
+        for i, clause in enumerate(clauses):
+            text = clause.get("text", "")
+            shingles = self._shingles(text)
+            shingle_sets.append(shingles)
+            numbers.append(tuple(sorted(_NUMBER.findall(text))))
+            signature = self._signature(shingles)
+            band_keys = [
+                (band, signature[band * self.rows:(band + 1) * self.rows])
+                for band in range(self.bands)
+            ]
+
+            candidates = sorted({rep for key in band_keys for rep in buckets.get(key, ())})
+            match = next(
+                (
+                    rep for rep in candidates
+                    if numbers[rep] == numbers[i]
+                    and self._jaccard(shingles, shingle_sets[rep]) >= self.threshold
+                ),
+                None
+            )
+
+            if match is not None:
+                groups[group_of_rep[match]].append(i)
+                continue
+
+            # New representative: only representatives are indexed, so groups never chain
+            group_of_rep[i] = len(groups)
+            groups.append([i])
+            for key in band_keys:
+                buckets[key].append(i)
+
+        return groups
+
+    def collapse(
+        self,
+        clauses: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[List[int]]]:
+        """
+        Reduce clauses to one representative per near-duplicate group.
+
+        Args:
+            clauses: Extracted clauses
+
+        Returns:
+            Tuple of (representative clauses, groups aligned with them)
+        """
+        groups = self.group(clauses)
+        representatives = [clauses[members[0]] for members in groups]
+
+        collapsed = len(clauses) - len(representatives)
+        if collapsed:
+            logger.info(
+                f"🧬 Collapsed {collapsed} near-duplicate clauses "
+                f"({len(clauses)} -> {len(representatives)} to analyze)"
+            )
+        return representatives, groups
+
+    @staticmethod
+    def copy_result(result: Dict[str, Any], member: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy a representative's analysis onto another group member.
+
+        Args:
+            result: Analysis result of the representative
+            member: Member clause
+
+        Returns:
+            Result carrying the member's own identity fields
+        """
+        if result.get("clause_id") == member.get("clause_id"):
+            return result
+
+        copied = {**result, "duplicate_of": result.get("clause_id")}
+        for field in MEMBER_FIELDS:
+            if field in member:
+                copied[field] = member[field]
+        return copied
+
+    def expand(
+        self,
+        results: List[Dict[str, Any]],
+        clauses: List[Dict[str, Any]],
+        groups: List[List[int]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fan representative results back out to every clause.
+
+        Args:
+            results: Results aligned with the representatives
+            clauses: Original clauses
+            groups: Groups from collapse()
+
+        Returns:
+            Results aligned with the original clauses
+        """
+        expanded: List[Dict[str, Any]] = [None] * len(clauses)
+        for result, members in zip(results, groups):
+            for index in members:
+                expanded[index] = self.copy_result(result, clauses[index])
+        return expanded
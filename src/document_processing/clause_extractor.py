@@ -1,11 +1,12 @@
 """Extract and classify contract clauses."""
 
+import asyncio
 import logging
 import json
 from typing import List, Dict, Any
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 from ..core.config import settings
+from ..core.llm_quota import create_gemini_chat
 from ..core.prompts import CLAUSE_TYPE_CLASSIFIER_PROMPT
 
 logger = logging.getLogger(__name__)
@@ -16,7 +17,7 @@ class ClauseExtractor:
 
     def __init__(self):
         """Initialize clause extractor with Gemini model."""
-        self.llm = ChatGoogleGenerativeAI(
+        self.llm = create_gemini_chat(
             model=settings.gemini_model,
             google_api_key=settings.google_api_key,
             temperature=settings.temperature
@@ -158,7 +159,7 @@ class ClauseExtractor:
         clauses: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """
-        Classify all clauses in a contract.
+        Classify all clauses in a contract concurrently.
 
         Args:
             clauses: List of extracted clauses
@@ -166,16 +167,17 @@ class ClauseExtractor:
         Returns:
             Clauses with classification information added
         """
-        classified_clauses = []
-
-        for clause in clauses:
-            classification = await self.classify_clause(clause["text"])
+        semaphore = asyncio.Semaphore(max(1, settings.single_clause_concurrency))
 
-            classified_clause = {
+        async def classify(clause: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                classification = await self.classify_clause(clause["text"])
+            return {
                 **clause,
                 "classification": classification
             }
-            classified_clauses.append(classified_clause)
+
+        classified_clauses = list(await asyncio.gather(*(classify(clause) for clause in clauses)))
 
         logger.info(f"Classified {len(classified_clauses)} clauses")
         return classified_clauses
@@ -0,0 +1,216 @@
+"""Background and on-demand rendering of analysis report artifacts."""
+
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from .docx_generator import DocxGenerator
+from .analysis_report_generator import AnalysisReportGenerator
+
+logger = logging.getLogger(__name__)
+
+REPORT_TYPES = ("reviewed", "detailed", "html")
+
+
+def artifact_paths(output_path: str) -> Dict[str, str]:
+    """
+    Map each report type to its file path.
+
+    Args:
+        output_path: Path of the reviewed contract (.docx)
+
+    Returns:
+        Dictionary of report type to path
+    """
+    return {
+        "reviewed": output_path,
+        "detailed": output_path.replace(".docx", "_DETAILED_REPORT.docx"),
+        "html": output_path.replace(".docx", "_SUMMARY.html")
+    }
+
+
+def render_reviewed_document(
+    contract_path: str,
+    analysis_results: Any,
+    summary: Dict[str, Any],
+    output_path: str
+):
+    """Render the tracked-changes review document."""
+    generator = DocxGenerator(contract_path)
+    generator.add_summary_page(summary)
+    generator.create_review_document(
+        analysis_results=analysis_results,
+        output_path=output_path
+    )
+
+
+def _render_detailed_report(contract_path: str, results: Dict[str, Any], output_path: str):
+    """Render the detailed analysis report."""
+    AnalysisReportGenerator().generate_detailed_report(
+        analysis_results=results.get("analysis_results", []),
+        summary=results.get("summary", {}),
+        contract_info=results.get("contract_info", {}),
+        output_path=output_path
+    )
+
+
+def _render_html_summary(contract_path: str, results: Dict[str, Any], output_path: str):
+    """Render the HTML changes summary."""
+    AnalysisReportGenerator().generate_changes_summary_html(
+        analysis_results=results.get("analysis_results", []),
+        output_path=output_path
+    )
+
+
+_RENDERERS: Dict[str, Callable[[str, Dict[str, Any], str], None]] = {
+    "reviewed": lambda contract_path, results, path: render_reviewed_document(
+        contract_path, results.get("analysis_results", []), results.get("summary", {}), path
+    ),
+    "detailed": _render_detailed_report,
+    "html": _render_html_summary,
+}
+
+
+class ReportRenderer:
+    """
+    Render report artifacts off the analysis critical path.
+
+    Artifacts are rendered concurrently on a worker pool, or lazily when
+    first requested, and cached on disk next to the reviewed contract.
+    Each artifact is written to a temporary file and renamed into place, so
+    a file that exists is always complete; concurrent requests for the same
+    artifact share one render.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        """
+        Initialize renderer.
+
+        Args:
+            max_workers: Artifacts rendered at the same time
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="report")
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def render(self, report_type: str, contract_path: str, results: Dict[str, Any], output_path: str) -> str:
+        """
+        Render one artifact now unless it is already cached on disk.
+
+        Args:
+            report_type: One of REPORT_TYPES
+            contract_path: Original uploaded contract
+            results: Analysis results (contract_info, summary, analysis_results)
+            output_path: Path of the reviewed contract
+
+        Returns:
+            Path of the artifact
+        """
+        path = artifact_paths(output_path)[report_type]
+        if Path(path).exists():
+            return path
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            _RENDERERS[report_type](contract_path, results, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        logger.info(f"📊 Rendered {report_type} report: {path}")
+        return path
+
+    def submit(self, report_type: str, contract_path: str, results: Dict[str, Any], output_path: str) -> Future:
+        """
+        Queue an artifact for rendering (reusing an in-flight render).
+
+        Returns:
+            Future resolving to the artifact path
+        """
+        path = artifact_paths(output_path)[report_type]
+        with self._lock:
+            future = self._inflight.get(path)
+            if future is not None:
+                return future
+
+            future = self._executor.submit(self.render, report_type, contract_path, results, output_path)
+            self._inflight[path] = future
+
+        def forget(done: Future):
+            with self._lock:
+                if self._inflight.get(path) is done:
+                    del self._inflight[path]
+            if done.exception() is not None:
+                logger.error(f"Rendering {report_type} report failed: {done.exception()}")
+
+        future.add_done_callback(forget)
+        return future
+
+    def submit_all(self, contract_path: str, results: Dict[str, Any], output_path: str) -> Dict[str, Future]:
+        """
+        Queue every artifact of an analysis.
+
+        Returns:
+            Dictionary of report type to future
+        """
+        return {
+            report_type: self.submit(report_type, contract_path, results, output_path)
+            for report_type in REPORT_TYPES
+        }
+
+    def ensure(
+        self,
+        report_type: str,
+        contract_path: str,
+        results: Dict[str, Any],
+        output_path: str,
+        timeout: Optional[float] = None
+    ) -> str:
+        """
+        Return an artifact's path, rendering it (or waiting for it) if needed.
+
+        Args:
+            report_type: One of REPORT_TYPES
+            contract_path: Original uploaded contract
+            results: Analysis results
+            output_path: Path of the reviewed contract
+            timeout: Maximum seconds to wait for the render
+
+        Returns:
+            Path of the artifact
+        """
+        path = artifact_paths(output_path)[report_type]
+        if Path(path).exists():
+            return path
+        return self.submit(report_type, contract_path, results, output_path).result(timeout=timeout)
+
+    def shutdown(self):
+        """Stop the worker pool (pending renders are finished first)."""
+        self._executor.shutdown(wait=True)
+
+
+# Global instance (lazy initialization)
+_renderer: Optional[ReportRenderer] = None
+_renderer_lock = threading.Lock()
+
+
+def get_report_renderer() -> ReportRenderer:
+    """
+    Get the process-wide report renderer.
+
+    Returns:
+        ReportRenderer singleton instance
+    """
+    global _renderer
+    if _renderer is None:
+        with _renderer_lock:
+            if _renderer is None:
+                from ..core.config import settings
+                _renderer = ReportRenderer(max_workers=settings.report_workers)
+    return _renderer
@@ -1,7 +1,20 @@
-"""Script to ingest policies and laws into ChromaDB vector store."""
+"""
+Script to ingest policies and laws into ChromaDB vector store.
+
+Usage:
+    python src/scripts/ingest_policies.py
+
+    # Tune the ingestion pipeline
+    python src/scripts/ingest_policies.py --workers 8 --queue-size 16 --write-batch-size 1000
+
+    # Ingest a single directory
+    python src/scripts/ingest_policies.py --directory data/laws --source-type law
+"""
 
 import sys
+import time
 import logging
+import argparse
 from pathlib import Path
 
 # Add parent directory to path
@@ -18,20 +31,85 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Ingest policies and laws into ChromaDB")
+    parser.add_argument(
+        "--directory",
+        default=None,
+        help="Ingest only this directory (default: data/policies and data/laws)"
+    )
+    parser.add_argument(
+        "--source-type",
+        default="policy",
+        choices=["policy", "law"],
+        help="Source type recorded for --directory (default: policy)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Extraction/chunking processes (default: {settings.ingestion_workers or 'CPU count'})"
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=None,
+        help=f"Files buffered between pipeline stages (default: {settings.ingestion_queue_size})"
+    )
+    parser.add_argument(
+        "--write-batch-size",
+        type=int,
+        default=None,
+        help=f"Chunks per ChromaDB upsert (default: {settings.ingestion_write_batch_size})"
+    )
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Do not prompt; keep existing data and ingest incrementally"
+    )
+    return parser.parse_args()
+
+
+def print_throughput(embeddings: PolicyEmbeddings, elapsed: float):
+    """Print per-directory pipeline stats and overall chunks/sec."""
+    total_chunks = 0
+    for directory, stats in embeddings.last_ingestion_stats.items():
+        total_chunks += stats["chunks_added"]
+        print(
+            f"   - {directory}: {stats['chunks_added']} chunks from {stats['files']} files "
+            f"in {stats['seconds']}s ({stats['chunks_per_second']} chunks/sec; "
+            f"{stats['skipped']} unchanged, {stats['failed']} failed)"
+        )
+
+    rate = total_chunks / elapsed if elapsed > 0 else 0.0
+    print(f"   - Overall: {total_chunks} chunks in {elapsed:.1f}s ({rate:.1f} chunks/sec)")
+
+
 def main():
     """Main function to ingest policies."""
+    args = parse_args()
+
+    # Override pipeline settings with command line arguments if provided
+    if args.workers is not None:
+        settings.ingestion_workers = args.workers
+    if args.queue_size is not None:
+        settings.ingestion_queue_size = args.queue_size
+    if args.write_batch_size is not None:
+        settings.ingestion_write_batch_size = args.write_batch_size
+
     print("=" * 60)
     print("AI Legal Assistant - Policy Ingestion")
     print("=" * 60)
     print()
 
     # Check if policy directories exist
-    policies_dir = Path("data/policies")
+    policies_dir = Path(args.directory or "data/policies")
     laws_dir = Path("data/laws")
 
     if not policies_dir.exists():
         print(f"❌ Policies directory not found: {policies_dir}")
-        print("   Create the directory and add your policy files (.txt or .md)")
+        print("   Create the directory and add your policy files (.txt, .md or .pdf)")
         return
 
     if not laws_dir.exists():
@@ -40,8 +118,8 @@ def main():
         laws_dir.mkdir(parents=True, exist_ok=True)
 
     # Count files
-    policy_files = list(policies_dir.glob("*.txt")) + list(policies_dir.glob("*.md"))
-    law_files = list(laws_dir.glob("*.txt")) + list(laws_dir.glob("*.md"))
+    policy_files = [f for ext in ("*.txt", "*.md", "*.pdf") for f in policies_dir.glob(ext)]
+    law_files = [f for ext in ("*.txt", "*.md", "*.pdf") for f in laws_dir.glob(ext)]
 
     print(f"📁 Found {len(policy_files)} policy files in {policies_dir}")
     print(f"📁 Found {len(law_files)} law files in {laws_dir}")
@@ -50,7 +128,7 @@ def main():
     if len(policy_files) == 0 and len(law_files) == 0:
         print("❌ No policy or law files found!")
         print()
-        print("Add .txt or .md files to:")
+        print("Add .txt, .md or .pdf files to:")
         print(f"  - {policies_dir.absolute()}")
         print(f"  - {laws_dir.absolute()}")
         print()
@@ -71,7 +149,7 @@ def main():
 
     # Check if collection already has data
     stats = embeddings.get_collection_stats()
-    if stats["total_documents"] > 0:
+    if stats["total_documents"] > 0 and not args.yes:
         print(f"⚠️  Collection already contains {stats['total_documents']} documents")
         response = input("Clear and re-ingest? (yes/no): ").strip().lower()
         if response == "yes":
@@ -86,7 +164,14 @@ def main():
     print()
 
     try:
-        results = embeddings.ingest_policies()
+        started = time.perf_counter()
+        if args.directory:
+            results = {
+                args.source_type: embeddings.ingest_policy_directory(args.directory, args.source_type)
+            }
+        else:
+            results = embeddings.ingest_policies()
+        elapsed = time.perf_counter() - started
 
         print()
         print("=" * 60)
@@ -94,11 +179,15 @@ def main():
         print("=" * 60)
         print()
         print(f"📊 Results:")
-        print(f"   - Policies ingested: {results['policies']} chunks")
-        print(f"   - Laws ingested: {results['laws']} chunks")
+        for source, count in results.items():
+            print(f"   - {source.capitalize()} ingested: {count} chunks")
         print(f"   - Total: {sum(results.values())} chunks")
         print()
 
+        print(f"⚡ Throughput:")
+        print_throughput(embeddings, elapsed)
+        print()
+
         # Get final stats
         final_stats = embeddings.get_collection_stats()
         print(f"📈 Vector Store Stats:")
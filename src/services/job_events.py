@@ -0,0 +1,261 @@
+"""Analysis job progress events: persisted by workers, pushed to clients by the API."""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session as DBSession
+
+from ..core.config import settings
+from ..database import SessionLocal
+from ..database.models import AnalysisJobEvent
+
+logger = logging.getLogger(__name__)
+
+# Clause analysis spans this progress range; the other stages have fixed steps
+ANALYSIS_START = 15
+ANALYSIS_END = 80
+
+STAGE_PROGRESS = {
+    "queued": 0,
+    "started": 5,
+    "parsed": 10,
+    "policies_retrieved": ANALYSIS_START,
+    "analysis_complete": ANALYSIS_END,
+    "summary": 90,
+    "completed": 100,
+}
+
+STAGE_MESSAGES = {
+    "queued": "Waiting for an analysis worker...",
+    "started": "Parsing contract structure...",
+    "parsed": "Retrieving relevant policies...",
+    "policies_retrieved": "Analyzing clauses...",
+    "chunk_analyzed": "Analyzing clauses...",
+    "analysis_complete": "Generating executive summary...",
+    "summary": "Finalizing analysis...",
+    "retrying": "Retrying analysis...",
+    "completed": "Analysis complete!",
+}
+
+
+def analysis_progress(done: int, total: int) -> int:
+    """Progress percentage after done of total clause analysis units."""
+    if not total:
+        return ANALYSIS_START
+    return ANALYSIS_START + int((ANALYSIS_END - ANALYSIS_START) * min(done, total) / total)
+
+
+def event_progress(event: str, data: Dict[str, Any]) -> Optional[int]:
+    """Progress percentage reached by an event (None if it carries none)."""
+    if event == "chunk_analyzed":
+        return analysis_progress(data.get("chunk", 0), data.get("chunks", 0))
+    return STAGE_PROGRESS.get(event)
+
+
+class JobEventService:
+    """Record and read analysis job progress events."""
+
+    def __init__(self, db: DBSession):
+        """Initialize job event service with database session."""
+        self.db = db
+
+    def record(self, job_id: str, event: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Persist an event for a job.
+
+        Args:
+            job_id: Analysis job ID
+            event: Event name
+            data: JSON-serializable event details
+
+        Returns:
+            The stored event as a dictionary
+        """
+        row = AnalysisJobEvent(job_id=job_id, event=event, data=json.dumps(data or {}))
+        self.db.add(row)
+        self.db.commit()
+        return row.to_dict()
+
+    def list_after(self, job_id: str, after_id: int = 0, limit: int = 500) -> List[Dict[str, Any]]:
+        """
+        Get the events of a job newer than an event ID.
+
+        Args:
+            job_id: Analysis job ID
+            after_id: Last event ID already seen
+            limit: Maximum number of events
+
+        Returns:
+            Events in order
+        """
+        rows = (
+            self.db.query(AnalysisJobEvent)
+            .filter(AnalysisJobEvent.job_id == job_id, AnalysisJobEvent.id > after_id)
+            .order_by(AnalysisJobEvent.id)
+            .limit(limit)
+            .all()
+        )
+        return [row.to_dict() for row in rows]
+
+    def current_stage(self, job_id: str) -> Dict[str, Any]:
+        """
+        Summarize the progress of the job's latest attempt.
+
+        Returns:
+            Dictionary with stage (last event), progress (0-100) and message
+        """
+        last_start = (
+            self.db.query(AnalysisJobEvent.id)
+            .filter(AnalysisJobEvent.job_id == job_id, AnalysisJobEvent.event == "started")
+            .order_by(AnalysisJobEvent.id.desc())
+            .first()
+        )
+        events = self.list_after(job_id, after_id=(last_start[0] - 1) if last_start else 0)
+
+        stage = None
+        progress = 0
+        for event in events:
+            stage = event["event"]
+            progress = max(progress, event_progress(stage, event["data"]) or 0)
+
+        return {
+            "stage": stage,
+            "progress": progress,
+            "message": STAGE_MESSAGES.get(stage, "")
+        }
+
+
+def emit_job_event(job_id: str, event: str, **data: Any):
+    """
+    Record a job event from a worker thread (opens its own session).
+
+    Errors are logged and swallowed so progress reporting never fails a job.
+
+    Args:
+        job_id: Analysis job ID
+        event: Event name
+        **data: Event details
+    """
+    db = SessionLocal()
+    try:
+        JobEventService(db).record(job_id, event, data)
+    except Exception as e:
+        logger.debug(f"Failed to record {event} event for job {job_id}: {e}")
+    finally:
+        db.close()
+
+
+class JobEventBroker:
+    """
+    Fan job events out to every connected subscriber in this API process.
+
+    One poller per job reads new events from the database, however many
+    clients are watching it, and pushes them to each subscriber's queue.
+    Pollers stop when their last subscriber leaves.
+    """
+
+    def __init__(self, poll_interval: float = 1.0):
+        """
+        Initialize broker.
+
+        Args:
+            poll_interval: Seconds between database reads per watched job
+        """
+        self.poll_interval = poll_interval
+        # Queue -> last event ID its subscriber had already seen when subscribing
+        self._subscribers: Dict[str, Dict[asyncio.Queue, int]] = {}
+        self._pollers: Dict[str, asyncio.Task] = {}
+
+    def subscribe(self, job_id: str, after_id: int = 0) -> asyncio.Queue:
+        """
+        Start receiving the events of a job.
+
+        A new poller starts after the smallest after_id of its subscribers,
+        so events committed while a subscriber reads its backlog are still
+        pushed (subscribers drop the ones they have already seen by ID).
+
+        Args:
+            job_id: Analysis job ID
+            after_id: Last event ID the subscriber has seen (or will read
+                through backlog())
+
+        Returns:
+            Queue receiving event dictionaries
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, {})[queue] = after_id
+        if job_id not in self._pollers:
+            self._pollers[job_id] = asyncio.create_task(self._poll(job_id))
+        logger.debug(f"Subscribed to job {job_id} events ({len(self._subscribers[job_id])} subscribers)")
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue):
+        """
+        Stop receiving the events of a job.
+
+        Args:
+            job_id: Analysis job ID
+            queue: Queue returned by subscribe()
+        """
+        subscribers = self._subscribers.get(job_id)
+        if subscribers is None:
+            return
+        subscribers.pop(queue, None)
+        if not subscribers:
+            del self._subscribers[job_id]
+            poller = self._pollers.pop(job_id, None)
+            if poller:
+                poller.cancel()
+
+    @staticmethod
+    def _fetch(job_id: str, after_id: int) -> List[Dict[str, Any]]:
+        """Read the events of a job newer than after_id."""
+        db = SessionLocal()
+        try:
+            return JobEventService(db).list_after(job_id, after_id)
+        finally:
+            db.close()
+
+    async def _poll(self, job_id: str):
+        """Push new events of a job to its subscribers until none are left."""
+        try:
+            # Start no later than any subscriber's backlog; duplicates are dropped by ID
+            cursor = min(self._subscribers.get(job_id, {}).values(), default=0)
+            while self._subscribers.get(job_id):
+                try:
+                    events = await asyncio.to_thread(self._fetch, job_id, cursor)
+                except Exception as e:
+                    logger.error(f"Error reading events for job {job_id}: {e}")
+                    events = []
+
+                for event in events:
+                    cursor = event["id"]
+                    for queue in list(self._subscribers.get(job_id, ())):
+                        queue.put_nowait(event)
+
+                await asyncio.sleep(self.poll_interval)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if self._pollers.get(job_id) is asyncio.current_task():
+                del self._pollers[job_id]
+
+    @staticmethod
+    async def backlog(job_id: str, after_id: int = 0) -> List[Dict[str, Any]]:
+        """
+        Read the events a new subscriber has missed.
+
+        Args:
+            job_id: Analysis job ID
+            after_id: Last event ID the client has seen (Last-Event-ID)
+
+        Returns:
+            Events in order
+        """
+        return await asyncio.to_thread(JobEventBroker._fetch, job_id, after_id)
+
+
+# Global job event broker instance
+job_event_broker = JobEventBroker(poll_interval=settings.job_events_poll_interval)
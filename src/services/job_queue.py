@@ -0,0 +1,285 @@
+"""Durable job queue on the application database, shared by API and worker processes."""
+
+import json
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session as DBSession
+
+from ..core.config import settings
+from ..database.models import JobQueueItem
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "leased")
+
+
+class JobQueue:
+    """
+    Persistent work queue with priorities, leases and retries.
+
+    A worker claims the highest-priority available entry with a single
+    UPDATE, which SQLite serializes across processes, and holds it under a
+    lease (visibility timeout) that it extends while working. If the worker
+    dies the lease expires and another worker picks the entry up again.
+    Failed entries are retried with exponential backoff until max_attempts,
+    then marked dead.
+    """
+
+    def __init__(self, db: DBSession):
+        """Initialize job queue with database session."""
+        self.db = db
+
+    def enqueue(
+        self,
+        job_id: str,
+        task: str = "contract_analysis",
+        payload: Optional[Dict[str, Any]] = None,
+        priority: int = 0,
+        max_attempts: Optional[int] = None,
+        commit: bool = True
+    ) -> JobQueueItem:
+        """
+        Add a task for a job (no-op if one is already queued or running).
+
+        Args:
+            job_id: Analysis job the task belongs to
+            task: Task name understood by the worker
+            payload: JSON-serializable task arguments
+            priority: Higher values are claimed first
+            max_attempts: Attempts before the entry is marked dead
+                (default: settings.job_queue_max_attempts)
+            commit: Commit the session; pass False to commit the entry
+                together with other changes (e.g. the job's status)
+
+        Returns:
+            The queue entry
+        """
+        existing = (
+            self.db.query(JobQueueItem)
+            .filter(JobQueueItem.job_id == job_id, JobQueueItem.status.in_(ACTIVE_STATUSES))
+            .first()
+        )
+        if existing:
+            return existing
+
+        item = JobQueueItem(
+            job_id=job_id,
+            task=task,
+            payload=json.dumps(payload or {}),
+            priority=priority,
+            status="queued",
+            max_attempts=max_attempts or settings.job_queue_max_attempts,
+            available_at=datetime.now()
+        )
+        self.db.add(item)
+        if commit:
+            self.db.commit()
+        logger.info(f"📥 Queued {task} for job {job_id} (priority {priority})")
+        return item
+
+    def claim(self, worker_id: str) -> Optional[JobQueueItem]:
+        """
+        Lease the next available entry.
+
+        Entries are ordered by priority (highest first), then by the time
+        they became available. Entries whose lease has expired are
+        reclaimed.
+
+        Args:
+            worker_id: Name of the claiming worker (for diagnostics)
+
+        Returns:
+            The leased entry, or None if nothing is available
+        """
+        now = datetime.now()
+        token = uuid.uuid4().hex
+        candidate = (
+            select(JobQueueItem.id)
+            .where(
+                or_(
+                    and_(JobQueueItem.status == "queued", JobQueueItem.available_at <= now),
+                    and_(
+                        JobQueueItem.status == "leased",
+                        JobQueueItem.lease_expires_at <= now,
+                        JobQueueItem.attempts < JobQueueItem.max_attempts
+                    )
+                )
+            )
+            .order_by(JobQueueItem.priority.desc(), JobQueueItem.available_at, JobQueueItem.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+
+        try:
+            result = self.db.execute(
+                update(JobQueueItem)
+                .where(JobQueueItem.id == candidate)
+                .values(
+                    status="leased",
+                    lease_token=token,
+                    lease_owner=worker_id,
+                    lease_expires_at=now + timedelta(seconds=settings.job_queue_visibility_timeout),
+                    attempts=JobQueueItem.attempts + 1,
+                    updated_at=now
+                )
+                .execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+        except OperationalError as e:
+            # Another worker won the write lock; try again on the next poll
+            self.db.rollback()
+            logger.debug(f"Queue claim contention: {e}")
+            return None
+
+        if result.rowcount == 0:
+            return None
+
+        item = self.db.query(JobQueueItem).filter(JobQueueItem.lease_token == token).first()
+        logger.info(f"🔒 {worker_id} leased job {item.job_id} (attempt {item.attempts}/{item.max_attempts})")
+        return item
+
+    def _leased(self, token: str) -> Optional[JobQueueItem]:
+        """Get the entry still held under a lease token."""
+        return (
+            self.db.query(JobQueueItem)
+            .filter(JobQueueItem.lease_token == token, JobQueueItem.status == "leased")
+            .first()
+        )
+
+    def extend_lease(self, token: str) -> bool:
+        """
+        Push back the lease expiry of a running entry (heartbeat).
+
+        Args:
+            token: Lease token of the entry
+
+        Returns:
+            False if the lease was lost (expired and reclaimed)
+        """
+        result = self.db.execute(
+            update(JobQueueItem)
+            .where(JobQueueItem.lease_token == token, JobQueueItem.status == "leased")
+            .values(
+                lease_expires_at=datetime.now() + timedelta(seconds=settings.job_queue_visibility_timeout),
+                updated_at=datetime.now()
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount > 0
+
+    def set_progress(self, token: str, progress: Dict[str, Any]):
+        """
+        Store live progress of a running entry.
+
+        Args:
+            token: Lease token of the entry
+            progress: JSON-serializable progress data
+        """
+        self.db.execute(
+            update(JobQueueItem)
+            .where(JobQueueItem.lease_token == token, JobQueueItem.status == "leased")
+            .values(progress_json=json.dumps(progress))
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+
+    def get_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the live progress of a job's running entry.
+
+        Args:
+            job_id: Analysis job ID
+
+        Returns:
+            Progress data, or None if the job is not running
+        """
+        row = (
+            self.db.query(JobQueueItem.progress_json)
+            .filter(JobQueueItem.job_id == job_id, JobQueueItem.status == "leased")
+            .first()
+        )
+        if not row or not row[0]:
+            return None
+        return json.loads(row[0])
+
+    def complete(self, token: str):
+        """
+        Mark a running entry as done.
+
+        Args:
+            token: Lease token of the entry
+        """
+        item = self._leased(token)
+        if not item:
+            logger.warning("Completed a queue entry whose lease was lost")
+            return
+        item.status = "done"
+        item.lease_token = None
+        item.lease_expires_at = None
+        item.progress_json = None
+        self.db.commit()
+
+    def fail(self, token: str, error: str) -> bool:
+        """
+        Record a failed attempt and schedule a retry if attempts remain.
+
+        Args:
+            token: Lease token of the entry
+            error: Error message
+
+        Returns:
+            True if the entry will be retried, False if it is now dead
+        """
+        item = self._leased(token)
+        if not item:
+            logger.warning("Failed a queue entry whose lease was lost")
+            return False
+
+        item.last_error = error
+        item.lease_token = None
+        item.lease_expires_at = None
+        item.progress_json = None
+
+        if item.attempts < item.max_attempts:
+            delay = settings.job_queue_retry_backoff * (2 ** (item.attempts - 1))
+            item.status = "queued"
+            item.available_at = datetime.now() + timedelta(seconds=delay)
+            self.db.commit()
+            logger.warning(f"🔁 Job {item.job_id} failed (attempt {item.attempts}), retrying in {delay}s: {error}")
+            return True
+
+        item.status = "dead"
+        self.db.commit()
+        logger.error(f"💀 Job {item.job_id} failed after {item.attempts} attempts: {error}")
+        return False
+
+    def reap_expired(self) -> List[str]:
+        """
+        Mark entries whose lease expired on their last attempt as dead.
+
+        Returns:
+            Job IDs of the entries marked dead
+        """
+        expired = (
+            self.db.query(JobQueueItem)
+            .filter(
+                JobQueueItem.status == "leased",
+                JobQueueItem.lease_expires_at <= datetime.now(),
+                JobQueueItem.attempts >= JobQueueItem.max_attempts
+            )
+            .all()
+        )
+        for item in expired:
+            item.status = "dead"
+            item.lease_token = None
+            item.last_error = item.last_error or "Worker lease expired"
+            logger.error(f"💀 Job {item.job_id} lease expired on its last attempt")
+        if expired:
+            self.db.commit()
+        return [item.job_id for item in expired]
@@ -3,17 +3,13 @@
 import json
 import re
 from typing import List, Dict, Any, Optional
-import google.generativeai as genai
 from src.core.config import settings
 from src.core.constants import get_policy_type_by_id, PolicyType
+from src.core.llm_quota import create_gemini_chat
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Configure Gemini
-if settings.google_api_key:
-    genai.configure(api_key=settings.google_api_key)
-
 
 class Question:
     """Question model for policy questionnaire."""
@@ -54,14 +50,14 @@ class PolicyGenerationService:
 
     def __init__(self):
         """Initialize the policy generation service."""
-        self.model = genai.GenerativeModel(
-            model_name=settings.gemini_model,
-            generation_config={
-                "temperature": 0.3,  # Slightly higher than analysis for creativity
-                "top_p": 0.95,
-                "top_k": 40,
-                "max_output_tokens": 8192,
-            }
+        # Calls go through the shared LLM quota like the rest of the app
+        self.llm = create_gemini_chat(
+            model=settings.gemini_model,
+            google_api_key=settings.google_api_key,
+            temperature=0.3,  # Slightly higher than analysis for creativity
+            top_p=0.95,
+            top_k=40,
+            max_output_tokens=8192
         )
 
     def generate_questions(
@@ -99,8 +95,8 @@ class PolicyGenerationService:
 
             # Call LLM
             logger.info(f"Generating questions for policy type: {policy_type_id}")
-            response = self.model.generate_content(prompt)
-            response_text = response.text
+            response = self.llm.invoke(prompt)
+            response_text = str(response.content)
 
             # Parse JSON response
             questions = self._parse_questions_response(response_text)
@@ -312,8 +308,8 @@ Generate between 8-12 questions. Return ONLY the JSON array, nothing else."""
 
             # Call LLM
             logger.info(f"Generating policy for type: {policy_type_id}")
-            response = self.model.generate_content(prompt)
-            policy_content = response.text.strip()
+            response = self.llm.invoke(prompt)
+            policy_content = str(response.content).strip()
 
             # Validate policy
             is_valid, validation_message = self._validate_policy(policy_content)
@@ -321,8 +317,8 @@ Generate between 8-12 questions. Return ONLY the JSON array, nothing else."""
                 logger.warning(f"Generated policy failed validation: {validation_message}")
                 # Retry once with enhanced prompt
                 retry_prompt = f"{prompt}\n\nIMPORTANT: The policy must be well-structured with clear sections, proper numbering, and at least 500 characters. {validation_message}"
-                response = self.model.generate_content(retry_prompt)
-                policy_content = response.text.strip()
+                response = self.llm.invoke(retry_prompt)
+                policy_content = str(response.content).strip()
 
                 # Validate again
                 is_valid, validation_message = self._validate_policy(policy_content)
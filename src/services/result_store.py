@@ -0,0 +1,247 @@
+"""Compressed, content-addressed storage for full analysis results."""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..database.models import AnalysisJob
+
+logger = logging.getLogger(__name__)
+
+
+class ResultStore:
+    """
+    Store analysis results as gzip-compressed JSON files named by their hash.
+
+    Files live under <root>/<first two hex digits>/<sha256>.json.gz. Identical
+    results share one file, and a file never changes once written, so
+    readers need no locking.
+    """
+
+    def __init__(self, root: str):
+        """
+        Initialize result store.
+
+        Args:
+            root: Directory holding the result files
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        """Path of the file holding a key."""
+        return self.root / key[:2] / f"{key}.json.gz"
+
+    def put(self, results: Dict[str, Any]) -> str:
+        """
+        Store results (no-op if identical results are already stored).
+
+        Args:
+            results: JSON-serializable analysis results
+
+        Returns:
+            Key (SHA-256 of the JSON) to load them with
+        """
+        body = json.dumps(results, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        key = hashlib.sha256(body).hexdigest()
+        path = self._path(key)
+        if path.exists():
+            return key
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(body, compresslevel=6, mtime=0))
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        logger.debug(f"Stored results {key[:12]}: {len(body)} bytes, {path.stat().st_size} compressed")
+        return key
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load stored results.
+
+        Args:
+            key: Key returned by put()
+
+        Returns:
+            The results, or None if the file is missing or unreadable
+        """
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rb") as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            logger.error(f"Result file missing: {path}")
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to read result file {path}: {e}")
+        return None
+
+    def delete(self, key: str):
+        """
+        Delete stored results (callers check that no other job shares the key).
+
+        Args:
+            key: Key returned by put()
+        """
+        self._path(key).unlink(missing_ok=True)
+
+
+def summarize_results(results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Compute the listing summary of a job's results.
+
+    Args:
+        results: Full analysis results
+
+    Returns:
+        Dictionary with total_clauses, compliant_clauses,
+        non_compliant_clauses, compliance_rate and overall_risk, or None
+    """
+    if "analysis_results" in results:
+        analysis_results = results["analysis_results"]
+        total_clauses = len(analysis_results)
+
+        # Count compliant/non-compliant based on the 'compliant' field; clauses
+        # without a verdict (compliant None, e.g. a failed chunk) need review
+        compliant = sum(1 for r in analysis_results if r.get("compliant", False))
+        non_compliant = sum(1 for r in analysis_results if r.get("compliant", True) is False)
+
+        # Determine overall risk from analysis results
+        risk_levels = [r.get("risk_level", "").lower() for r in analysis_results if r.get("risk_level")]
+        if "critical" in risk_levels:
+            overall_risk = "Critical"
+        elif "high" in risk_levels:
+            overall_risk = "High"
+        elif "medium" in risk_levels:
+            overall_risk = "Medium"
+        elif "low" in risk_levels:
+            overall_risk = "Low"
+        else:
+            overall_risk = "Unknown"
+
+        return {
+            "total_clauses": total_clauses,
+            "compliant_clauses": compliant,
+            "non_compliant_clauses": non_compliant,
+            "compliance_rate": (compliant / total_clauses * 100) if total_clauses > 0 else 0,
+            "overall_risk": overall_risk
+        }
+
+    summary = results.get("summary")
+    if not summary:
+        return None
+
+    # Normalize old format to new format
+    if "total_clauses_reviewed" in summary:
+        total = summary.get("total_clauses_reviewed", 0)
+        compliant = summary.get("compliant_clauses", 0)
+        return {
+            "total_clauses": total,
+            "compliant_clauses": compliant,
+            "non_compliant_clauses": summary.get("non_compliant_clauses", total - compliant),
+            "compliance_rate": (compliant / total * 100) if total > 0 else 0,
+            "overall_risk": summary.get("overall_risk_assessment", "Unknown").title()
+        }
+
+    return {
+        "total_clauses": summary.get("total_clauses", 0),
+        "compliant_clauses": summary.get("compliant_clauses", 0),
+        "non_compliant_clauses": summary.get("non_compliant_clauses", 0),
+        "compliance_rate": summary.get("compliance_rate", 0),
+        "overall_risk": summary.get("overall_risk", "Unknown")
+    }
+
+
+def save_job_results(job: AnalysisJob, results: Dict[str, Any]):
+    """
+    Store a job's results and fill its summary columns (caller commits).
+
+    Args:
+        job: Analysis job
+        results: Full analysis results
+    """
+    job.result_key = get_result_store().put(results)
+    job.result_json = None
+
+    summary = summarize_results(results) or {}
+    job.total_clauses = summary.get("total_clauses")
+    job.compliant_clauses = summary.get("compliant_clauses")
+    job.non_compliant_clauses = summary.get("non_compliant_clauses")
+    job.compliance_rate = summary.get("compliance_rate")
+    job.overall_risk = summary.get("overall_risk")
+
+
+def load_job_results(job: AnalysisJob) -> Optional[Dict[str, Any]]:
+    """
+    Load a job's full results.
+
+    Jobs not yet moved to the result store are read from result_json.
+
+    Args:
+        job: Analysis job
+
+    Returns:
+        The results, or None if the job has none
+    """
+    if job.result_key:
+        return get_result_store().get(job.result_key)
+    if job.result_json:
+        try:
+            return json.loads(job.result_json)
+        except json.JSONDecodeError:
+            logger.error(f"Failed to parse result_json for job {job.job_id}")
+    return None
+
+
+def job_summary(job: AnalysisJob) -> Optional[Dict[str, Any]]:
+    """
+    Get a job's listing summary from its summary columns.
+
+    Args:
+        job: Analysis job
+
+    Returns:
+        Summary dictionary, or None if the job has no results
+    """
+    if job.total_clauses is None:
+        return None
+    return {
+        "total_clauses": job.total_clauses,
+        "compliant_clauses": job.compliant_clauses,
+        "non_compliant_clauses": job.non_compliant_clauses,
+        "compliance_rate": job.compliance_rate,
+        "overall_risk": job.overall_risk
+    }
+
+
+# Global instance (lazy initialization)
+_result_store: Optional[ResultStore] = None
+_result_store_lock = threading.Lock()
+
+
+def get_result_store() -> ResultStore:
+    """
+    Get the process-wide result store.
+
+    Returns:
+        ResultStore rooted at settings.result_store_dir
+    """
+    global _result_store
+    if _result_store is None:
+        with _result_store_lock:
+            if _result_store is None:
+                from ..core.config import settings
+                _result_store = ResultStore(settings.result_store_dir)
+    return _result_store
@@ -0,0 +1,249 @@
+"""Precomputed, compressed status payloads for completed analysis jobs."""
+
+import gzip
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session as DBSession
+
+from ..database.models import AnalysisJob, AnalysisStatusPayload
+from ..document_processing.report_renderer import artifact_paths
+
+logger = logging.getLogger(__name__)
+
+
+def compliance_status(result: Dict[str, Any]) -> str:
+    """Frontend compliance status of a clause (no verdict, e.g. a failed chunk: Needs Review)."""
+    compliant = result.get("compliant")
+    if compliant is None:
+        return "Needs Review"
+    return "Compliant" if compliant else "Non-Compliant"
+
+
+def format_clause_result(idx: int, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Transform a backend clause analysis into the frontend format."""
+    return {
+        "clause_number": idx + 1,
+        "clause_text": result.get("text", result.get("clause_text", "")),
+        "clause_type": result.get("type", result.get("clause_type", "Unknown")),
+        "compliance_status": compliance_status(result),
+        "issues": result.get("issues", []),
+        "recommendations": result.get("recommendations", []),
+        "policy_references": result.get("policy_references", result.get("relevant_policies", [])),
+        "risk_level": result.get("risk_level", "Medium"),
+        "suggested_text": result.get("suggested_alternative", result.get("suggested_text"))
+    }
+
+
+def summarize_clause_results(analysis_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Compute summary counts from frontend-format clause results.
+
+    Args:
+        analysis_results: Results from format_clause_result()
+
+    Returns:
+        Summary with compliance and risk counts
+    """
+    total_clauses = len(analysis_results)
+    compliant = sum(1 for r in analysis_results if r.get("compliance_status") == "Compliant")
+    non_compliant = sum(1 for r in analysis_results if r.get("compliance_status") == "Non-Compliant")
+    needs_review = sum(1 for r in analysis_results if r.get("compliance_status") == "Needs Review")
+
+    critical = sum(1 for r in analysis_results if r.get("risk_level") == "Critical")
+    high = sum(1 for r in analysis_results if r.get("risk_level") == "High")
+    medium = sum(1 for r in analysis_results if r.get("risk_level") == "Medium")
+    low = sum(1 for r in analysis_results if r.get("risk_level") == "Low")
+
+    compliance_rate = (compliant / total_clauses * 100) if total_clauses > 0 else 0
+
+    # Determine overall risk
+    if critical > 0:
+        overall_risk = "Critical"
+    elif high > 0:
+        overall_risk = "High"
+    elif medium > 0:
+        overall_risk = "Medium"
+    else:
+        overall_risk = "Low"
+
+    return {
+        "total_clauses": total_clauses,
+        "compliant_clauses": compliant,
+        "non_compliant_clauses": non_compliant,
+        "needs_review_clauses": needs_review,
+        "critical_issues": critical,
+        "high_risk_issues": high,
+        "medium_risk_issues": medium,
+        "low_risk_issues": low,
+        "compliance_rate": compliance_rate,
+        "overall_risk": overall_risk
+    }
+
+
+def build_completed_status(
+    job_id: str,
+    contract_name: str,
+    created_at: str,
+    completed_at: str,
+    output_path: Optional[str],
+    results: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Build the status response of a completed job in the frontend shape.
+
+    Args:
+        job_id: Job ID
+        contract_name: Uploaded file name
+        created_at: Job creation time (ISO format)
+        completed_at: Job completion time (ISO format)
+        output_path: Path of the reviewed contract
+        results: Full analysis results
+
+    Returns:
+        Status response dictionary
+    """
+    analysis_results = [
+        format_clause_result(idx, result)
+        for idx, result in enumerate(results.get("analysis_results", []))
+    ]
+
+    summary = results.get("summary", {})
+
+    # If summary is missing fields, calculate them
+    if not summary or "total_clauses" not in summary:
+        summary = summarize_clause_results(analysis_results)
+
+    paths = artifact_paths(output_path) if output_path else {}
+
+    return {
+        "job_id": job_id,
+        "status": "completed",
+        "progress": 100,
+        "message": "",
+        "result": {
+            "job_id": job_id,
+            "contract_name": contract_name,
+            "status": "completed",
+            "created_at": created_at,
+            "completed_at": completed_at,
+            "analysis_results": analysis_results,
+            "summary": summary,
+            "output_files": {
+                "reviewed_contract": output_path or "",
+                "detailed_report": paths.get("detailed", ""),
+                "html_summary": paths.get("html", "")
+            }
+        }
+    }
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Header value (comma-separated ETags or *)
+        etag: Current ETag
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # Proxies that re-encode responses may weaken the tag
+    return "*" in candidates or etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def encode_payload(payload: Dict[str, Any]) -> Tuple[str, bytes]:
+    """
+    Serialize and compress a payload.
+
+    Args:
+        payload: JSON-serializable response
+
+    Returns:
+        Tuple of (ETag derived from the JSON body, gzip-compressed body)
+    """
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    return etag, gzip.compress(body, compresslevel=6, mtime=0)
+
+
+class StatusPayloadStore:
+    """Store the compressed status payload of completed jobs, keyed by job ID."""
+
+    def __init__(self, db: DBSession):
+        """Initialize payload store with database session."""
+        self.db = db
+
+    def save(self, job_id: str, payload: Dict[str, Any]) -> Tuple[str, bytes]:
+        """
+        Compress and store a job's status payload (replacing any previous one).
+
+        Args:
+            job_id: Job ID
+            payload: Status response from build_completed_status()
+
+        Returns:
+            Tuple of (ETag, gzip-compressed JSON body)
+        """
+        etag, compressed = encode_payload(payload)
+        row = self.db.query(AnalysisStatusPayload).filter(AnalysisStatusPayload.job_id == job_id).first()
+        if row is None:
+            row = AnalysisStatusPayload(job_id=job_id)
+            self.db.add(row)
+        row.etag = etag
+        row.payload = compressed
+        row.created_at = datetime.now()
+        self.db.commit()
+        logger.debug(f"Stored status payload for job {job_id}: {len(compressed)} bytes compressed")
+        return etag, compressed
+
+    def save_for_job(self, job: AnalysisJob, results: Dict[str, Any]) -> Tuple[str, bytes]:
+        """
+        Build and store the status payload of a completed job.
+
+        Args:
+            job: Completed analysis job
+            results: Full analysis results
+
+        Returns:
+            Tuple of (ETag, gzip-compressed JSON body)
+        """
+        payload = build_completed_status(
+            job_id=job.job_id,
+            contract_name=job.filename,
+            created_at=job.created_at.isoformat(),
+            completed_at=job.updated_at.isoformat(),
+            output_path=job.output_path,
+            results=results
+        )
+        return self.save(job.job_id, payload)
+
+    def get_etag(self, job_id: str) -> Optional[str]:
+        """Get the ETag of a job's stored payload without loading it."""
+        row = (
+            self.db.query(AnalysisStatusPayload.etag)
+            .filter(AnalysisStatusPayload.job_id == job_id)
+            .first()
+        )
+        return row[0] if row else None
+
+    def get(self, job_id: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Get a job's stored payload.
+
+        Returns:
+            Tuple of (ETag, gzip-compressed JSON body), or None
+        """
+        row = (
+            self.db.query(AnalysisStatusPayload.etag, AnalysisStatusPayload.payload)
+            .filter(AnalysisStatusPayload.job_id == job_id)
+            .first()
+        )
+        return (row[0], row[1]) if row else None
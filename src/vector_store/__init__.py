@@ -2,5 +2,6 @@
 
 from .embeddings import PolicyEmbeddings
 from .retriever import PolicyRetriever
+from .registry import VectorStoreRegistry, get_vector_registry
 
-__all__ = ["PolicyEmbeddings", "PolicyRetriever"]
+__all__ = ["PolicyEmbeddings", "PolicyRetriever", "VectorStoreRegistry", "get_vector_registry"]
@@ -0,0 +1,259 @@
+"""Async embedding scheduler with RPM/TPM token buckets and adaptive backoff."""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Callable, List, Optional
+
+try:
+    from google.api_core.exceptions import ResourceExhausted
+except ImportError:
+    ResourceExhausted = None
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (1 token ≈ 4 characters)."""
+    return max(1, len(text) // 4)
+
+
+def is_quota_error(error: Exception) -> bool:
+    """Return True if an exception signals an exhausted API quota (HTTP 429)."""
+    if ResourceExhausted is not None and isinstance(error, ResourceExhausted):
+        return True
+    message = str(error)
+    return "429" in message or "RESOURCE_EXHAUSTED" in message or "quota" in message.lower()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at a per-minute rate.
+
+    acquire() reserves tokens immediately and returns how long the caller has
+    to wait for them, so waiting can happen with asyncio.sleep (or time.sleep)
+    outside the lock and callers are served in arrival order.
+    """
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        """
+        Initialize bucket.
+
+        Args:
+            per_minute: Refill rate (tokens per minute)
+            capacity: Maximum burst size (default: one minute's worth)
+        """
+        self.per_minute = per_minute
+        self.capacity = capacity if capacity is not None else per_minute
+        self.rate = per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add the tokens accrued since the last update."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def set_rate(self, per_minute: float):
+        """Change the refill rate (used by adaptive backoff)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(per_minute, 1.0) / 60.0
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """
+        Reserve tokens.
+
+        Args:
+            amount: Tokens to take
+
+        Returns:
+            Seconds to wait before the reserved tokens are actually available
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class EmbeddingScheduler:
+    """
+    Run embedding batches concurrently at the configured quota ceiling.
+
+    Every batch takes one request from the RPM bucket and its estimated
+    token count from the TPM bucket, at most max_concurrency batches are in
+    flight, and a ResourceExhausted response pauses all batches and halves
+    the effective rate, which then recovers gradually on success.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_concurrency: int = 4,
+        max_retries: int = 6,
+        base_backoff: float = 2.0,
+        max_backoff: float = 60.0
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            requests_per_minute: Embedding API requests allowed per minute
+            tokens_per_minute: Embedding API tokens allowed per minute
+            max_concurrency: Maximum batches in flight at once
+            max_retries: Attempts per batch before giving up
+            base_backoff: First backoff delay after a quota error (seconds)
+            max_backoff: Upper bound for backoff delays (seconds)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+
+        self._lock = threading.Lock()
+        self._rate_scale = 1.0
+        self._paused_until = 0.0
+        self.quota_errors = 0
+
+    # ------------------------------------------------------------------
+    # Adaptive rate control
+    # ------------------------------------------------------------------
+
+    def _apply_rate_scale(self):
+        """Push the current rate scale into both buckets."""
+        self.request_bucket.set_rate(self.requests_per_minute * self._rate_scale)
+        self.token_bucket.set_rate(self.tokens_per_minute * self._rate_scale)
+
+    def _on_quota_error(self, error: Exception, attempt: int) -> float:
+        """Slow down after a quota error; return the pause in seconds."""
+        from ..agents.rate_limit_handler import RateLimitHandler
+
+        suggested = RateLimitHandler(base_delay=0.0).extract_retry_delay(error)
+        delay = min(max(suggested, self.base_backoff * (2 ** attempt)), self.max_backoff)
+
+        with self._lock:
+            self.quota_errors += 1
+            self._rate_scale = max(0.1, self._rate_scale * 0.5)
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            self._apply_rate_scale()
+
+        logger.warning(
+            f"⏳ Embedding quota hit, pausing {delay:.1f}s and lowering rate to "
+            f"{self._rate_scale:.0%} of the configured ceiling"
+        )
+        return delay
+
+    def _on_success(self):
+        """Recover the rate gradually after successful batches."""
+        if self._rate_scale >= 1.0:
+            return
+        with self._lock:
+            self._rate_scale = min(1.0, self._rate_scale + 0.1)
+            self._apply_rate_scale()
+
+    async def _wait_for_slot(self, token_count: int):
+        """Wait for a global pause to end and for RPM/TPM budget."""
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+        wait = max(self.request_bucket.acquire(1), self.token_bucket.acquire(token_count))
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    # ------------------------------------------------------------------
+    # Embedding
+    # ------------------------------------------------------------------
+
+    async def _embed_batch(
+        self,
+        embed_fn: Callable[[List[str]], List[List[float]]],
+        batch: List[str]
+    ) -> List[List[float]]:
+        """Embed one batch with quota-aware retries."""
+        token_count = sum(estimate_tokens(text) for text in batch)
+
+        for attempt in range(self.max_retries):
+            await self._wait_for_slot(token_count)
+            try:
+                result = await asyncio.to_thread(embed_fn, batch)
+                self._on_success()
+                return result
+            except Exception as e:
+                if attempt == self.max_retries - 1:
+                    logger.error(f"Embedding batch failed after {self.max_retries} attempts: {e}")
+                    raise
+                if is_quota_error(e):
+                    self._on_quota_error(e, attempt)
+                else:
+                    delay = min(self.base_backoff * (2 ** attempt), self.max_backoff)
+                    logger.warning(f"Embedding error ({e}), retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+
+    async def embed(
+        self,
+        embed_fn: Callable[[List[str]], List[List[float]]],
+        texts: List[str],
+        batch_size: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[List[float]]:
+        """
+        Embed texts in concurrent, rate-limited batches.
+
+        Args:
+            embed_fn: Blocking function embedding a list of texts
+            texts: Texts to embed
+            batch_size: Texts per API request
+            progress_callback: Optional callable(done, total) after each batch
+
+        Returns:
+            Embedding vectors aligned with texts
+        """
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        done = 0
+
+        async def run(batch: List[str]) -> List[List[float]]:
+            nonlocal done
+            async with semaphore:
+                result = await self._embed_batch(embed_fn, batch)
+            done += len(batch)
+            if progress_callback:
+                progress_callback(done, len(texts))
+            return result
+
+        results = await asyncio.gather(*(run(batch) for batch in batches))
+        return [embedding for batch_result in results for embedding in batch_result]
+
+    def embed_sync(
+        self,
+        embed_fn: Callable[[List[str]], List[List[float]]],
+        texts: List[str],
+        batch_size: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[List[float]]:
+        """
+        Blocking wrapper around embed() for synchronous callers.
+
+        Runs on a fresh event loop, or on a helper thread if the calling
+        thread already has a running loop.
+        """
+        coro = self.embed(embed_fn, texts, batch_size, progress_callback)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
@@ -2,28 +2,20 @@
 
 import os
 import logging
-import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from typing import List, Dict, Any, Optional, Callable, Iterable
 from langchain.schema import Document
-import chromadb
-from chromadb.config import Settings as ChromaSettings
-import PyPDF2
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type
-)
-
-try:
-    from google.api_core.exceptions import ResourceExhausted
-except ImportError:
-    ResourceExhausted = Exception
 
 from ..core.config import settings
+from .registry import get_vector_registry
+from .ingestion_manifest import content_hash, file_hash
+from .ingestion_pipeline import (
+    IngestionPipeline,
+    apply_file_updates,
+    extract_text,
+    make_text_splitter,
+    plan_file_update
+)
 
 logger = logging.getLogger(__name__)
 
@@ -95,86 +87,51 @@ class PolicyEmbeddings:
         Args:
             collection_name: Optional collection name. If not provided, uses default from settings.
         """
-        # Initialize embedding model (local or API-based)
-        if settings.use_local_embeddings:
+        # Borrow the shared embedding model and Chroma client (local or API-based)
+        self.registry = get_vector_registry()
+        self.is_local = settings.use_local_embeddings
+        if self.is_local:
             logger.info("🖥️  Using LOCAL embedding model (no API limits!)")
-            self.embeddings = LocalEmbeddings(settings.local_embedding_model)
-            self.is_local = True
         else:
             logger.info("☁️  Using Gemini API embedding model")
-            self.embeddings = GoogleGenerativeAIEmbeddings(
-                model=settings.embedding_model,
-                google_api_key=settings.google_api_key
-            )
-            self.is_local = False
-
-        self.chroma_client = chromadb.PersistentClient(
-            path=settings.chroma_db_path,
-            settings=ChromaSettings(anonymized_telemetry=False)
-        )
+        self.embeddings = self.registry.get_embeddings()
+        self.chroma_client = self.registry.get_chroma_client()
+        self.manifest = self.registry.get_ingestion_manifest()
 
         # Store collection name for later use
         self.collection_name = collection_name or settings.chroma_collection_name
 
         # Initialize default collection
-        self.collection = self.chroma_client.get_or_create_collection(
-            name=self.collection_name,
+        self.collection = self.registry.get_collection(
+            self.collection_name,
             metadata={"hnsw:space": "cosine"}
         )
 
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=settings.chunk_size,
-            chunk_overlap=settings.chunk_overlap,
-            separators=["\n\n", "\n", ". ", " ", ""]
-        )
+        self.text_splitter = make_text_splitter(settings.chunk_size, settings.chunk_overlap)
+        # Pipeline stats of the most recent ingestion, keyed by directory
+        self.last_ingestion_stats: Dict[str, Dict[str, Any]] = {}
 
         logger.info(f"Initialized PolicyEmbeddings with collection: {self.collection_name}")
 
-    @retry(
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        retry=retry_if_exception_type((ResourceExhausted, Exception)),
-        reraise=True
-    )
-    def _embed_with_retry(self, texts: List[str]) -> List[List[float]]:
-        """
-        Embed texts with automatic retry on rate limit errors.
-
-        Uses exponential backoff: 4s, 8s, 16s, 32s, 60s between retries.
-
-        Args:
-            texts: List of text strings to embed
-
-        Returns:
-            List of embedding vectors
-
-        Raises:
-            ResourceExhausted: If rate limit persists after retries
-        """
-        try:
-            return self.embeddings.embed_documents(texts)
-        except ResourceExhausted as e:
-            logger.warning(f"Rate limit hit, retrying... ({e})")
-            raise
-        except Exception as e:
-            logger.error(f"Embedding error: {e}")
-            raise
-
     def embed_documents_batched(
         self,
         texts: List[str],
         batch_size: Optional[int] = None,
-        delay: Optional[float] = None,
-        show_progress: bool = False
+        show_progress: bool = False,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> List[List[float]]:
         """
         Embed documents in batches with rate limiting protection.
 
+        API batches are dispatched by the shared EmbeddingScheduler, which
+        keeps concurrent requests within the configured RPM/TPM budget and
+        backs off adaptively on ResourceExhausted.
+
         Args:
             texts: List of text strings to embed
             batch_size: Number of texts per batch (default: from settings)
-            delay: Delay in seconds between batches (default: from settings)
             show_progress: Whether to log progress
+            progress_callback: Optional callable(done, total) invoked after each batch
 
         Returns:
             List of embedding vectors
@@ -182,46 +139,36 @@ class PolicyEmbeddings:
         # Local embeddings don't need rate limiting - process all at once
         if self.is_local:
             logger.info(f"🖥️  Embedding {len(texts)} texts locally (no rate limits)...")
-            return self.embeddings.embed_documents(texts)
+            embeddings_list = self.embeddings.embed_documents(texts)
+            if progress_callback:
+                progress_callback(len(texts), len(texts))
+            return embeddings_list
 
-        # API-based embeddings need batching and delays
-        batch_size = batch_size or settings.embedding_batch_size
-        delay = delay or settings.embedding_delay_seconds
+        if not texts:
+            return []
 
-        all_embeddings = []
+        batch_size = batch_size or settings.embedding_batch_size
+        scheduler = self.registry.get_embedding_scheduler()
         total_batches = (len(texts) + batch_size - 1) // batch_size
 
         logger.info(
             f"☁️  Embedding {len(texts)} texts via API in {total_batches} batch(es) "
-            f"(batch_size={batch_size}, delay={delay}s)"
+            f"(batch_size={batch_size}, rpm={scheduler.requests_per_minute}, "
+            f"tpm={scheduler.tokens_per_minute}, concurrency={scheduler.max_concurrency})"
         )
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            batch_num = i // batch_size + 1
-
+        def on_batch_done(done: int, total: int):
             if show_progress:
-                logger.info(
-                    f"Processing batch {batch_num}/{total_batches} "
-                    f"({len(batch)} texts)..."
-                )
-
-            try:
-                # Embed batch with retry protection
-                batch_embeddings = self._embed_with_retry(batch)
-                all_embeddings.extend(batch_embeddings)
+                logger.info(f"Embedded {done}/{total} texts")
+            if progress_callback:
+                progress_callback(done, total)
 
-                # Add delay between batches (except for last batch)
-                if i + batch_size < len(texts):
-                    if show_progress:
-                        logger.info(f"Waiting {delay}s before next batch...")
-                    time.sleep(delay)
-
-            except Exception as e:
-                logger.error(
-                    f"Failed to embed batch {batch_num}/{total_batches}: {e}"
-                )
-                raise
+        all_embeddings = scheduler.embed_sync(
+            self.embeddings.embed_documents,
+            texts,
+            batch_size,
+            progress_callback=on_batch_done
+        )
 
         logger.info(f"✅ Successfully embedded {len(all_embeddings)} texts")
         return all_embeddings
@@ -255,8 +202,8 @@ class PolicyEmbeddings:
             collection_name = self.collection_name
             logger.info(f"Using default collection: {collection_name}")
 
-        collection = self.chroma_client.get_or_create_collection(
-            name=collection_name,
+        collection = self.registry.get_collection(
+            collection_name,
             metadata={
                 "hnsw:space": "cosine",
                 "company_id": company_id if company_id else None
@@ -268,40 +215,13 @@ class PolicyEmbeddings:
     def load_policy_file(self, file_path: Path) -> str:
         """Load a policy file and return its content (supports .txt, .md, .pdf)."""
         try:
-            # Handle PDF files
-            if file_path.suffix.lower() == '.pdf':
-                content = self._extract_text_from_pdf(file_path)
-            else:
-                # Handle text files (.txt, .md)
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
+            content = extract_text(file_path)
             logger.info(f"Loaded policy file: {file_path}")
             return content
         except Exception as e:
             logger.error(f"Error loading policy file {file_path}: {e}")
             raise
 
-    def _extract_text_from_pdf(self, pdf_path: Path) -> str:
-        """Extract text content from a PDF file."""
-        try:
-            text_content = []
-            with open(pdf_path, 'rb') as pdf_file:
-                pdf_reader = PyPDF2.PdfReader(pdf_file)
-
-                for page_num, page in enumerate(pdf_reader.pages):
-                    text = page.extract_text()
-                    if text.strip():
-                        text_content.append(text)
-
-            content = "\n\n".join(text_content)
-            logger.info(f"Extracted {len(pdf_reader.pages)} pages from PDF: {pdf_path}")
-            return content
-
-        except Exception as e:
-            logger.error(f"Error extracting text from PDF {pdf_path}: {e}")
-            raise
-
     def extract_metadata_from_filename(self, filename: str) -> Dict[str, str]:
         """Extract metadata from policy filename."""
         # Expected format: PolicyType_Section_Version.{txt|md|pdf}
@@ -338,10 +258,135 @@ class PolicyEmbeddings:
         logger.info(f"Created {len(documents)} chunks from document")
         return documents
 
+    def embed_chunks_with_store(
+        self,
+        texts: List[str],
+        show_progress: bool = False
+    ) -> List[List[float]]:
+        """
+        Embed chunk texts, reusing stored embeddings for content seen before.
+
+        Embeddings are looked up by (model, content hash) in the ingestion
+        manifest; only chunks never embedded with the current model are sent
+        to the embedding backend.
+
+        Args:
+            texts: Chunk texts to embed
+            show_progress: Whether to log batch progress
+
+        Returns:
+            List of embedding vectors aligned with texts
+        """
+        model = self.registry.embedding_model_name()
+        hashes = [content_hash(text) for text in texts]
+        stored = self.manifest.get_embeddings(model, hashes)
+
+        missing = [i for i, h in enumerate(hashes) if h not in stored]
+        if missing:
+            # Identical chunks only need to be embedded once
+            unique_missing = list(dict.fromkeys(hashes[i] for i in missing))
+            text_by_hash = {hashes[i]: texts[i] for i in missing}
+            new_embeddings = self.embed_documents_batched(
+                [text_by_hash[h] for h in unique_missing],
+                show_progress=show_progress
+            )
+            computed = dict(zip(unique_missing, new_embeddings))
+            self.manifest.put_embeddings(model, computed)
+            stored.update(computed)
+
+        logger.info(
+            f"Chunk embeddings: {len(texts) - len(missing)} reused, {len(missing)} computed"
+        )
+        return [stored[h] for h in hashes]
+
+    def _sync_file(
+        self,
+        collection,
+        file_path: Path,
+        metadata: Dict[str, Any],
+        show_progress: bool = False
+    ) -> int:
+        """
+        Incrementally ingest one file into a collection.
+
+        Unchanged files (same content hash as the manifest) are skipped
+        without being read. Otherwise the file is re-chunked, chunks get
+        content-derived IDs, and only added chunks are embedded; kept
+        chunks just get their metadata refreshed.
+
+        Args:
+            collection: Target ChromaDB collection
+            file_path: Path to the policy file
+            metadata: Base metadata for every chunk
+            show_progress: Whether to log embedding progress
+
+        Returns:
+            Number of chunks added to the collection
+        """
+        source_key = str(file_path)
+        current_hash = file_hash(file_path)
+        record = self.manifest.get_file(collection.name, source_key)
+
+        if record and record["file_hash"] == current_hash:
+            logger.info(f"Unchanged, skipping {file_path.name}")
+            return 0
+
+        # Load and chunk the document
+        content = self.load_policy_file(file_path)
+        documents = self.chunk_document(content, metadata)
+        texts = [doc.page_content for doc in documents]
+        metadatas = [doc.metadata for doc in documents]
+        plan = plan_file_update(source_key, record, texts, metadatas)
+        plan["add_embeddings"] = (
+            self.embed_chunks_with_store(plan["add_texts"], show_progress=show_progress)
+            if plan["add_texts"] else []
+        )
+        apply_file_updates(collection, [plan])
+
+        self.manifest.record_file(collection.name, source_key, current_hash, plan["ids"])
+        self.registry.bump_collection_generation(collection.name)
+
+        logger.info(
+            f"Ingested {file_path.name}: {len(plan['add_ids'])} added, "
+            f"{len(plan['removed_ids'])} removed, "
+            f"{len(plan['keep_ids'])} unchanged chunks in {collection.name}"
+        )
+        return len(plan["add_ids"])
+
+    def _prune_missing_files(self, collection, directory: Path, present: List[Path]) -> int:
+        """
+        Remove chunks of files that were deleted from a directory.
+
+        Args:
+            collection: ChromaDB collection
+            directory: Directory that was ingested
+            present: Files currently in the directory
+
+        Returns:
+            Number of chunks removed
+        """
+        present_keys = {str(p) for p in present}
+        removed = 0
+
+        for source_key, chunk_ids in self.manifest.files_in_collection(collection.name).items():
+            if Path(source_key).parent == directory and source_key not in present_keys:
+                if chunk_ids:
+                    collection.delete(ids=chunk_ids)
+                self.manifest.forget_file(collection.name, source_key)
+                removed += len(chunk_ids)
+                logger.info(f"Removed {len(chunk_ids)} chunks of deleted file {source_key}")
+
+        if removed:
+            self.registry.bump_collection_generation(collection.name)
+        return removed
+
     def ingest_single_file(self, file_path: Path, company_id: Optional[str] = None) -> int:
         """
         Ingest a single policy file into user-specific or default collection.
 
+        Re-ingesting the same file is incremental: only changed chunks are
+        embedded and written.
+
         Args:
             file_path: Path to the policy file
             company_id: Optional company ID for user-specific collection
@@ -353,9 +398,6 @@ class PolicyEmbeddings:
             # Get the appropriate collection
             collection = self.get_or_create_user_collection(company_id)
 
-            # Load file content
-            content = self.load_policy_file(file_path)
-
             # Extract metadata
             metadata = self.extract_metadata_from_filename(file_path.name)
             metadata["source_type"] = "policy"
@@ -367,30 +409,7 @@ class PolicyEmbeddings:
             from datetime import datetime
             metadata["uploaded_at"] = datetime.now().isoformat()
 
-            # Chunk the document
-            documents = self.chunk_document(content, metadata)
-
-            # Generate embeddings (with rate limiting protection)
-            texts = [doc.page_content for doc in documents]
-            metadatas = [doc.metadata for doc in documents]
-
-            embeddings_list = self.embed_documents_batched(texts, show_progress=False)
-
-            # Add to ChromaDB
-            import uuid
-            import time
-            timestamp = int(time.time() * 1000)
-            ids = [f"{file_path.stem}_{timestamp}_{i}" for i in range(len(documents))]
-
-            collection.add(
-                documents=texts,
-                embeddings=embeddings_list,
-                metadatas=metadatas,
-                ids=ids
-            )
-
-            logger.info(f"Ingested {file_path.name}: {len(documents)} chunks to {collection.name}")
-            return len(documents)
+            return self._sync_file(collection, file_path, metadata)
 
         except Exception as e:
             logger.error(f"Error ingesting file {file_path}: {e}")
@@ -400,6 +419,9 @@ class PolicyEmbeddings:
         """
         Ingest all policy files from a directory.
 
+        Files whose content hash matches the manifest are skipped, and
+        chunks of files removed from the directory are deleted.
+
         Args:
             directory: Path to directory containing policy files
             policy_type: Type of policies ("policy" or "law")
@@ -412,7 +434,6 @@ class PolicyEmbeddings:
             logger.warning(f"Directory does not exist: {directory}")
             return 0
 
-        total_chunks = 0
         policy_files = (
             list(directory_path.glob("*.txt")) +
             list(directory_path.glob("*.md")) +
@@ -421,44 +442,21 @@ class PolicyEmbeddings:
 
         logger.info(f"Found {len(policy_files)} policy files in {directory}")
 
+        files = []
         for policy_file in policy_files:
-            try:
-                # Load file content
-                content = self.load_policy_file(policy_file)
-
-                # Extract metadata
-                metadata = self.extract_metadata_from_filename(policy_file.name)
-                metadata["source_type"] = policy_type
-                metadata["file_path"] = str(policy_file)
-
-                # Chunk the document
-                documents = self.chunk_document(content, metadata)
-
-                # Generate embeddings (with rate limiting protection)
-                texts = [doc.page_content for doc in documents]
-                metadatas = [doc.metadata for doc in documents]
-
-                embeddings_list = self.embed_documents_batched(texts, show_progress=True)
-
-                # Add to ChromaDB
-                ids = [f"{policy_file.stem}_{i}" for i in range(len(documents))]
-
-                self.collection.add(
-                    documents=texts,
-                    embeddings=embeddings_list,
-                    metadatas=metadatas,
-                    ids=ids
-                )
+            # Extract metadata
+            metadata = self.extract_metadata_from_filename(policy_file.name)
+            metadata["source_type"] = policy_type
+            metadata["file_path"] = str(policy_file)
+            files.append((policy_file, metadata))
 
-                total_chunks += len(documents)
-                logger.info(f"Ingested {policy_file.name}: {len(documents)} chunks")
+        stats = IngestionPipeline(self).run(self.collection, files)
+        self.last_ingestion_stats[str(directory_path)] = stats
 
-            except Exception as e:
-                logger.error(f"Error ingesting {policy_file}: {e}")
-                continue
+        self._prune_missing_files(self.collection, directory_path, policy_files)
 
-        logger.info(f"Total chunks ingested: {total_chunks}")
-        return total_chunks
+        logger.info(f"Total chunks ingested: {stats['chunks_added']}")
+        return stats["chunks_added"]
 
     def ingest_policies(self) -> Dict[str, int]:
         """Ingest all policies and laws from data directories."""
@@ -481,14 +479,15 @@ class PolicyEmbeddings:
         Ingest regional policy directory into region-specific collection.
 
         Creates a separate ChromaDB collection for the region and ingests all
-        documents with regional metadata tagging.
+        documents with regional metadata tagging. Ingestion is incremental:
+        unchanged files are skipped using the ingestion manifest.
 
         Args:
             region_code: Region identifier (e.g., "dubai_uae")
             directory_path: Path to directory containing regional documents
 
         Returns:
-            Number of chunks ingested (0 if collection already populated or directory missing)
+            Number of chunks ingested (0 if nothing changed or directory missing)
 
         Example:
             >>> embeddings = PolicyEmbeddings()
@@ -502,14 +501,14 @@ class PolicyEmbeddings:
 
         # Get or create regional collection
         try:
-            regional_collection = self.chroma_client.get_or_create_collection(
-                name=collection_name,
+            regional_collection = self.registry.get_collection(
+                collection_name,
                 metadata={"hnsw:space": "cosine", "region": region_code}
             )
 
-            # Check idempotency - skip if already populated
+            # Collections built before the manifest existed cannot be diffed - keep them as-is
             existing_count = regional_collection.count()
-            if existing_count > 0:
+            if existing_count > 0 and not self.manifest.has_collection(collection_name):
                 logger.info(f"Region {region_code} already ingested ({existing_count} docs)")
                 return 0
 
@@ -539,56 +538,30 @@ class PolicyEmbeddings:
 
         logger.info(f"Found {len(policy_files)} regional documents in {directory_path}")
 
-        total_chunks = 0
+        from datetime import datetime
+        uploaded_at = datetime.now().isoformat()
+
+        files = []
         for policy_file in policy_files:
-            try:
-                # Load file content
-                content = self.load_policy_file(policy_file)
-
-                # Extract metadata from filename
-                metadata = self.extract_metadata_from_filename(policy_file.name)
-
-                # Add regional metadata
-                metadata["source_type"] = "regional"
-                metadata["region"] = region_code
-                metadata["region_name"] = region_metadata.get("region_name", region_code)
-                metadata["legal_jurisdiction"] = region_metadata.get("legal_jurisdiction", "")
-                metadata["file_path"] = str(policy_file)
-
-                # Add upload timestamp
-                from datetime import datetime
-                metadata["uploaded_at"] = datetime.now().isoformat()
-
-                # Chunk the document
-                documents = self.chunk_document(content, metadata)
-
-                # Generate embeddings (with rate limiting protection)
-                texts = [doc.page_content for doc in documents]
-                metadatas = [doc.metadata for doc in documents]
-
-                embeddings_list = self.embed_documents_batched(texts, show_progress=True)
-
-                # Add to regional collection
-                import time
-                timestamp = int(time.time() * 1000)
-                ids = [f"{policy_file.stem}_{region_code}_{timestamp}_{i}" for i in range(len(documents))]
-
-                regional_collection.add(
-                    documents=texts,
-                    embeddings=embeddings_list,
-                    metadatas=metadatas,
-                    ids=ids
-                )
+            # Extract metadata from filename
+            metadata = self.extract_metadata_from_filename(policy_file.name)
+
+            # Add regional metadata
+            metadata["source_type"] = "regional"
+            metadata["region"] = region_code
+            metadata["region_name"] = region_metadata.get("region_name", region_code)
+            metadata["legal_jurisdiction"] = region_metadata.get("legal_jurisdiction", "")
+            metadata["file_path"] = str(policy_file)
+            metadata["uploaded_at"] = uploaded_at
+            files.append((policy_file, metadata))
 
-                total_chunks += len(documents)
-                logger.info(f"Ingested {policy_file.name}: {len(documents)} chunks")
+        stats = IngestionPipeline(self).run(regional_collection, files)
+        self.last_ingestion_stats[str(directory)] = stats
 
-            except Exception as e:
-                logger.error(f"Error ingesting regional file {policy_file}: {e}")
-                continue
+        self._prune_missing_files(regional_collection, directory, policy_files)
 
-        logger.info(f"Total chunks ingested for region {region_code}: {total_chunks}")
-        return total_chunks
+        logger.info(f"Total chunks ingested for region {region_code}: {stats['chunks_added']}")
+        return stats["chunks_added"]
 
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get statistics about the vector store collection."""
@@ -613,7 +586,7 @@ class PolicyEmbeddings:
         collection_name = f"policies_{region_code}"
 
         try:
-            regional_collection = self.chroma_client.get_collection(name=collection_name)
+            regional_collection = self.registry.get_collection(collection_name, create=False)
             count = regional_collection.count()
 
             return {
@@ -655,9 +628,9 @@ class PolicyEmbeddings:
 
     def clear_collection(self):
         """Clear all documents from the collection (use with caution)."""
-        self.chroma_client.delete_collection(settings.chroma_collection_name)
-        self.collection = self.chroma_client.get_or_create_collection(
-            name=settings.chroma_collection_name,
+        self.registry.drop_collection(settings.chroma_collection_name)
+        self.collection = self.registry.get_collection(
+            settings.chroma_collection_name,
             metadata={"hnsw:space": "cosine"}
         )
         logger.warning("Collection cleared")
@@ -692,6 +665,7 @@ class PolicyEmbeddings:
                 metadatas=[metadata],
                 ids=[section_id]
             )
+            self.registry.bump_collection_generation(collection.name)
 
             logger.info(f"Embedded section {section_id} for policy {metadata.get('policy_id')}")
 
@@ -699,13 +673,85 @@ class PolicyEmbeddings:
             logger.error(f"Error embedding section {section_id}: {e}")
             raise
 
-    def delete_policy_embeddings(self, policy_id: str, company_id: str):
+    def embed_policy_sections(
+        self,
+        sections: List[Dict[str, Any]],
+        company_id: str,
+        replace_policy_id: Optional[str] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> int:
+        """
+        Embed many policy sections with batched embedding and one write.
+
+        Texts go through embed_documents_batched and the whole policy is
+        written with a single collection.upsert, instead of one embedding
+        request and one add per section.
+
+        Args:
+            sections: Dicts with "id", "content" and "metadata" keys
+            company_id: Company ID for multi-tenant isolation
+            replace_policy_id: Replace this policy's existing embeddings (stale
+                ones are deleted only after the new ones are written, so a
+                failed run leaves the old embeddings in place)
+            progress_callback: Optional callable(done, total) for embedding progress
+
+        Returns:
+            Number of sections embedded (empty sections are skipped)
+        """
+        sections = [
+            section for section in sections
+            if section.get("content") and section["content"].strip()
+        ]
+
+        if not sections:
+            if replace_policy_id:
+                self.delete_policy_embeddings(replace_policy_id, company_id)
+            return 0
+
+        try:
+            collection = self.get_or_create_user_collection(company_id)
+
+            texts = [section["content"] for section in sections]
+            embeddings_list = self.embed_documents_batched(
+                texts,
+                progress_callback=progress_callback
+            )
+
+            collection.upsert(
+                documents=texts,
+                embeddings=embeddings_list,
+                metadatas=[section["metadata"] for section in sections],
+                ids=[section["id"] for section in sections]
+            )
+            self.registry.bump_collection_generation(collection.name)
+
+            if replace_policy_id:
+                self.delete_policy_embeddings(
+                    replace_policy_id,
+                    company_id,
+                    keep_ids=[section["id"] for section in sections]
+                )
+
+            logger.info(f"Embedded {len(sections)} sections into {collection.name}")
+            return len(sections)
+
+        except Exception as e:
+            logger.error(f"Error embedding {len(sections)} policy sections: {e}")
+            raise
+
+    def delete_policy_embeddings(
+        self,
+        policy_id: str,
+        company_id: str,
+        keep_ids: Optional[Iterable[str]] = None
+    ):
         """
         Delete all embeddings for a policy.
 
         Args:
             policy_id: Policy ID
             company_id: Company ID
+            keep_ids: Embedding IDs to keep (e.g. the ones just re-embedded)
         """
         try:
             collection = self.get_or_create_user_collection(company_id)
@@ -716,12 +762,14 @@ class PolicyEmbeddings:
                 include=["metadatas"]
             )
 
-            if results and results.get('ids'):
-                ids_to_delete = results['ids']
+            keep = set(keep_ids or ())
+            ids_to_delete = [id_ for id_ in (results or {}).get('ids') or [] if id_ not in keep]
+            if ids_to_delete:
                 collection.delete(ids=ids_to_delete)
+                self.registry.bump_collection_generation(collection.name)
                 logger.info(f"Deleted {len(ids_to_delete)} embeddings for policy {policy_id}")
             else:
-                logger.info(f"No embeddings found for policy {policy_id}")
+                logger.info(f"No embeddings to delete for policy {policy_id}")
 
         except Exception as e:
             logger.error(f"Error deleting embeddings for policy {policy_id}: {e}")
@@ -0,0 +1,283 @@
+"""In-process exact cosine search over small collections using a memory-mapped matrix."""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_COMPARISONS = {
+    "$eq": lambda value, target: value == target,
+    "$ne": lambda value, target: value != target,
+    "$in": lambda value, target: value in target,
+    "$nin": lambda value, target: value not in target,
+    "$gt": lambda value, target: value is not None and value > target,
+    "$gte": lambda value, target: value is not None and value >= target,
+    "$lt": lambda value, target: value is not None and value < target,
+    "$lte": lambda value, target: value is not None and value <= target,
+}
+
+
+def matches_where(metadata: Optional[Dict[str, Any]], where: Optional[Dict[str, Any]]) -> bool:
+    """
+    Evaluate a ChromaDB-style where clause against one metadata dict.
+
+    Supports $and/$or, plain equality and the $eq, $ne, $in, $nin, $gt,
+    $gte, $lt and $lte operators. Several keys in one dict are ANDed.
+
+    Args:
+        metadata: Chunk metadata
+        where: Where clause (None matches everything)
+
+    Returns:
+        True if the metadata satisfies the clause
+    """
+    if not where:
+        return True
+
+    metadata = metadata or {}
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(matches_where(metadata, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(matches_where(metadata, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            for operator, target in condition.items():
+                compare = _COMPARISONS.get(operator)
+                if compare is None or not compare(value, target):
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+    return True
+
+
+class ExactSearchIndex:
+    """
+    Brute-force cosine index mirroring one ChromaDB collection.
+
+    The L2-normalised embedding matrix is stored as a float32 .npy file and
+    opened memory-mapped, with ids/documents/metadatas in a JSON sidecar.
+    The snapshot is tagged with the collection generation it was built at
+    and rebuilt from ChromaDB whenever a write bumps that generation. Each
+    generation's matrix gets its own file named after the generation, and
+    the sidecar (which names its matrix) is published last, so replacing
+    the sidecar is the single step that switches snapshots.
+    """
+
+    def __init__(self, collection_name: str, index_dir: str, max_chunks: int):
+        """
+        Initialize index (nothing is loaded until refresh()).
+
+        Args:
+            collection_name: Collection this index mirrors
+            index_dir: Directory for the matrix and sidecar files
+            max_chunks: Largest collection the index will hold
+        """
+        self.collection_name = collection_name
+        self.max_chunks = max_chunks
+        self.index_dir = Path(index_dir)
+        self.sidecar_path = self.index_dir / f"{collection_name}.json"
+
+        self.generation: Optional[int] = None
+        self.size = 0
+        # (matrix, ids, documents, metadatas) - swapped as a whole so queries
+        # never see a half-updated snapshot
+        self._snapshot: Optional[Tuple[np.ndarray, List[str], List[str], List[Dict[str, Any]]]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def usable(self) -> bool:
+        """True if the current snapshot can answer queries."""
+        return self._snapshot is not None
+
+    def _matrix_path(self, generation: int) -> Path:
+        """Path of the matrix file built at a generation."""
+        return self.index_dir / f"{self.collection_name}.{generation}.npy"
+
+    def _load_from_disk(self, generation: int, count: int):
+        """Open a persisted snapshot if it matches the collection (else None)."""
+        if not self.sidecar_path.exists():
+            return None
+        try:
+            with open(self.sidecar_path, "r", encoding="utf-8") as f:
+                sidecar = json.load(f)
+            ids = sidecar.get("ids", [])
+            if (
+                sidecar.get("generation") != generation
+                or sidecar.get("matrix") != self._matrix_path(generation).name
+                or len(ids) != count
+            ):
+                return None
+            matrix = np.load(self._matrix_path(generation), mmap_mode="r")
+            if matrix.shape[0] != len(ids):
+                return None
+            return matrix, ids, sidecar["documents"], sidecar["metadatas"]
+        except Exception as e:
+            logger.debug(f"Ignoring exact index snapshot for {self.collection_name}: {e}")
+            return None
+
+    def _build(self, collection, generation: int):
+        """Snapshot the collection from ChromaDB and persist it."""
+        data = collection.get(include=["embeddings", "documents", "metadatas"])
+        ids = list(data.get("ids") or [])
+        documents = list(data.get("documents") or [])
+        metadatas = [m or {} for m in (data.get("metadatas") or [])]
+
+        if ids:
+            vectors = np.array(data.get("embeddings"), dtype=np.float32)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            vectors /= norms
+        else:
+            vectors = np.zeros((0, 0), dtype=np.float32)
+
+        # Write to uniquely named temp files and rename, so readers still
+        # mapping the old matrix keep a valid file and processes rebuilding
+        # the same index at once never write into each other's files. The
+        # matrix is published under its generation's name first; the sidecar
+        # naming it goes last, so a reader never pairs mismatched files
+        matrix_path = self._matrix_path(generation)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_matrix = tempfile.mkstemp(dir=self.index_dir, suffix=".npy.tmp")
+        os.close(fd)
+        fd, tmp_sidecar = tempfile.mkstemp(dir=self.index_dir, suffix=".json.tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "generation": generation,
+                        "matrix": matrix_path.name,
+                        "ids": ids,
+                        "documents": documents,
+                        "metadatas": metadatas
+                    },
+                    f
+                )
+            matrix = np.lib.format.open_memmap(tmp_matrix, mode="w+", dtype=np.float32, shape=vectors.shape)
+            matrix[:] = vectors
+            matrix.flush()
+            del matrix
+            os.replace(tmp_matrix, matrix_path)
+            os.replace(tmp_sidecar, self.sidecar_path)
+        except BaseException:
+            Path(tmp_matrix).unlink(missing_ok=True)
+            Path(tmp_sidecar).unlink(missing_ok=True)
+            raise
+
+        self._remove_stale_matrices(generation)
+        logger.info(f"Built exact search index for {self.collection_name} ({len(ids)} chunks)")
+        # Serve this build from memory: the files on disk may already hold
+        # another process's (equivalent) build
+        return vectors, ids, documents, metadatas
+
+    def _remove_stale_matrices(self, generation: int):
+        """Delete matrix files of older generations (open maps stay valid)."""
+        prefix = f"{self.collection_name}."
+        for path in self.index_dir.glob(f"{self.collection_name}*.npy"):
+            tag = path.name[len(prefix):-len(".npy")]
+            # The unversioned matrix written by older builds is stale too
+            if path.name == f"{self.collection_name}.npy" or (tag.isdigit() and int(tag) < generation):
+                try:
+                    path.unlink()
+                except OSError as e:
+                    logger.debug(f"Could not remove stale exact index matrix {path}: {e}")
+
+    def refresh(self, collection, generation: int) -> bool:
+        """
+        Bring the snapshot up to date with the collection.
+
+        Args:
+            collection: ChromaDB collection to mirror
+            generation: Current collection generation
+
+        Returns:
+            True if the index can serve queries for this generation
+        """
+        if self.generation == generation:
+            return self.usable
+
+        with self._lock:
+            if self.generation == generation:
+                return self.usable
+
+            count = collection.count()
+            snapshot = None
+            if count <= self.max_chunks:
+                snapshot = self._load_from_disk(generation, count)
+                if snapshot is None:
+                    try:
+                        snapshot = self._build(collection, generation)
+                    except Exception as e:
+                        logger.warning(f"Exact index build failed for {self.collection_name}: {e}")
+
+            self._snapshot = snapshot
+            self.size = count
+            self.generation = generation
+            return self.usable
+
+    def query(
+        self,
+        query_embeddings: List[List[float]],
+        n_results: int,
+        where: Optional[Dict[str, Any]] = None,
+        **_: Any
+    ) -> Dict[str, List[List[Any]]]:
+        """
+        Answer top-k queries with one matrix product.
+
+        Args:
+            query_embeddings: Query vectors
+            n_results: Hits per query
+            where: Optional ChromaDB-style metadata filter
+
+        Returns:
+            Response shaped like collection.query() (documents, metadatas,
+            distances, ids as per-query lists; distance = 1 - cosine)
+        """
+        response: Dict[str, List[List[Any]]] = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise RuntimeError(f"Exact index for {self.collection_name} is not loaded")
+        matrix, ids, documents, metadatas = snapshot
+
+        candidates = np.arange(len(ids))
+        if where:
+            candidates = np.array(
+                [i for i, metadata in enumerate(metadatas) if matches_where(metadata, where)],
+                dtype=np.int64
+            )
+
+        if len(candidates) == 0 or n_results <= 0:
+            for key in response:
+                response[key] = [[] for _ in query_embeddings]
+            return response
+
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        queries /= norms
+
+        if len(candidates) < len(ids):
+            matrix = matrix[candidates]
+        scores = queries @ matrix.T  # [queries, candidates]
+        k = min(n_results, len(candidates))
+
+        for row in scores:
+            top = np.argpartition(-row, k - 1)[:k] if k < len(row) else np.arange(len(row))
+            top = top[np.argsort(-row[top])]
+            rows = candidates[top]
+            response["ids"].append([ids[i] for i in rows])
+            response["documents"].append([documents[i] for i in rows])
+            response["metadatas"].append([metadatas[i] for i in rows])
+            response["distances"].append([float(1.0 - row[j]) for j in top])
+
+        return response
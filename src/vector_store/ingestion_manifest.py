@@ -0,0 +1,261 @@
+"""Manifest of ingested files and content-addressed chunk embedding store."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text: str) -> str:
+    """Return the SHA-256 hex digest of a chunk of text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def file_hash(file_path: Path, block_size: int = 1 << 20) -> str:
+    """Return the SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def make_chunk_ids(source_key: str, prefix: str, texts: List[str]) -> List[str]:
+    """
+    Derive stable chunk IDs from chunk content.
+
+    The same chunk text from the same source always maps to the same ID, so
+    re-ingesting a file only touches chunks whose content actually changed.
+    Repeated identical chunks within one source get an occurrence suffix.
+
+    Args:
+        source_key: Identifier of the source (usually the file path)
+        prefix: Human-readable ID prefix (usually the file stem)
+        texts: Chunk texts in document order
+
+    Returns:
+        List of chunk IDs aligned with texts
+    """
+    ids = []
+    seen: Dict[str, int] = {}
+    for text in texts:
+        digest = hashlib.sha256(f"{source_key}\0{text}".encode("utf-8")).hexdigest()[:24]
+        occurrence = seen.get(digest, 0)
+        seen[digest] = occurrence + 1
+        ids.append(f"{prefix}_{digest}" if occurrence == 0 else f"{prefix}_{digest}_{occurrence}")
+    return ids
+
+
+class IngestionManifest:
+    """
+    SQLite-backed record of what has been ingested into each collection.
+
+    Tracks, per (collection, file), the file hash and the chunk IDs written,
+    and keeps a content-addressed store of chunk embeddings keyed by
+    (model, chunk hash) so unchanged chunks never hit the embedding backend.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the manifest database.
+
+        Args:
+            db_path: Path to the SQLite file
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS ingested_files (
+                collection TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                file_hash TEXT NOT NULL,
+                chunk_ids TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (collection, file_path)
+            );
+            CREATE TABLE IF NOT EXISTS chunk_embeddings (
+                model TEXT NOT NULL,
+                chunk_hash TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                PRIMARY KEY (model, chunk_hash)
+            );
+            CREATE TABLE IF NOT EXISTS collection_generations (
+                collection TEXT PRIMARY KEY,
+                generation INTEGER NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+        logger.info(f"Ingestion manifest at {db_path}")
+
+    # ------------------------------------------------------------------
+    # File records
+    # ------------------------------------------------------------------
+
+    def get_file(self, collection: str, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the manifest record for a file.
+
+        Args:
+            collection: Collection name
+            file_path: Path of the ingested file
+
+        Returns:
+            Dict with file_hash and chunk_ids, or None if never ingested
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT file_hash, chunk_ids FROM ingested_files WHERE collection = ? AND file_path = ?",
+                (collection, file_path)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"file_hash": row[0], "chunk_ids": json.loads(row[1])}
+
+    def record_file(self, collection: str, file_path: str, file_hash: str, chunk_ids: List[str]):
+        """Store the hash and chunk IDs of an ingested file."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ingested_files "
+                "(collection, file_path, file_hash, chunk_ids, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (collection, file_path, file_hash, json.dumps(chunk_ids), datetime.now().isoformat())
+            )
+            self._conn.commit()
+
+    def forget_file(self, collection: str, file_path: str):
+        """Remove a file's record."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM ingested_files WHERE collection = ? AND file_path = ?",
+                (collection, file_path)
+            )
+            self._conn.commit()
+
+    def files_in_collection(self, collection: str) -> Dict[str, List[str]]:
+        """
+        List all recorded files of a collection.
+
+        Returns:
+            Mapping of file_path to its chunk IDs
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT file_path, chunk_ids FROM ingested_files WHERE collection = ?",
+                (collection,)
+            ).fetchall()
+        return {row[0]: json.loads(row[1]) for row in rows}
+
+    def has_collection(self, collection: str) -> bool:
+        """Return True if any file has been recorded for the collection."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM ingested_files WHERE collection = ? LIMIT 1",
+                (collection,)
+            ).fetchone()
+        return row is not None
+
+    def forget_collection(self, collection: str):
+        """Remove all file records of a collection (after it was dropped)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM ingested_files WHERE collection = ?", (collection,))
+            self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Collection generations
+    # ------------------------------------------------------------------
+
+    def get_generation(self, collection: str) -> int:
+        """Return the write generation of a collection (0 if never written)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT generation FROM collection_generations WHERE collection = ?",
+                (collection,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def bump_generation(self, collection: str) -> int:
+        """
+        Advance a collection's write generation.
+
+        Stored here rather than in memory so writes made by other processes
+        (ingestion scripts, workers) invalidate this process's caches too.
+
+        Returns:
+            The new generation
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO collection_generations (collection, generation) VALUES (?, 1) "
+                "ON CONFLICT(collection) DO UPDATE SET generation = generation + 1",
+                (collection,)
+            )
+            self._conn.commit()
+            row = self._conn.execute(
+                "SELECT generation FROM collection_generations WHERE collection = ?",
+                (collection,)
+            ).fetchone()
+        return row[0]
+
+    # ------------------------------------------------------------------
+    # Chunk embedding store
+    # ------------------------------------------------------------------
+
+    def get_embeddings(self, model: str, chunk_hashes: List[str]) -> Dict[str, List[float]]:
+        """
+        Look up stored embeddings by chunk hash.
+
+        Args:
+            model: Embedding model name
+            chunk_hashes: Content hashes to look up
+
+        Returns:
+            Mapping of chunk hash to embedding for the hashes that were found
+        """
+        found: Dict[str, List[float]] = {}
+        unique = list(dict.fromkeys(chunk_hashes))
+        with self._lock:
+            # Stay well below SQLite's host-parameter limit
+            for i in range(0, len(unique), 500):
+                batch = unique[i:i + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT chunk_hash, embedding FROM chunk_embeddings "
+                    f"WHERE model = ? AND chunk_hash IN ({placeholders})",
+                    [model, *batch]
+                ).fetchall()
+                for chunk_hash, blob in rows:
+                    values = array("f")
+                    values.frombytes(blob)
+                    found[chunk_hash] = values.tolist()
+        return found
+
+    def put_embeddings(self, model: str, embeddings: Dict[str, List[float]]):
+        """Store embeddings keyed by chunk hash."""
+        if not embeddings:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO chunk_embeddings (model, chunk_hash, embedding) VALUES (?, ?, ?)",
+                [
+                    (model, chunk_hash, array("f", embedding).tobytes())
+                    for chunk_hash, embedding in embeddings.items()
+                ]
+            )
+            self._conn.commit()
+
+    def close(self):
+        """Close the manifest database."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,498 @@
+"""Staged streaming ingestion: parallel extraction, batched embedding, bulk writes."""
+
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+import PyPDF2
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from ..core.config import settings
+from .ingestion_manifest import file_hash, make_chunk_ids
+
+if TYPE_CHECKING:
+    from .embeddings import PolicyEmbeddings
+
+logger = logging.getLogger(__name__)
+
+# Queue sentinel marking the end of a stage's output
+_DONE = object()
+
+
+# ----------------------------------------------------------------------
+# Extraction and chunking (run inside the process pool)
+# ----------------------------------------------------------------------
+
+def extract_text(file_path: Path) -> str:
+    """
+    Load a policy file as text (supports .txt, .md, .pdf).
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        File text (PDF pages joined by blank lines)
+    """
+    if file_path.suffix.lower() == '.pdf':
+        text_content = []
+        with open(file_path, 'rb') as pdf_file:
+            pdf_reader = PyPDF2.PdfReader(pdf_file)
+            for page in pdf_reader.pages:
+                text = page.extract_text()
+                if text.strip():
+                    text_content.append(text)
+        return "\n\n".join(text_content)
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def chunk_text(
+    content: str,
+    metadata: Dict[str, Any],
+    splitter: RecursiveCharacterTextSplitter
+) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """
+    Split text into chunks and build per-chunk metadata.
+
+    Args:
+        content: Document text
+        metadata: Base metadata for every chunk
+        splitter: Text splitter to use
+
+    Returns:
+        Tuple of (chunk texts, chunk metadatas)
+    """
+    chunks = splitter.split_text(content)
+    metadatas = [
+        {**metadata, "chunk_index": i, "total_chunks": len(chunks)}
+        for i in range(len(chunks))
+    ]
+    return chunks, metadatas
+
+
+def make_text_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    """Build the splitter used for policy documents."""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=["\n\n", "\n", ". ", " ", ""]
+    )
+
+
+def prepare_file(
+    file_path: str,
+    metadata: Dict[str, Any],
+    known_hash: Optional[str],
+    chunk_size: int,
+    chunk_overlap: int
+) -> Dict[str, Any]:
+    """
+    Hash, extract and chunk one file (process pool entry point).
+
+    Args:
+        file_path: Path of the file
+        metadata: Base metadata for every chunk
+        known_hash: File hash recorded in the manifest, if any
+        chunk_size: Splitter chunk size
+        chunk_overlap: Splitter chunk overlap
+
+    Returns:
+        Dict with file_path, file_hash, unchanged flag, texts and metadatas
+    """
+    path = Path(file_path)
+    current_hash = file_hash(path)
+    if current_hash == known_hash:
+        return {"file_path": file_path, "file_hash": current_hash, "unchanged": True}
+
+    content = extract_text(path)
+    texts, metadatas = chunk_text(content, metadata, make_text_splitter(chunk_size, chunk_overlap))
+    return {
+        "file_path": file_path,
+        "file_hash": current_hash,
+        "unchanged": False,
+        "texts": texts,
+        "metadatas": metadatas
+    }
+
+
+# ----------------------------------------------------------------------
+# Diffing against the manifest (shared with PolicyEmbeddings._sync_file)
+# ----------------------------------------------------------------------
+
+def plan_file_update(
+    source_key: str,
+    record: Optional[Dict[str, Any]],
+    texts: List[str],
+    metadatas: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Diff a re-chunked file against its manifest record.
+
+    Args:
+        source_key: File path the chunks belong to
+        record: The file's manifest record, or None if it has none
+        texts: New chunk texts
+        metadatas: New chunk metadatas
+
+    Returns:
+        Plan with the file's chunk ids, removed ids, chunks to add and
+        kept chunks whose metadata must be refreshed
+    """
+    ids = make_chunk_ids(source_key, Path(source_key).stem, texts)
+    previous_ids: Set[str] = set(record["chunk_ids"]) if record else set()
+
+    added = [i for i, chunk_id in enumerate(ids) if chunk_id not in previous_ids]
+    kept = [i for i, chunk_id in enumerate(ids) if chunk_id in previous_ids]
+    return {
+        "file_path": source_key,
+        "ids": ids,
+        "legacy": record is None,
+        "removed_ids": list(previous_ids - set(ids)),
+        "add_ids": [ids[i] for i in added],
+        "add_texts": [texts[i] for i in added],
+        "add_metadatas": [metadatas[i] for i in added],
+        "keep_ids": [ids[i] for i in kept],
+        "keep_metadatas": [metadatas[i] for i in kept]
+    }
+
+
+def apply_file_updates(collection, plans: List[Dict[str, Any]]):
+    """
+    Apply planned file updates to a collection with bulk writes.
+
+    Each plan needs add_embeddings aligned with its add_texts. The caller
+    records the manifest and bumps the collection generation.
+
+    Args:
+        collection: Target ChromaDB collection
+        plans: Plans from plan_file_update()
+    """
+    for plan in plans:
+        if plan["legacy"]:
+            # Drop chunks left behind by earlier (timestamp-ID) ingestion of this file
+            collection.delete(where={"file_path": plan["file_path"]})
+        if plan["removed_ids"]:
+            collection.delete(ids=plan["removed_ids"])
+
+    ids = [chunk_id for plan in plans for chunk_id in plan["add_ids"]]
+    if ids:
+        collection.upsert(
+            ids=ids,
+            documents=[text for plan in plans for text in plan["add_texts"]],
+            embeddings=[vector for plan in plans for vector in plan["add_embeddings"]],
+            metadatas=[metadata for plan in plans for metadata in plan["add_metadatas"]]
+        )
+
+    # Kept chunks may sit at a different position in the new chunking;
+    # refresh their metadata (chunk_index, total_chunks, ...) without re-embedding
+    keep_ids = [chunk_id for plan in plans for chunk_id in plan["keep_ids"]]
+    if keep_ids:
+        collection.update(
+            ids=keep_ids,
+            metadatas=[metadata for plan in plans for metadata in plan["keep_metadatas"]]
+        )
+
+
+# ----------------------------------------------------------------------
+# Pipeline
+# ----------------------------------------------------------------------
+
+class IngestionPipeline:
+    """
+    Ingest many files into one collection with overlapping stages.
+
+    Stage 1 hashes, extracts and chunks files in a process pool. Stage 2
+    embedding workers diff chunks against the ingestion manifest and embed
+    only new ones, batching across files. Stage 3 is a single writer that
+    applies deletes, bulk upserts and metadata refreshes to ChromaDB and
+    records the manifest. Bounded queues between stages provide
+    backpressure so a slow embedding API never lets extracted text pile
+    up in memory.
+    """
+
+    def __init__(
+        self,
+        embeddings: "PolicyEmbeddings",
+        workers: Optional[int] = None,
+        embed_workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        write_batch_size: Optional[int] = None
+    ):
+        """
+        Initialize pipeline.
+
+        Args:
+            embeddings: PolicyEmbeddings providing the backend and manifest
+            workers: Extraction processes (default: settings.ingestion_workers or CPU count)
+            embed_workers: Embedding threads (default: settings.embedding_max_concurrency)
+            queue_size: Capacity of each inter-stage queue (default: from settings)
+            write_batch_size: Chunks per ChromaDB upsert (default: from settings)
+        """
+        self.embeddings = embeddings
+        self.manifest = embeddings.manifest
+        self.workers = workers or settings.ingestion_workers or os.cpu_count() or 1
+        self.embed_workers = embed_workers or settings.embedding_max_concurrency
+        self.queue_size = queue_size or settings.ingestion_queue_size
+        self.write_batch_size = write_batch_size or settings.ingestion_write_batch_size
+        if embeddings.is_local and embed_workers is None:
+            # One encoder instance - extra threads would only contend for it
+            self.embed_workers = 1
+        self._stats_lock = threading.Lock()
+
+    def _count(self, stats: Dict[str, Any], key: str, amount: int = 1):
+        """Increment a stats counter shared by the stage threads."""
+        with self._stats_lock:
+            stats[key] += amount
+
+    # -- stage 1 ---------------------------------------------------------
+
+    def _extract_stage(
+        self,
+        collection_name: str,
+        files: List[Tuple[Path, Dict[str, Any]]],
+        out_queue: "queue.Queue",
+        stats: Dict[str, Any]
+    ):
+        """Feed prepared files to the embedding stage, at most queue_size ahead."""
+        jobs = [
+            (
+                str(path),
+                metadata,
+                (self.manifest.get_file(collection_name, str(path)) or {}).get("file_hash"),
+                settings.chunk_size,
+                settings.chunk_overlap
+            )
+            for path, metadata in files
+        ]
+
+        try:
+            if self.workers <= 1 or len(jobs) <= 1:
+                for job in jobs:
+                    self._emit_prepared(job[0], lambda job=job: prepare_file(*job), out_queue, stats)
+                return
+
+            # Spawn rather than fork: the parent already holds the embedding
+            # model, Chroma client and worker threads
+            context = multiprocessing.get_context("spawn")
+            pool_size = min(self.workers, len(jobs))
+            with ProcessPoolExecutor(max_workers=pool_size, mp_context=context) as pool:
+                pending = iter(jobs)
+                in_flight: Dict[Future, str] = {}
+
+                def submit_next() -> bool:
+                    job = next(pending, None)
+                    if job is None:
+                        return False
+                    in_flight[pool.submit(prepare_file, *job)] = job[0]
+                    return True
+
+                for _ in range(pool_size + self.queue_size):
+                    if not submit_next():
+                        break
+
+                while in_flight:
+                    done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        source = in_flight.pop(future)
+                        # Blocks while the embedding stage is behind (backpressure)
+                        self._emit_prepared(source, future.result, out_queue, stats)
+                        submit_next()
+        finally:
+            for _ in range(self.embed_workers):
+                out_queue.put(_DONE)
+
+    def _emit_prepared(self, source: str, get_result, out_queue: "queue.Queue", stats: Dict[str, Any]):
+        """Forward one prepared file downstream, counting skips and failures."""
+        try:
+            prepared = get_result()
+        except Exception as e:
+            logger.error(f"Error preparing {source}: {e}")
+            self._count(stats, "failed")
+            return
+
+        if prepared["unchanged"]:
+            logger.info(f"Unchanged, skipping {Path(source).name}")
+            self._count(stats, "skipped")
+            return
+        out_queue.put(prepared)
+
+    # -- stage 2 ---------------------------------------------------------
+
+    def _plan(self, collection_name: str, prepared: Dict[str, Any]) -> Dict[str, Any]:
+        """Diff a prepared file against its manifest record."""
+        plan = plan_file_update(
+            prepared["file_path"],
+            self.manifest.get_file(collection_name, prepared["file_path"]),
+            prepared["texts"],
+            prepared["metadatas"]
+        )
+        plan["file_hash"] = prepared["file_hash"]
+        return plan
+
+    def _embed_stage(
+        self,
+        collection_name: str,
+        in_queue: "queue.Queue",
+        out_queue: "queue.Queue",
+        stats: Dict[str, Any]
+    ):
+        """Embed new chunks, grouping small files into one embedding call."""
+        finished = False
+        while not finished:
+            item = in_queue.get()
+            if item is _DONE:
+                break
+
+            plans = [self._plan(collection_name, item)]
+            pending_texts = len(plans[0]["add_texts"])
+            # Opportunistically batch further files that are already waiting
+            while pending_texts < self.write_batch_size:
+                try:
+                    item = in_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    finished = True
+                    break
+                plans.append(self._plan(collection_name, item))
+                pending_texts += len(plans[-1]["add_texts"])
+
+            texts = [text for plan in plans for text in plan["add_texts"]]
+            try:
+                vectors = self.embeddings.embed_chunks_with_store(texts) if texts else []
+            except Exception as e:
+                logger.error(f"Error embedding {len(texts)} chunks from {len(plans)} file(s): {e}")
+                self._count(stats, "failed", len(plans))
+                continue
+
+            offset = 0
+            for plan in plans:
+                count = len(plan["add_texts"])
+                plan["add_embeddings"] = vectors[offset:offset + count]
+                offset += count
+                out_queue.put(plan)
+
+        out_queue.put(_DONE)
+
+    # -- stage 3 ---------------------------------------------------------
+
+    def _flush(self, collection, plans: List[Dict[str, Any]], stats: Dict[str, Any]):
+        """Apply a group of file updates with one bulk upsert."""
+        apply_file_updates(collection, plans)
+
+        for plan in plans:
+            self.manifest.record_file(collection.name, plan["file_path"], plan["file_hash"], plan["ids"])
+            self._count(stats, "files")
+            self._count(stats, "chunks_added", len(plan["add_ids"]))
+            self._count(stats, "chunks_removed", len(plan["removed_ids"]))
+            logger.info(
+                f"Ingested {Path(plan['file_path']).name}: {len(plan['add_ids'])} added, "
+                f"{len(plan['removed_ids'])} removed, "
+                f"{len(plan['ids']) - len(plan['add_ids'])} unchanged chunks in {collection.name}"
+            )
+
+        self.embeddings.registry.bump_collection_generation(collection.name)
+
+    def _write_stage(self, collection, in_queue: "queue.Queue", stats: Dict[str, Any]):
+        """Single ChromaDB writer accumulating plans into bulk upserts."""
+        remaining_producers = self.embed_workers
+        buffer: List[Dict[str, Any]] = []
+        buffered_chunks = 0
+
+        while remaining_producers:
+            item = in_queue.get()
+            if item is _DONE:
+                remaining_producers -= 1
+                continue
+
+            buffer.append(item)
+            buffered_chunks += len(item["add_ids"])
+            if buffered_chunks >= self.write_batch_size:
+                self._flush_safely(collection, buffer, stats)
+                buffer, buffered_chunks = [], 0
+
+        if buffer:
+            self._flush_safely(collection, buffer, stats)
+
+    def _flush_safely(self, collection, plans: List[Dict[str, Any]], stats: Dict[str, Any]):
+        """Flush, counting the files as failed if ChromaDB rejects the write."""
+        try:
+            self._flush(collection, plans, stats)
+        except Exception as e:
+            logger.error(f"Error writing {len(plans)} file(s) to {collection.name}: {e}")
+            self._count(stats, "failed", len(plans))
+
+    # -- driver ----------------------------------------------------------
+
+    def run(self, collection, files: List[Tuple[Path, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Ingest files into a collection.
+
+        Args:
+            collection: Target ChromaDB collection
+            files: (path, base metadata) pairs
+
+        Returns:
+            Stats dict: files, skipped, failed, chunks_added, chunks_removed,
+            seconds and chunks_per_second
+        """
+        stats: Dict[str, Any] = {
+            "files": 0,
+            "skipped": 0,
+            "failed": 0,
+            "chunks_added": 0,
+            "chunks_removed": 0
+        }
+        if not files:
+            return {**stats, "seconds": 0.0, "chunks_per_second": 0.0}
+
+        started = time.perf_counter()
+        prepared_queue: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        embedded_queue: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+
+        threads = [
+            threading.Thread(
+                target=self._extract_stage,
+                args=(collection.name, files, prepared_queue, stats),
+                name="ingest-extract",
+                daemon=True
+            ),
+            threading.Thread(
+                target=self._write_stage,
+                args=(collection, embedded_queue, stats),
+                name="ingest-write",
+                daemon=True
+            )
+        ]
+        threads += [
+            threading.Thread(
+                target=self._embed_stage,
+                args=(collection.name, prepared_queue, embedded_queue, stats),
+                name=f"ingest-embed-{i}",
+                daemon=True
+            )
+            for i in range(self.embed_workers)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        elapsed = time.perf_counter() - started
+        stats["seconds"] = round(elapsed, 2)
+        stats["chunks_per_second"] = round(stats["chunks_added"] / elapsed, 1) if elapsed > 0 else 0.0
+
+        logger.info(
+            f"Pipeline ingested {stats['chunks_added']} chunks from {stats['files']} file(s) into "
+            f"{collection.name} in {stats['seconds']}s ({stats['chunks_per_second']} chunks/s; "
+            f"{stats['skipped']} unchanged, {stats['failed']} failed)"
+        )
+        return stats
@@ -0,0 +1,206 @@
+"""Bounded LRU cache for query embeddings with optional SQLite persistence."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class QueryEmbeddingCache:
+    """
+    Cache query embeddings keyed by (model name, SHA-256 of the text).
+
+    Hot entries live in an in-memory LRU. When a path is given, every
+    computed embedding is also written to a local SQLite file so hits
+    survive restarts; memory misses fall back to that file before calling
+    the embedding backend.
+    """
+
+    def __init__(self, max_entries: int = 2048, persist_path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of embeddings kept in memory
+            persist_path: Optional SQLite file for persistence (None = memory only)
+        """
+        self.max_entries = max_entries
+        self.persist_path = persist_path
+        self._entries: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if persist_path:
+            self._open_store(persist_path)
+
+    def _open_store(self, path: str):
+        """Open (or create) the SQLite persistence file."""
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS query_embeddings (
+                    model TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    PRIMARY KEY (model, text_hash)
+                )
+                """
+            )
+            self._conn.commit()
+            logger.info(f"Query embedding cache persisted at {path}")
+        except Exception as e:
+            logger.warning(f"Query embedding cache persistence disabled ({path}): {e}")
+            self._conn = None
+
+    @staticmethod
+    def _hash_text(text: str) -> str:
+        """Return the SHA-256 hex digest of a query string."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _encode(embedding: List[float]) -> bytes:
+        """Pack an embedding as float32 bytes."""
+        return array("f", embedding).tobytes()
+
+    @staticmethod
+    def _decode(blob: bytes) -> List[float]:
+        """Unpack float32 bytes into a list of floats."""
+        values = array("f")
+        values.frombytes(blob)
+        return values.tolist()
+
+    def _remember(self, key: Tuple[str, str], embedding: List[float]):
+        """Insert into the in-memory LRU, evicting the oldest entry if full."""
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """
+        Look up a cached embedding.
+
+        Args:
+            model: Embedding model name
+            text: Query text
+
+        Returns:
+            Embedding vector or None on miss
+        """
+        key = (model, self._hash_text(text))
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return embedding
+
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT embedding FROM query_embeddings WHERE model = ? AND text_hash = ?",
+                        key
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    logger.debug(f"Query embedding cache read failed: {e}")
+                    row = None
+                if row is not None:
+                    embedding = self._decode(row[0])
+                    self._remember(key, embedding)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return embedding
+
+            self.misses += 1
+            return None
+
+    def put(self, model: str, text: str, embedding: List[float]):
+        """
+        Store an embedding.
+
+        Args:
+            model: Embedding model name
+            text: Query text
+            embedding: Embedding vector
+        """
+        key = (model, self._hash_text(text))
+        with self._lock:
+            self._remember(key, list(embedding))
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO query_embeddings (model, text_hash, embedding) VALUES (?, ?, ?)",
+                        (key[0], key[1], self._encode(embedding))
+                    )
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.debug(f"Query embedding cache write failed: {e}")
+
+    def get_or_compute(
+        self,
+        model: str,
+        text: str,
+        compute: Callable[[str], List[float]]
+    ) -> List[float]:
+        """
+        Return the cached embedding, computing and storing it on a miss.
+
+        Args:
+            model: Embedding model name
+            text: Query text
+            compute: Function that embeds the text (e.g. backend.embed_query)
+
+        Returns:
+            Embedding vector
+        """
+        embedding = self.get(model, text)
+        if embedding is None:
+            embedding = compute(text)
+            self.put(model, text, embedding)
+        return embedding
+
+    def clear(self):
+        """Drop all in-memory entries and reset counters (persisted rows are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    def close(self):
+        """Close the persistence file."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hit-rate metrics.
+
+        Returns:
+            Dictionary with hits, misses, hit rate and size
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "persistent": self._conn is not None
+        }
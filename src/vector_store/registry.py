@@ -0,0 +1,457 @@
+"""Process-wide registry of shared embedding backends and ChromaDB handles."""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import chromadb
+from chromadb.config import Settings as ChromaSettings
+
+from ..core.config import settings
+from .query_cache import QueryEmbeddingCache
+from .ingestion_manifest import IngestionManifest
+from .retrieval_cache import RetrievalResultCache
+from .embedding_scheduler import EmbeddingScheduler
+from .exact_index import ExactSearchIndex
+
+logger = logging.getLogger(__name__)
+
+
+class VectorStoreRegistry:
+    """
+    Hands out shared embedding models, Chroma clients and collection handles.
+
+    Loading a SentenceTransformer or opening a PersistentClient costs seconds
+    and hundreds of MB, so every PolicyEmbeddings/PolicyRetriever in the
+    process borrows them from here instead of building its own.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._lock = threading.RLock()
+        self._embeddings: Dict[Tuple[str, str], Any] = {}
+        self._clients: Dict[str, Any] = {}
+        self._collections: Dict[Tuple[str, str], Any] = {}
+        self._query_cache: Optional[QueryEmbeddingCache] = None
+        self._manifest: Optional[IngestionManifest] = None
+        self._retrieval_cache: Optional[RetrievalResultCache] = None
+        self._embedding_scheduler: Optional[EmbeddingScheduler] = None
+        self._exact_indexes: Dict[str, ExactSearchIndex] = {}
+
+    # ------------------------------------------------------------------
+    # Embedding backends
+    # ------------------------------------------------------------------
+
+    def _backend_key(self, use_local: Optional[bool] = None) -> Tuple[str, str]:
+        """Return the (kind, model_name) key for the configured backend."""
+        if use_local is None:
+            use_local = settings.use_local_embeddings
+        if use_local:
+            return ("local", settings.local_embedding_model)
+        return ("gemini", settings.embedding_model)
+
+    def get_embeddings(self, use_local: Optional[bool] = None):
+        """
+        Get the shared embedding backend, loading it on first use.
+
+        Args:
+            use_local: Force local/API backend (default: from settings)
+
+        Returns:
+            Object exposing embed_documents() and embed_query()
+        """
+        key = self._backend_key(use_local)
+        backend = self._embeddings.get(key)
+        if backend is not None:
+            return backend
+
+        with self._lock:
+            backend = self._embeddings.get(key)
+            if backend is None:
+                kind, model_name = key
+                if kind == "local":
+                    from .embeddings import LocalEmbeddings
+                    logger.info("🖥️  Loading shared LOCAL embedding model")
+                    backend = LocalEmbeddings(model_name)
+                else:
+                    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+                    logger.info("☁️  Creating shared Gemini API embedding client")
+                    backend = GoogleGenerativeAIEmbeddings(
+                        model=model_name,
+                        google_api_key=settings.google_api_key
+                    )
+                self._embeddings[key] = backend
+            return backend
+
+    def embedding_model_name(self, use_local: Optional[bool] = None) -> str:
+        """Return the model name of the configured embedding backend."""
+        return self._backend_key(use_local)[1]
+
+    def get_embedding_scheduler(self) -> EmbeddingScheduler:
+        """
+        Get the shared embedding API scheduler.
+
+        Shared so that every ingestion in the process draws from the same
+        RPM/TPM budget.
+        """
+        if self._embedding_scheduler is not None:
+            return self._embedding_scheduler
+
+        with self._lock:
+            if self._embedding_scheduler is None:
+                self._embedding_scheduler = EmbeddingScheduler(
+                    requests_per_minute=settings.embedding_requests_per_minute,
+                    tokens_per_minute=settings.embedding_tokens_per_minute,
+                    max_concurrency=settings.embedding_max_concurrency
+                )
+            return self._embedding_scheduler
+
+    def get_query_cache(self) -> QueryEmbeddingCache:
+        """Get the shared query-embedding cache."""
+        if self._query_cache is not None:
+            return self._query_cache
+
+        with self._lock:
+            if self._query_cache is None:
+                self._query_cache = QueryEmbeddingCache(
+                    max_entries=settings.query_embedding_cache_size,
+                    persist_path=settings.query_embedding_cache_path or None
+                )
+            return self._query_cache
+
+    def embed_query(self, text: str, use_local: Optional[bool] = None) -> List[float]:
+        """
+        Embed a query through the shared backend and query-embedding cache.
+
+        Args:
+            text: Query text
+            use_local: Force local/API backend (default: from settings)
+
+        Returns:
+            Embedding vector
+        """
+        return self.get_query_cache().get_or_compute(
+            self.embedding_model_name(use_local),
+            text,
+            self.get_embeddings(use_local).embed_query
+        )
+
+    def get_ingestion_manifest(self) -> IngestionManifest:
+        """Get the shared ingestion manifest and chunk embedding store."""
+        if self._manifest is not None:
+            return self._manifest
+
+        with self._lock:
+            if self._manifest is None:
+                self._manifest = IngestionManifest(settings.ingestion_manifest_path)
+            return self._manifest
+
+    def get_retrieval_cache(self) -> RetrievalResultCache:
+        """Get the shared retrieval result cache."""
+        if self._retrieval_cache is not None:
+            return self._retrieval_cache
+
+        with self._lock:
+            if self._retrieval_cache is None:
+                self._retrieval_cache = RetrievalResultCache(
+                    max_entries=settings.retrieval_cache_size
+                )
+            return self._retrieval_cache
+
+    def collection_generation(self, name: str) -> int:
+        """Return the current write generation of a collection."""
+        return self.get_ingestion_manifest().get_generation(name)
+
+    def bump_collection_generation(self, name: str) -> int:
+        """
+        Mark a collection as modified.
+
+        Must be called after every write to a collection so cached retrieval
+        results for it stop being served.
+
+        Args:
+            name: Collection name
+
+        Returns:
+            The new generation
+        """
+        generation = self.get_ingestion_manifest().bump_generation(name)
+        self.get_retrieval_cache().invalidate(name)
+        return generation
+
+    def embed_queries(self, texts: List[str], use_local: Optional[bool] = None) -> List[List[float]]:
+        """
+        Embed several queries with a single backend call for the cache misses.
+
+        Args:
+            texts: Query texts
+            use_local: Force local/API backend (default: from settings)
+
+        Returns:
+            Embedding vectors aligned with texts
+        """
+        cache = self.get_query_cache()
+        model = self.embedding_model_name(use_local)
+        embeddings: List[Optional[List[float]]] = [cache.get(model, text) for text in texts]
+
+        missing = list(dict.fromkeys(text for text, emb in zip(texts, embeddings) if emb is None))
+        if missing:
+            backend = self.get_embeddings(use_local)
+            kind = self._backend_key(use_local)[0]
+            if kind == "gemini":
+                # Keep query-side task type so cached vectors match embed_query()
+                computed = backend.embed_documents(missing, task_type="retrieval_query")
+            else:
+                computed = backend.embed_documents(missing)
+            by_text = dict(zip(missing, computed))
+            for text, embedding in by_text.items():
+                cache.put(model, text, embedding)
+            embeddings = [emb if emb is not None else by_text[text] for text, emb in zip(texts, embeddings)]
+
+        return embeddings
+
+    # ------------------------------------------------------------------
+    # ChromaDB clients and collections
+    # ------------------------------------------------------------------
+
+    def get_chroma_client(self, path: Optional[str] = None):
+        """
+        Get the shared PersistentClient for a database path.
+
+        Args:
+            path: ChromaDB path (default: settings.chroma_db_path)
+
+        Returns:
+            chromadb client instance
+        """
+        path = str(path or settings.chroma_db_path)
+        client = self._clients.get(path)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._clients.get(path)
+            if client is None:
+                logger.info(f"Opening shared ChromaDB client at {path}")
+                client = chromadb.PersistentClient(
+                    path=path,
+                    settings=ChromaSettings(anonymized_telemetry=False)
+                )
+                self._clients[path] = client
+            return client
+
+    def get_collection(
+        self,
+        name: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        create: bool = True,
+        path: Optional[str] = None
+    ):
+        """
+        Get a cached collection handle.
+
+        Args:
+            name: Collection name
+            metadata: Metadata used if the collection has to be created
+            create: Create the collection if it does not exist
+            path: ChromaDB path (default: settings.chroma_db_path)
+
+        Returns:
+            ChromaDB collection instance
+
+        Raises:
+            Exception: If create is False and the collection does not exist
+        """
+        path = str(path or settings.chroma_db_path)
+        key = (path, name)
+        collection = self._collections.get(key)
+        if collection is not None:
+            return collection
+
+        with self._lock:
+            collection = self._collections.get(key)
+            if collection is None:
+                client = self.get_chroma_client(path)
+                if create:
+                    collection = client.get_or_create_collection(
+                        name=name,
+                        metadata=metadata or {"hnsw:space": "cosine"}
+                    )
+                else:
+                    collection = client.get_collection(name=name)
+                self._collections[key] = collection
+            return collection
+
+    def get_exact_index(self, collection) -> Optional[ExactSearchIndex]:
+        """
+        Get an up-to-date exact search index for a small collection.
+
+        Args:
+            collection: ChromaDB collection
+
+        Returns:
+            ExactSearchIndex if the collection is at or below
+            settings.exact_search_max_chunks, otherwise None
+        """
+        if settings.exact_search_max_chunks <= 0:
+            return None
+
+        index = self._exact_indexes.get(collection.name)
+        if index is None:
+            with self._lock:
+                index = self._exact_indexes.get(collection.name)
+                if index is None:
+                    index = ExactSearchIndex(
+                        collection.name,
+                        settings.exact_index_dir,
+                        settings.exact_search_max_chunks
+                    )
+                    self._exact_indexes[collection.name] = index
+
+        if index.refresh(collection, self.collection_generation(collection.name)):
+            return index
+        return None
+
+    def drop_collection(self, name: str, path: Optional[str] = None) -> bool:
+        """
+        Delete a collection and evict its cached handle.
+
+        Args:
+            name: Collection name
+            path: ChromaDB path (default: settings.chroma_db_path)
+
+        Returns:
+            True if the collection existed and was deleted
+        """
+        path = str(path or settings.chroma_db_path)
+        with self._lock:
+            self._collections.pop((path, name), None)
+            self._exact_indexes.pop(name, None)
+            self.get_ingestion_manifest().forget_collection(name)
+            self.bump_collection_generation(name)
+            try:
+                self.get_chroma_client(path).delete_collection(name)
+                return True
+            except Exception as e:
+                logger.debug(f"Collection {name} not deleted: {e}")
+                return False
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def warm_up(self):
+        """
+        Load the configured embedding backend and open the default collection.
+
+        Called once at application startup so the first request does not pay
+        the model load.
+        """
+        logger.info("🔥 Warming up vector store registry...")
+        embeddings = self.get_embeddings()
+        if hasattr(embeddings, "model"):
+            # Run one tiny encode so lazy CUDA/tokenizer init happens now
+            embeddings.embed_query("warm up")
+        self.get_collection(settings.chroma_collection_name)
+        logger.info(f"✅ Vector store registry ready: {self.memory_report()}")
+
+    def close(self):
+        """Release all shared backends, clients and collection handles."""
+        with self._lock:
+            self._collections.clear()
+            self._exact_indexes.clear()
+            for client in self._clients.values():
+                try:
+                    if hasattr(client, "clear_system_cache"):
+                        client.clear_system_cache()
+                except Exception as e:
+                    logger.debug(f"Error closing ChromaDB client: {e}")
+            self._clients.clear()
+            self._embeddings.clear()
+            if self._query_cache is not None:
+                self._query_cache.close()
+                self._query_cache = None
+            if self._manifest is not None:
+                self._manifest.close()
+                self._manifest = None
+            self._retrieval_cache = None
+        logger.info("Vector store registry closed")
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def _estimate_backend_bytes(self, backend) -> int:
+        """Estimate resident bytes of an embedding backend's weights."""
+        model = getattr(backend, "model", None)
+        if model is None or not hasattr(model, "parameters"):
+            return 0
+        try:
+            total = 0
+            for param in model.parameters():
+                total += param.nelement() * param.element_size()
+            for buffer in model.buffers():
+                total += buffer.nelement() * buffer.element_size()
+            return total
+        except Exception as e:
+            logger.debug(f"Could not estimate model memory: {e}")
+            return 0
+
+    def memory_report(self) -> Dict[str, Any]:
+        """
+        Report what the registry currently holds.
+
+        Returns:
+            Dictionary with per-backend memory (MB) and handle counts
+        """
+        backends = {}
+        for (kind, model_name), backend in list(self._embeddings.items()):
+            backends[f"{kind}:{model_name}"] = {
+                "kind": kind,
+                "model": model_name,
+                "memory_mb": round(self._estimate_backend_bytes(backend) / (1024 * 1024), 1)
+            }
+
+        return {
+            "embedding_backends": backends,
+            "chroma_clients": list(self._clients.keys()),
+            "cached_collections": len(self._collections),
+            "exact_indexes": {
+                name: index.size for name, index in list(self._exact_indexes.items()) if index.usable
+            },
+            "query_cache": self._query_cache.stats() if self._query_cache else None,
+            "retrieval_cache": self._retrieval_cache.stats() if self._retrieval_cache else None
+        }
+
+
+# Global instance (lazy initialization)
+_registry: Optional[VectorStoreRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_vector_registry() -> VectorStoreRegistry:
+    """
+    Get or create the process-wide VectorStoreRegistry.
+
+    Returns:
+        VectorStoreRegistry singleton instance.
+
+    Example:
+        >>> from src.vector_store.registry import get_vector_registry
+        >>> embeddings = get_vector_registry().get_embeddings()
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = VectorStoreRegistry()
+    return _registry
+
+
+def close_vector_registry():
+    """Close and drop the process-wide registry (used at shutdown)."""
+    global _registry
+    with _registry_lock:
+        if _registry is not None:
+            _registry.close()
+            _registry = None
@@ -0,0 +1,134 @@
+"""Bounded LRU cache for vector search results, invalidated by collection generation."""
+
+import copy
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RetrievalResultCache:
+    """
+    Cache formatted retrieval results per tenant, query and filter.
+
+    Every key carries the generation of the collection(s) it was read from.
+    Writers bump the generation, so stale entries simply stop matching and
+    age out of the LRU; invalidate() also drops them eagerly.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of result lists kept in memory (0 disables)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, List[Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        collection: str,
+        generation: Any,
+        company_id: Optional[str],
+        region: Optional[str],
+        query: str,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+        **params: Any
+    ) -> Tuple:
+        """
+        Build a cache key.
+
+        Args:
+            collection: Collection name the results come from
+            generation: Collection generation (or tuple of generations)
+            company_id: Tenant the search is scoped to
+            region: Regional collection included in the search, if any
+            query: Query text
+            filter_metadata: Metadata filter applied to the results
+            **params: Other parameters affecting the results (n_results, ...)
+
+        Returns:
+            Hashable key
+        """
+        return (
+            collection,
+            generation,
+            company_id,
+            region,
+            query,
+            json.dumps(filter_metadata, sort_keys=True, default=str),
+            json.dumps(params, sort_keys=True, default=str)
+        )
+
+    def get(self, key: Tuple) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up cached results.
+
+        Returns:
+            A private copy of the cached results, or None on miss
+        """
+        if self.max_entries <= 0:
+            return None
+
+        with self._lock:
+            results = self._entries.get(key)
+            if results is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        # Callers annotate result dicts in place (e.g. weighted_score)
+        return copy.deepcopy(results)
+
+    def put(self, key: Tuple, results: List[Dict[str, Any]]):
+        """Store results under a key."""
+        if self.max_entries <= 0:
+            return
+
+        snapshot = copy.deepcopy(results)
+        with self._lock:
+            self._entries[key] = snapshot
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, collection: str):
+        """Drop every entry read from a collection."""
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == collection]
+            for key in stale:
+                del self._entries[key]
+        if stale:
+            logger.debug(f"Dropped {len(stale)} cached retrievals for {collection}")
+
+    def clear(self):
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hit-rate metrics.
+
+        Returns:
+            Dictionary with hits, misses, hit rate and size
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
@@ -1,12 +1,11 @@
 """Policy retrieval using semantic search."""
 
 import logging
-from typing import List, Dict, Any, Optional
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
-import chromadb
-from chromadb.config import Settings as ChromaSettings
+from typing import List, Dict, Any, Optional, Union
 
 from ..core.config import settings
+from .registry import get_vector_registry
+from .exact_index import matches_where
 
 logger = logging.getLogger(__name__)
 
@@ -23,22 +22,15 @@ class PolicyRetriever:
             company_id: Optional company ID to filter policies by company
         """
         self.company_id = company_id
-        # Initialize embedding model (local or API-based) - same as PolicyEmbeddings
+        # Borrow the shared embedding model and Chroma client - same as PolicyEmbeddings
+        self.registry = get_vector_registry()
         if settings.use_local_embeddings:
-            from .embeddings import LocalEmbeddings
             logger.info("🖥️  Using LOCAL embedding model for retrieval")
-            self.embeddings = LocalEmbeddings(settings.local_embedding_model)
         else:
             logger.info("☁️  Using Gemini API embedding model for retrieval")
-            self.embeddings = GoogleGenerativeAIEmbeddings(
-                model=settings.embedding_model,
-                google_api_key=settings.google_api_key
-            )
-
-        self.chroma_client = chromadb.PersistentClient(
-            path=settings.chroma_db_path,
-            settings=ChromaSettings(anonymized_telemetry=False)
-        )
+        self.embeddings = self.registry.get_embeddings()
+        self.chroma_client = self.registry.get_chroma_client()
+        self.result_cache = self.registry.get_retrieval_cache()
 
         # Determine collection name
         if company_id:
@@ -49,8 +41,8 @@ class PolicyRetriever:
             self.collection_name = settings.chroma_collection_name
 
         try:
-            self.collection = self.chroma_client.get_or_create_collection(
-                name=self.collection_name,
+            self.collection = self.registry.get_collection(
+                self.collection_name,
                 metadata={"hnsw:space": "cosine"}
             )
             logger.info(f"Connected to collection: {self.collection_name}")
@@ -58,6 +50,51 @@ class PolicyRetriever:
             logger.error(f"Failed to get collection: {e}")
             raise
 
+    def embed_query(self, query: str) -> List[float]:
+        """
+        Embed a query, reusing cached embeddings for repeated query strings.
+
+        Args:
+            query: The search query
+
+        Returns:
+            Embedding vector
+        """
+        return self.registry.embed_query(query)
+
+    def _cache_key(
+        self,
+        query: str,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+        region_code: Optional[str] = None,
+        generation: Any = None,
+        **params: Any
+    ):
+        """
+        Build the retrieval cache key for a query against this collection.
+
+        Args:
+            query: Query text
+            filter_metadata: Metadata filter applied to the results
+            region_code: Regional collection included in the search, if any
+            generation: Collection generation(s) (default: this collection's)
+            **params: Other parameters that change the results
+
+        Returns:
+            Hashable cache key
+        """
+        if generation is None:
+            generation = self.registry.collection_generation(self.collection_name)
+        return self.result_cache.make_key(
+            self.collection_name,
+            generation,
+            self.company_id,
+            region_code,
+            query,
+            filter_metadata,
+            **params
+        )
+
     def retrieve_relevant_policies(
         self,
         query: str,
@@ -78,9 +115,15 @@ class PolicyRetriever:
         if n_results is None:
             n_results = settings.retrieval_k
 
+        cache_key = self._cache_key(query, filter_metadata, n_results=n_results)
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Retrieved {len(cached)} relevant policies (cached)")
+            return cached
+
         try:
-            # Generate query embedding
-            query_embedding = self.embeddings.embed_query(query)
+            # Generate query embedding (served from cache for repeated queries)
+            query_embedding = self.embed_query(query)
 
             # Query ChromaDB
             query_params = {
@@ -90,42 +133,15 @@ class PolicyRetriever:
             }
 
             # Build where clause with proper ChromaDB syntax
-            where_clause = None
-
-            # If we have both filter_metadata and company_id, use $and
-            if filter_metadata and self.company_id:
-                conditions = []
-                for key, value in filter_metadata.items():
-                    conditions.append({key: value})
-                conditions.append({"company_id": self.company_id})
-                where_clause = {"$and": conditions}
-            # If only filter_metadata
-            elif filter_metadata:
-                # Single filter
-                if len(filter_metadata) == 1:
-                    where_clause = filter_metadata
-                # Multiple filters
-                else:
-                    conditions = [{k: v} for k, v in filter_metadata.items()]
-                    where_clause = {"$and": conditions}
-            # If only company_id
-            elif self.company_id:
-                where_clause = {"company_id": self.company_id}
-
+            where_clause = self._build_where_clause(filter_metadata)
             if where_clause:
                 query_params["where"] = where_clause
 
-            results = self.collection.query(**query_params)
+            results = self._search(self.collection, **query_params)
 
             # Format results
-            formatted_results = []
-            for i in range(len(results["documents"][0])):
-                formatted_results.append({
-                    "content": results["documents"][0][i],
-                    "metadata": results["metadatas"][0][i],
-                    "similarity_score": 1 - results["distances"][0][i],  # Convert distance to similarity
-                    "distance": results["distances"][0][i]
-                })
+            formatted_results = self._format_query_results(results, 0)
+            self.result_cache.put(cache_key, formatted_results)
 
             logger.info(f"Retrieved {len(formatted_results)} relevant policies")
             return formatted_results
@@ -134,6 +150,202 @@ class PolicyRetriever:
             logger.error(f"Error retrieving policies: {e}")
             raise
 
+    def _search(self, collection, **query_params) -> Dict[str, Any]:
+        """
+        Run a query against the best backend for the collection's size.
+
+        Collections at or below settings.exact_search_max_chunks are served
+        by the in-process exact index; larger ones (or any index failure)
+        go to ChromaDB's HNSW index.
+
+        Args:
+            collection: ChromaDB collection
+            **query_params: collection.query() keyword arguments
+
+        Returns:
+            Response shaped like collection.query()
+        """
+        try:
+            index = self.registry.get_exact_index(collection)
+            if index is not None:
+                return index.query(**query_params)
+        except Exception as e:
+            logger.warning(f"Exact search failed for {collection.name}, using ChromaDB: {e}")
+        return collection.query(**query_params)
+
+    def _build_where_clause(
+        self,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build a ChromaDB where clause from metadata filters and company scope.
+
+        Args:
+            filter_metadata: Optional metadata filters
+
+        Returns:
+            Where clause with proper ChromaDB syntax, or None
+        """
+        # If we have both filter_metadata and company_id, use $and
+        if filter_metadata and self.company_id:
+            conditions = []
+            for key, value in filter_metadata.items():
+                conditions.append({key: value})
+            conditions.append({"company_id": self.company_id})
+            return {"$and": conditions}
+        # If only filter_metadata
+        if filter_metadata:
+            # Single filter
+            if len(filter_metadata) == 1:
+                return filter_metadata
+            # Multiple filters
+            return {"$and": [{k: v} for k, v in filter_metadata.items()]}
+        # If only company_id
+        if self.company_id:
+            return {"company_id": self.company_id}
+        return None
+
+    @staticmethod
+    def _format_query_results(results: Dict[str, Any], index: int) -> List[Dict[str, Any]]:
+        """
+        Format one query's hits from a ChromaDB query response.
+
+        Args:
+            results: Raw collection.query() response
+            index: Position of the query in query_embeddings
+
+        Returns:
+            List of result dicts with content, metadata and scores
+        """
+        formatted_results = []
+        for i in range(len(results["documents"][index])):
+            formatted_results.append({
+                "content": results["documents"][index][i],
+                "metadata": results["metadatas"][index][i],
+                "similarity_score": 1 - results["distances"][index][i],  # Convert distance to similarity
+                "distance": results["distances"][index][i]
+            })
+        return formatted_results
+
+    @staticmethod
+    def _matches_filter(metadata: Dict[str, Any], filter_metadata: Optional[Dict[str, Any]]) -> bool:
+        """
+        Check a result's metadata against a filter after retrieval.
+
+        Accepts the same where syntax as ChromaDB ($and/$or, $eq, $ne, $in, ...).
+
+        Args:
+            metadata: Result metadata
+            filter_metadata: Filter to apply (None matches everything)
+
+        Returns:
+            True if the metadata satisfies every condition
+        """
+        return matches_where(metadata, filter_metadata)
+
+    def retrieve_batch(
+        self,
+        queries: List[str],
+        n_results: Union[int, List[int], None] = None,
+        filters: Optional[List[Optional[Dict[str, Any]]]] = None,
+        fallback_unfiltered: bool = False,
+        overfetch: int = 4
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Retrieve policies for many queries in a single ChromaDB round trip.
+
+        All queries are embedded with one embedding call (cache misses only)
+        and sent as one collection.query(query_embeddings=[...]). Per-query
+        metadata filters are applied to the over-fetched hits afterwards, so
+        differently-filtered queries can share the round trip. If the round
+        trip fails, each query is retried alone; a query that still fails
+        gets an empty list without affecting the others.
+
+        Args:
+            queries: Search queries
+            n_results: Results per query, as one int or a list aligned with queries
+            filters: Optional per-query metadata filters aligned with queries
+            fallback_unfiltered: Use unfiltered hits for a query whose filter matched nothing
+            overfetch: Multiplier on n_results when any filter is present
+
+        Returns:
+            List of result lists aligned with queries
+        """
+        if not queries:
+            return []
+
+        if n_results is None:
+            n_results = settings.retrieval_k
+        n_list = n_results if isinstance(n_results, list) else [n_results] * len(queries)
+        filter_list = filters if filters is not None else [None] * len(queries)
+
+        fetch_k = max(n_list)
+        if any(filter_list):
+            fetch_k *= max(1, overfetch)
+
+        # Serve repeated (query, filter) pairs from the retrieval cache and only
+        # send the misses to ChromaDB
+        generation = self.registry.collection_generation(self.collection_name)
+        cache_keys = [
+            self._cache_key(
+                query,
+                filter_metadata,
+                generation=generation,
+                n_results=n,
+                fetch_k=fetch_k,
+                fallback_unfiltered=fallback_unfiltered
+            )
+            for query, n, filter_metadata in zip(queries, n_list, filter_list)
+        ]
+        batched_results: List[Optional[List[Dict[str, Any]]]] = [
+            self.result_cache.get(key) for key in cache_keys
+        ]
+        missing = [i for i, cached in enumerate(batched_results) if cached is None]
+
+        if not missing:
+            logger.info(f"Retrieved policies for {len(queries)} queries from cache")
+            return batched_results
+
+        query_params = {
+            "n_results": fetch_k,
+            "include": ["documents", "metadatas", "distances"]
+        }
+        where_clause = self._build_where_clause()
+        if where_clause:
+            query_params["where"] = where_clause
+
+        def store_hits(i: int, results: Dict[str, Any], position: int):
+            hits = self._format_query_results(results, position)
+            matched = [hit for hit in hits if self._matches_filter(hit["metadata"], filter_list[i])]
+            if not matched and filter_list[i] and fallback_unfiltered:
+                matched = hits
+            batched_results[i] = matched[:n_list[i]]
+            self.result_cache.put(cache_keys[i], batched_results[i])
+
+        try:
+            query_embeddings = self.registry.embed_queries([queries[i] for i in missing])
+            results = self._search(self.collection, query_embeddings=query_embeddings, **query_params)
+            for position, i in enumerate(missing):
+                store_hits(i, results, position)
+
+        except Exception as e:
+            # Retry each query on its own so one failure doesn't empty every result
+            logger.warning(f"Batch retrieval failed, retrying {len(missing)} queries individually: {e}")
+            for i in missing:
+                try:
+                    query_embeddings = self.registry.embed_queries([queries[i]])
+                    results = self._search(self.collection, query_embeddings=query_embeddings, **query_params)
+                    store_hits(i, results, 0)
+                except Exception as query_error:
+                    logger.error(f"Error retrieving policies for query {i}: {query_error}")
+                    batched_results[i] = []
+
+        logger.info(
+            f"Retrieved {sum(len(r) for r in batched_results)} policies for "
+            f"{len(queries)} queries in one round trip ({len(queries) - len(missing)} cached)"
+        )
+        return batched_results
+
     def retrieve_by_policy_type(
         self,
         query: str,
@@ -198,12 +410,7 @@ class PolicyRetriever:
         all_results = []
         seen_ids = set()
 
-        for query in queries:
-            results = self.retrieve_relevant_policies(
-                query=query,
-                n_results=n_results_per_query
-            )
-
+        for results in self.retrieve_batch(queries, n_results=n_results_per_query):
             for result in results:
                 # Create a unique ID based on content hash
                 content_id = hash(result["content"])
@@ -291,16 +498,31 @@ class PolicyRetriever:
             logger.debug(f"Retrieved {len(global_results)} global policies (no region)")
             return global_results
 
+        regional_collection_name = f"policies_{region_code}"
+        cache_key = self._cache_key(
+            query,
+            region_code=region_code,
+            generation=(
+                self.registry.collection_generation(self.collection_name),
+                self.registry.collection_generation(regional_collection_name)
+            ),
+            n_results=n_results,
+            global_weight=global_weight
+        )
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Query regional collection if available
         try:
-            regional_collection_name = f"policies_{region_code}"
-            regional_collection = self.chroma_client.get_collection(name=regional_collection_name)
+            regional_collection = self.registry.get_collection(regional_collection_name, create=False)
 
-            # Generate query embedding
-            query_embedding = self.embeddings.embed_query(query)
+            # Reuse the embedding computed for the global query (cache hit)
+            query_embedding = self.embed_query(query)
 
             # Query regional collection
-            regional_query_results = regional_collection.query(
+            regional_query_results = self._search(
+                regional_collection,
                 query_embeddings=[query_embedding],
                 n_results=n_results,
                 include=["documents", "metadatas", "distances"]
@@ -319,8 +541,9 @@ class PolicyRetriever:
             logger.debug(f"Retrieved {len(global_results)} global + {len(regional_results)} regional policies")
 
             # Merge and deduplicate
-            merged_results = self._merge_results(global_results, regional_results, global_weight)
-            return merged_results[:n_results]
+            merged_results = self._merge_results(global_results, regional_results, global_weight)[:n_results]
+            self.result_cache.put(cache_key, merged_results)
+            return merged_results
 
         except Exception as e:
             logger.warning(f"Failed to query regional collection for {region_code}: {e}")
@@ -0,0 +1,312 @@
+"""
+Analysis worker - runs queued contract analyses out of the API process.
+
+Usage:
+    python -m src.worker                 # settings.analysis_worker_processes processes
+    python -m src.worker --processes 4
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .core.config import settings
+from .agents.contract_analyzer import ContractAnalyzer
+from .database import SessionLocal, init_db, User as DBUser, AnalysisJob as DBAnalysisJob, JobQueueItem
+from .services.job_events import emit_job_event
+from .services.job_queue import JobQueue
+from .services.result_store import save_job_results
+from .services.status_payload import StatusPayloadStore
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between live progress writes to the database
+PROGRESS_INTERVAL = 1.0
+
+
+def run_contract_analysis(
+    job_id: str,
+    contract_path: str,
+    region_code: Optional[str] = None,
+    report_progress=None
+):
+    """
+    Run contract analysis for a job and persist the results.
+
+    Args:
+        job_id: Job ID
+        contract_path: Path to the contract file
+        region_code: Optional region code for regional knowledge base
+        report_progress: Optional callable(progress dict) for live progress
+    """
+    db = SessionLocal()
+    try:
+        logger.info(f"Running analysis for job: {job_id}")
+
+        # Get job from database
+        db_job = db.query(DBAnalysisJob).filter(DBAnalysisJob.job_id == job_id).first()
+        if not db_job:
+            logger.error(f"Job {job_id} not found in database")
+            return
+
+        db_job.status = "analyzing"
+        db_job.error = None
+        db_job.updated_at = datetime.now()
+        db.commit()
+
+        # Get user for company_id
+        user = db.query(DBUser).filter(DBUser.id == db_job.user_id).first()
+        company_id = user.company_id if user else None
+
+        logger.info(f"Using company-specific policies for company: {company_id}{' region: ' + region_code if region_code else ''}")
+
+        # Initialize analyzer with company_id and region_code
+        analyzer = ContractAnalyzer(company_id=company_id, region_code=region_code)
+
+        # Define output path
+        output_path = Path(settings.output_dir) / f"{job_id}_reviewed.docx"
+
+        # Per-clause progress, surfaced by the status endpoint while analyzing
+        partial_results: Dict[int, Dict[str, Any]] = {}
+        progress_lock = threading.Lock()
+        last_report = [0.0]
+
+        def on_clause(index: int, result: Dict[str, Any], total: int):
+            if report_progress is None:
+                return
+            with progress_lock:
+                partial_results[index] = result
+                now = time.monotonic()
+                if now - last_report[0] < PROGRESS_INTERVAL and len(partial_results) < total:
+                    return
+                last_report[0] = now
+                report_progress({"total_clauses": total, "partial_results": dict(partial_results)})
+
+        # Run analysis (stage events are pushed to clients by the API)
+        results = analyzer.analyze_contract(
+            contract_path=contract_path,
+            output_path=str(output_path),
+            progress_callback=on_clause,
+            event_callback=lambda event, data: emit_job_event(job_id, event, **data)
+        )
+
+        # Update database with results
+        db_job.status = "completed"
+        db_job.updated_at = datetime.now()
+        db_job.output_path = str(output_path)
+        save_job_results(db_job, results)  # Compressed result store + summary columns
+        db.commit()
+
+        # Precompute the status response so polls never reload the results
+        try:
+            StatusPayloadStore(db).save_for_job(db_job, results)
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Failed to precompute status payload for job {job_id}: {e}")
+
+        logger.info(f"Analysis completed and persisted for job: {job_id}")
+
+    finally:
+        db.close()
+
+
+def _mark_job(job_id: str, status: str, error: Optional[str] = None):
+    """Update the status (and error) of an analysis job."""
+    db = SessionLocal()
+    try:
+        db_job = db.query(DBAnalysisJob).filter(DBAnalysisJob.job_id == job_id).first()
+        if db_job:
+            db_job.status = status
+            db_job.error = error
+            db_job.updated_at = datetime.now()
+            db.commit()
+    finally:
+        db.close()
+
+
+class LeaseKeeper(threading.Thread):
+    """Extend a queue lease in the background while its task runs."""
+
+    def __init__(self, token: str):
+        super().__init__(name="lease-keeper", daemon=True)
+        self.token = token
+        self.stopped = threading.Event()
+        self.interval = max(1.0, settings.job_queue_visibility_timeout / 3)
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            db = SessionLocal()
+            try:
+                if not JobQueue(db).extend_lease(self.token):
+                    logger.warning("⚠️ Lost queue lease; another worker may take over this job")
+                    return
+            except Exception as e:
+                logger.error(f"Error extending queue lease: {e}")
+            finally:
+                db.close()
+
+
+def process_item(item: JobQueueItem):
+    """
+    Run one leased queue entry and record its outcome.
+
+    Args:
+        item: Entry returned by JobQueue.claim()
+    """
+    token = item.lease_token
+    payload = json.loads(item.payload or "{}")
+    keeper = LeaseKeeper(token)
+    keeper.start()
+
+    def report_progress(progress: Dict[str, Any]):
+        db = SessionLocal()
+        try:
+            JobQueue(db).set_progress(token, progress)
+        except Exception as e:
+            logger.debug(f"Progress update failed for job {item.job_id}: {e}")
+        finally:
+            db.close()
+
+    emit_job_event(item.job_id, "started", attempt=item.attempts, max_attempts=item.max_attempts)
+
+    try:
+        if item.task != "contract_analysis":
+            raise ValueError(f"Unknown task: {item.task}")
+
+        run_contract_analysis(
+            job_id=item.job_id,
+            contract_path=payload["contract_path"],
+            region_code=payload.get("region_code"),
+            report_progress=report_progress
+        )
+        error = None
+    except Exception as e:
+        logger.error(f"Error in analysis job {item.job_id}: {e}")
+        error = str(e)
+    finally:
+        keeper.stopped.set()
+
+    db = SessionLocal()
+    try:
+        queue = JobQueue(db)
+        if error is None:
+            queue.complete(token)
+            emit_job_event(item.job_id, "completed")
+            return
+        will_retry = queue.fail(token, error)
+    finally:
+        db.close()
+    _mark_job(item.job_id, "queued" if will_retry else "failed", error)
+    emit_job_event(item.job_id, "retrying" if will_retry else "failed", error=error)
+
+
+def worker_loop(worker_id: str, stop_event):
+    """
+    Claim and run queue entries until stop_event is set.
+
+    Args:
+        worker_id: Name of this worker
+        stop_event: Event signalling shutdown (checked between tasks)
+    """
+    logger.info(f"👷 Worker {worker_id} started")
+    while not stop_event.is_set():
+        db = SessionLocal()
+        try:
+            queue = JobQueue(db)
+            for job_id in queue.reap_expired():
+                _mark_job(job_id, "failed", "Analysis worker stopped responding")
+                emit_job_event(job_id, "failed", error="Analysis worker stopped responding")
+            item = queue.claim(worker_id)
+            if item is not None:
+                db.expunge(item)
+        except Exception as e:
+            logger.error(f"Error polling job queue: {e}")
+            item = None
+        finally:
+            db.close()
+
+        if item is None:
+            stop_event.wait(settings.job_queue_poll_interval)
+            continue
+
+        process_item(item)
+
+    logger.info(f"👷 Worker {worker_id} stopped")
+
+
+def _worker_main(index: int, stop_event):
+    """Entry point of a worker process."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(processName)s - %(levelname)s - %(message)s'
+    )
+    # The parent handles signals and sets stop_event; finish the current task
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    worker_loop(f"{socket.gethostname()}:{os.getpid()}:{index}", stop_event)
+
+
+def main():
+    """Start the worker processes and keep them running until stopped."""
+    parser = argparse.ArgumentParser(description="Run contract analysis workers")
+    parser.add_argument(
+        "-p", "--processes",
+        type=int,
+        default=settings.analysis_worker_processes,
+        help="Number of worker processes"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(processName)s - %(levelname)s - %(message)s'
+    )
+    init_db()
+
+    # Spawned processes open their own database connections
+    context = multiprocessing.get_context("spawn")
+    stop_event = context.Event()
+
+    def stop(signum, frame):
+        logger.info("🛑 Stopping workers (running analyses will finish first)...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    def start(index: int):
+        process = context.Process(
+            target=_worker_main,
+            args=(index, stop_event),
+            name=f"analysis-worker-{index}"
+        )
+        process.start()
+        return process
+
+    processes = [start(index) for index in range(max(1, args.processes))]
+    logger.info(f"🚀 Started {len(processes)} analysis worker processes")
+
+    # Restart workers that die unexpectedly; their leases expire and are retried
+    while not stop_event.is_set():
+        for index, process in enumerate(processes):
+            if not process.is_alive() and not stop_event.is_set():
+                logger.warning(f"⚠️ {process.name} exited with code {process.exitcode}; restarting")
+                processes[index] = start(index)
+        stop_event.wait(5)
+
+    for process in processes:
+        process.join()
+    logger.info("✅ All analysis workers stopped")
+
+
+if __name__ == "__main__":
+    main()